@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+
+"""
+Adaptive control of the DAB operators.
+
+Provides:
+
+- OperatorBandit: improvement rates of the candidate operators (employed,
+  onlooker, scout) and probability matching between the selectable ones
+- adapt_rate: the 1/5th success rule, used for mutation strengths
+
+A long campaign goes through phases where different operators pay off;
+rather than fixing the candidate mix and the mutation rates in [Bees],
+the driver shifts evaluations towards the operators that currently
+produce improvements.
+"""
+
+from __future__ import annotations
+
+import random
+from collections.abc import Sequence
+
+OPERATORS = ("employed", "onlooker", "scout")
+
+
+def adapt_rate(
+    value: float,
+    success_rate: float,
+    low: float,
+    high: float,
+    target: float = 0.2,
+    factor: float = 1.2,
+) -> float:
+    """
+    Return value multiplied by factor if success_rate is above target and
+    divided by it otherwise, within [low, high] (the 1/5th success rule:
+    successful operators take larger steps, failing ones smaller).
+    """
+    value = value * factor if success_rate > target else value / factor
+    return min(high, max(low, value))
+
+
+class OperatorBandit:
+    """
+    Improvement rate of every operator, as an exponential moving average
+    (weight decay) of its rewards: 1 when a result improved the food source
+    it was credited to, 0 otherwise.
+
+    Candidates are allocated between the selectable operators by probability
+    matching: each one gets p_min, and the rest is shared in proportion to
+    the rates. p_min keeps every operator sampled, so a recovering operator
+    is noticed.
+    """
+
+    def __init__(
+        self,
+        selectable: Sequence[str],
+        p_min: float = 0.1,
+        decay: float = 0.05,
+        seed: int | None = None,
+    ) -> None:
+        if not selectable:
+            raise ValueError("At least one selectable operator is needed")
+        if not 0.0 <= p_min * len(selectable) <= 1.0:
+            raise ValueError(f"pMin must be in [0, 1/{len(selectable)}], got {p_min}")
+        if not 0.0 < decay <= 1.0:
+            raise ValueError(f"decay must be in (0, 1], got {decay}")
+        self.selectable = list(selectable)
+        self.p_min = p_min
+        self.decay = decay
+        self.rates = dict.fromkeys(OPERATORS, 0.0)
+        self.results = dict.fromkeys(OPERATORS, 0)
+        self.improvements = dict.fromkeys(OPERATORS, 0)
+        self._random = random.Random(seed)
+
+    def update(self, operator: str, improved: bool) -> None:
+        if operator not in self.rates:
+            return
+        self.results[operator] += 1
+        self.improvements[operator] += int(improved)
+        # The first results replace the neutral starting rate faster
+        weight = max(self.decay, 1.0 / self.results[operator])
+        self.rates[operator] += weight * (float(improved) - self.rates[operator])
+
+    def probabilities(self) -> dict[str, float]:
+        """Return the share of candidates of every selectable operator."""
+        rates = [self.rates[operator] for operator in self.selectable]
+        total = sum(rates)
+        n = len(self.selectable)
+        if total <= 0.0:
+            return dict.fromkeys(self.selectable, 1.0 / n)
+        free = 1.0 - self.p_min * n
+        return {
+            operator: self.p_min + free * rate / total
+            for operator, rate in zip(self.selectable, rates, strict=True)
+        }
+
+    def choose(self) -> str:
+        """Draw a selectable operator with its current probability."""
+        draw = self._random.random()
+        for operator, probability in self.probabilities().items():
+            draw -= probability
+            if draw < 0.0:
+                return operator
+        return self.selectable[-1]
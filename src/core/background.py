@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+
+"""
+Background writers.
+
+Provides:
+
+- LatestOnlyWriter: writes submitted snapshots from a daemon thread,
+  keeping only the most recent one pending
+
+Checkpoints and run status snapshots are both written this way, so a slow
+file system never delays the scheduling loop.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable
+from typing import Any
+
+
+class LatestOnlyWriter:
+    """
+    Calls write_fn on submitted snapshots from a background thread.
+
+    Only the most recent snapshot is kept: if a new one is submitted while
+    the previous one is still being written, the older pending snapshot is
+    replaced. ``close`` writes whatever is pending before returning.
+    """
+
+    def __init__(
+        self,
+        write_fn: Callable[[Any], None],
+        name: str = "writer",
+        logger=None,
+        error_message: str = "Error writing snapshot",
+    ) -> None:
+        """
+        Start the writer thread.
+
+        Args:
+            write_fn: Writes one snapshot.
+            name: Name of the thread.
+            logger: Logger used to report write errors.
+            error_message: Message logged with the exception of a failed
+                write.
+        """
+        self._write_fn = write_fn
+        self._logger = logger
+        self._errorMessage = error_message
+        self._pending: Any = None
+        self._closed = False
+        self._condition = threading.Condition()
+        self.written = 0
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def submit(self, snapshot: Any) -> None:
+        """Queue ``snapshot`` to be written, replacing any pending one."""
+        with self._condition:
+            self._pending = snapshot
+            self._condition.notify()
+
+    def close(self) -> None:
+        """Write the pending snapshot, if any, and stop the thread."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+        self._thread.join()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while self._pending is None and not self._closed:
+                    self._condition.wait()
+                snapshot, self._pending = self._pending, None
+                closed = self._closed
+            if snapshot is not None:
+                try:
+                    self._write_fn(snapshot)
+                    self.written += 1
+                except Exception:
+                    if self._logger is not None:
+                        self._logger.exception(self._errorMessage)
+            if closed and snapshot is None:
+                return
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+
+"""
+Solver checkpoints.
+
+Provides:
+
+- Atomic, versioned checkpoint files
+- A background writer that keeps checkpointing off the critical path
+
+A checkpoint file starts with a fixed header (magic string and format
+version) followed by the pickled solver state. Files are written to a
+temporary name and renamed, so a crash while writing never leaves a
+truncated checkpoint behind.
+"""
+
+from __future__ import annotations
+
+import os
+import pickle
+import struct
+from pathlib import Path
+from typing import Any
+
+from core.background import LatestOnlyWriter
+
+CHECKPOINT_MAGIC = b"DABCKPT\0"
+CHECKPOINT_VERSION = 1
+
+_HEADER = struct.Struct("<8sI")
+
+
+def write_checkpoint(path: str, state: dict[str, Any]) -> None:
+    """
+    Atomically write ``state`` to ``path``.
+
+    Args:
+        path: Checkpoint file.
+        state: Picklable solver state.
+    """
+    target = Path(path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    payload = pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL)
+
+    tmp = target.with_name(f".{target.name}.tmp")
+    with open(tmp, "wb") as file:
+        file.write(_HEADER.pack(CHECKPOINT_MAGIC, CHECKPOINT_VERSION))
+        file.write(payload)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(tmp, target)
+
+
+def read_checkpoint(path: str) -> dict[str, Any]:
+    """
+    Read a checkpoint written by ``write_checkpoint``.
+
+    Args:
+        path: Checkpoint file.
+
+    Returns:
+        The solver state.
+
+    Raises:
+        ValueError: If the file is not a checkpoint or has another version.
+    """
+    with open(path, "rb") as file:
+        header = file.read(_HEADER.size)
+        if len(header) != _HEADER.size:
+            raise ValueError(f"Truncated checkpoint file: {path}")
+        magic, version = _HEADER.unpack(header)
+        if magic != CHECKPOINT_MAGIC:
+            raise ValueError(f"Not a checkpoint file: {path}")
+        if version != CHECKPOINT_VERSION:
+            raise ValueError(
+                f"Unsupported checkpoint version {version} "
+                f"(expected {CHECKPOINT_VERSION}): {path}"
+            )
+        return pickle.load(file)
+
+
+class CheckpointWriter(LatestOnlyWriter):
+    """
+    Writes checkpoints from a background thread.
+
+    Only the most recent state is kept: if a new state is submitted while
+    the previous one is still being written, the older pending state is
+    replaced. ``close`` writes whatever is pending before returning.
+    """
+
+    def __init__(self, path: str, logger=None) -> None:
+        """
+        Start the writer thread.
+
+        Args:
+            path: Checkpoint file.
+            logger: Logger used to report write errors.
+        """
+        self._path = path
+        super().__init__(
+            lambda state: write_checkpoint(path, state),
+            "checkpoint-writer",
+            logger,
+            f"Checkpoint. Error writing {path}",
+        )
+
+    @property
+    def path(self) -> str:
+        return self._path
@@ -54,6 +54,7 @@ class Tags(IntEnum):
     REQSENDINPUT = 4
     REQINPUT = 5
     ENDSIM = 6
+    TERMINATE = 7
 
 
 class ObjectiveType(IntEnum):
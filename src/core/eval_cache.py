@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+
+"""
+Persistent evaluation cache.
+
+Provides:
+
+- Content-addressed keys for evaluated configurations
+- A SQLite-backed store of values, status and output artifacts
+
+Keys are built from the quantized parameter vector (see core.lattice)
+plus a context hash (input template, problem flags), so results can be reused across runs
+as long as nothing that affects the evaluation has changed.
+"""
+
+from __future__ import annotations
+
+import configparser
+import hashlib
+import json
+import math
+import shutil
+import sqlite3
+import time
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+
+# Status values stored with each entry
+STATUS_OK = "ok"
+STATUS_FAILED = "failed"
+
+
+@dataclass(frozen=True)
+class CacheEntry:
+    key: str
+    value: float
+    status: str
+    artifacts: list[str] = field(default_factory=list)
+    # Objective values of multi-objective runs, by objective name
+    objectives: dict[str, float] | None = None
+
+    @property
+    def is_valid(self) -> bool:
+        return self.status == STATUS_OK
+
+
+def build_context(
+    input_file: str,
+    config_file: str,
+    sections: Iterable[str] = ("Fusion",),
+    extra: Iterable[str] = (),
+) -> str:
+    """
+    Hash everything, besides the parameters, that affects an evaluation.
+
+    Args:
+        input_file: Input template (parameter schema) path.
+        config_file: INI configuration file path.
+        sections: INI sections whose options change the evaluation.
+        extra: Additional strings (problem type, mock flag, ...).
+
+    Returns:
+        Hex digest identifying the evaluation context.
+    """
+    digest = hashlib.sha256()
+
+    input_path = Path(input_file)
+    if input_path.is_file():
+        digest.update(input_path.read_bytes())
+
+    config = configparser.ConfigParser()
+    config.read(config_file)
+    for section in sections:
+        if config.has_section(section):
+            for option, value in sorted(config.items(section)):
+                digest.update(f"{section}.{option}={value}\n".encode())
+
+    for item in extra:
+        digest.update(f"{item}\n".encode())
+
+    return digest.hexdigest()
+
+
+class EvaluationCache:
+    """
+    Content-addressed store of evaluation results.
+
+    Backed by a single SQLite file so it survives restarts and can be
+    shared by consecutive campaigns. Only the driver accesses it.
+    """
+
+    SCHEMA_VERSION = 2
+
+    def __init__(
+        self,
+        path: str,
+        context: str,
+        artifacts_dir: str | None = None,
+    ) -> None:
+        """
+        Open (or create) a cache file.
+
+        Args:
+            path: SQLite file.
+            context: Context hash returned by ``build_context``.
+            artifacts_dir: Directory used to keep output files.
+                If None, artifacts are not stored.
+        """
+        self._path = Path(path)
+        self._context = context
+        self._artifacts_dir = Path(artifacts_dir) if artifacts_dir else None
+        self.hits = 0
+        self.misses = 0
+
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self._path), isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS evaluations ("
+            "key TEXT PRIMARY KEY, "
+            "value REAL, "
+            "status TEXT NOT NULL, "
+            "artifacts TEXT NOT NULL DEFAULT '[]', "
+            "objectives TEXT, "
+            "created REAL NOT NULL)"
+        )
+        columns = {
+            row[1] for row in self._conn.execute("PRAGMA table_info(evaluations)")
+        }
+        if "objectives" not in columns:
+            # Caches of version 1 have no objective vectors
+            self._conn.execute("ALTER TABLE evaluations ADD COLUMN objectives TEXT")
+        self._conn.execute(f"PRAGMA user_version={self.SCHEMA_VERSION}")
+
+        if self._artifacts_dir is not None:
+            self._artifacts_dir.mkdir(parents=True, exist_ok=True)
+
+    @property
+    def stores_artifacts(self) -> bool:
+        return self._artifacts_dir is not None
+
+    def key(self, quantized: Sequence[int | str]) -> str:
+        """Return the cache key of a quantized parameter vector."""
+        digest = hashlib.sha256(self._context.encode())
+        digest.update(json.dumps(list(quantized), separators=(",", ":")).encode())
+        return digest.hexdigest()
+
+    def get(self, key: str) -> CacheEntry | None:
+        """Return the entry stored under ``key``, or None."""
+        row = self._conn.execute(
+            "SELECT value, status, artifacts, objectives FROM evaluations "
+            "WHERE key = ?",
+            (key,),
+        ).fetchone()
+
+        if row is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        value = math.nan if row[0] is None else float(row[0])
+        objectives = None if row[3] is None else json.loads(row[3])
+        return CacheEntry(key, value, row[1], json.loads(row[2]), objectives)
+
+    def put(
+        self,
+        key: str,
+        value: float,
+        status: str,
+        artifacts: Iterable[tuple[str, str]] = (),
+        objectives: dict[str, float] | None = None,
+    ) -> None:
+        """
+        Store an evaluation result.
+
+        Args:
+            key: Cache key.
+            value: Objective value (non-finite values are stored as NULL).
+            status: ``STATUS_OK`` or ``STATUS_FAILED``.
+            artifacts: ``(source_path, name)`` pairs copied into the
+                artifacts directory. Ignored if artifacts are disabled.
+            objectives: Objective values by name, for multi-objective runs.
+        """
+        stored: list[str] = []
+
+        if self._artifacts_dir is not None:
+            entry_dir = self._artifacts_dir / key
+            for source, name in artifacts:
+                if not Path(source).is_file():
+                    continue
+                entry_dir.mkdir(parents=True, exist_ok=True)
+                shutil.copyfile(source, entry_dir / name)
+                stored.append(str(entry_dir / name))
+
+        value = float(value)
+        self._conn.execute(
+            "INSERT OR REPLACE INTO evaluations "
+            "(key, value, status, artifacts, objectives, created) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                key,
+                value if math.isfinite(value) else None,
+                status,
+                json.dumps(stored),
+                None if objectives is None else json.dumps(objectives),
+                time.time(),
+            ),
+        )
+
+    def __len__(self) -> int:
+        return int(self._conn.execute("SELECT COUNT(*) FROM evaluations").fetchone()[0])
+
+    def close(self) -> None:
+        self._conn.close()
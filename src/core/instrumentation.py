@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+
+"""
+Lightweight timing instrumentation.
+
+Provides:
+
+- Monotonic-clock spans with per-name count, total, min, max and a
+  logarithmic histogram
+- Plain counters
+- Per-process summaries and their aggregation into a run report
+- Process resource usage (CPU time and peak memory)
+
+Instrumentation is disabled by default; a disabled span costs a single
+attribute check, so spans can stay in the hot paths.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import resource
+import threading
+import time
+from collections.abc import Iterable
+from contextlib import nullcontext
+from pathlib import Path
+from typing import Any
+
+# Histogram buckets are powers of two of HISTOGRAM_BASE seconds
+HISTOGRAM_BASE = 1e-6
+HISTOGRAM_BUCKETS = 48
+
+
+class _SpanStats:
+    __slots__ = ("buckets", "count", "max", "min", "total")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+        self.buckets = [0] * HISTOGRAM_BUCKETS
+
+    def add(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        self.min = min(self.min, seconds)
+        self.max = max(self.max, seconds)
+        if seconds <= HISTOGRAM_BASE:
+            bucket = 0
+        else:
+            bucket = min(
+                HISTOGRAM_BUCKETS - 1, math.ceil(math.log2(seconds / HISTOGRAM_BASE))
+            )
+        self.buckets[bucket] += 1
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "total": self.total,
+            "min": self.min if self.count else 0.0,
+            "max": self.max,
+            "mean": self.total / self.count if self.count else 0.0,
+            "histogram": {
+                f"{HISTOGRAM_BASE * 2**i:.3g}": n
+                for i, n in enumerate(self.buckets)
+                if n
+            },
+        }
+
+
+class _Span:
+    __slots__ = ("_name", "_owner", "_start")
+
+    def __init__(self, owner: Instrumentation, name: str) -> None:
+        self._owner = owner
+        self._name = name
+        self._start = 0.0
+
+    def __enter__(self) -> None:
+        self._start = time.perf_counter()
+
+    def __exit__(self, *exc_info) -> None:
+        self._owner.record(self._name, time.perf_counter() - self._start)
+
+
+_NULL_SPAN = nullcontext()
+
+
+class Instrumentation:
+    """
+    Collects spans and counters for one process.
+    """
+
+    def __init__(self, enabled: bool = False) -> None:
+        self.enabled = enabled
+        self._spans: dict[str, _SpanStats] = {}
+        self._counters: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def span(self, name: str):
+        """Return a context manager timing the enclosed block as ``name``."""
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, name)
+
+    def record(self, name: str, seconds: float) -> None:
+        """Add a measured duration to ``name``."""
+        if not self.enabled:
+            return
+        with self._lock:
+            stats = self._spans.get(name)
+            if stats is None:
+                stats = self._spans[name] = _SpanStats()
+            stats.add(seconds)
+
+    def count(self, name: str, n: int = 1) -> None:
+        """Increase counter ``name`` by ``n``."""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + n
+
+    def summary(self) -> dict[str, Any]:
+        """Return a JSON-serializable summary of everything recorded."""
+        with self._lock:
+            return {
+                "spans": {
+                    name: stats.summary() for name, stats in sorted(self._spans.items())
+                },
+                "counters": dict(sorted(self._counters.items())),
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._spans.clear()
+            self._counters.clear()
+
+
+def process_resources() -> dict[str, float]:
+    """
+    Return the CPU time (seconds) and peak resident memory (KiB, as
+    reported by ``getrusage`` on Linux) used so far by this process.
+    """
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    return {
+        "cpu_seconds": usage.ru_utime + usage.ru_stime,
+        "max_rss_kb": usage.ru_maxrss,
+    }
+
+
+def merge_summaries(summaries: Iterable[dict[str, Any]]) -> dict[str, Any]:
+    """
+    Aggregate the summaries of several processes.
+
+    Args:
+        summaries: Values returned by ``Instrumentation.summary``.
+
+    Returns:
+        A summary with the same layout covering all processes.
+    """
+    spans: dict[str, dict[str, Any]] = {}
+    counters: dict[str, int] = {}
+
+    for summary in summaries:
+        for name, value in summary.get("counters", {}).items():
+            counters[name] = counters.get(name, 0) + value
+        for name, stats in summary.get("spans", {}).items():
+            merged = spans.get(name)
+            if merged is None:
+                spans[name] = {**stats, "histogram": dict(stats["histogram"])}
+                continue
+            merged["min"] = min(merged["min"], stats["min"])
+            merged["max"] = max(merged["max"], stats["max"])
+            merged["count"] += stats["count"]
+            merged["total"] += stats["total"]
+            for bucket, n in stats["histogram"].items():
+                merged["histogram"][bucket] = merged["histogram"].get(bucket, 0) + n
+
+    for stats in spans.values():
+        stats["mean"] = stats["total"] / stats["count"] if stats["count"] else 0.0
+
+    return {
+        "spans": dict(sorted(spans.items())),
+        "counters": dict(sorted(counters.items())),
+    }
+
+
+def write_report(path: str, summaries: list[dict[str, Any]]) -> None:
+    """
+    Write the per-run performance report.
+
+    Args:
+        path: JSON output file.
+        summaries: One summary per rank, indexed by rank.
+    """
+    report = {
+        "total": merge_summaries(summaries),
+        "ranks": {str(rank): summary for rank, summary in enumerate(summaries)},
+    }
+    Path(path).write_text(json.dumps(report, indent=2, sort_keys=True))
+
+
+_instrumentation = Instrumentation()
+
+
+def get_instrumentation() -> Instrumentation:
+    """Return the instrumentation of this process."""
+    return _instrumentation
+
+
+def span(name: str):
+    """Shortcut for ``get_instrumentation().span(name)``."""
+    return _instrumentation.span(name)
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+
+"""
+Integer lattice of discretized parameters.
+
+Provides:
+
+- is_discrete, bin_count, bin_index, bin_value: the lattice of one parameter
+- random_bin_value, neighbour_value: lattice moves used by the bees
+- Lattice: encoding of whole parameter vectors as compact integer arrays
+
+A numeric parameter with finite bounds and a positive gap is discrete: its
+values are min_value + k * gap for the bins k in [0, bin_count). Candidates
+keep their physical values, which the problems, queues and worker buffers
+use, but mutations, cache keys and probability matrix cells of discrete
+parameters are computed on bin indices. Two values in the same bin give the
+same key and cell, values are always rebuilt from their bin, and a gap of 0
+or None never reaches a division.
+"""
+
+from __future__ import annotations
+
+import math
+import random
+from collections.abc import Iterable, Sequence
+
+import numpy as np
+
+from data.Parameter import ParamType
+
+# Tolerance on bin boundaries, relative to the gap
+EPSILON = 1e-9
+
+# Number of significant digits kept in the keys of parameters without a gap
+FLOAT_DIGITS = 7
+
+
+def is_discrete(param) -> bool:
+    """Return whether param takes its values on a lattice."""
+    if not param.is_numeric() or not param.gap:
+        return False
+    return math.isfinite(float(param.min_value)) and math.isfinite(
+        float(param.max_value)
+    )
+
+
+def _lower(param) -> float:
+    return min(float(param.min_value), float(param.max_value))
+
+
+def bin_count(param) -> int:
+    """Return the number of bins of a discrete parameter."""
+    width = abs(float(param.max_value) - float(param.min_value))
+    return math.floor(width / abs(param.gap) + EPSILON) + 1
+
+
+def bin_index(param, value) -> int:
+    """Return the bin of value, clipped to the bounds of param."""
+    index = round((float(value) - _lower(param)) / abs(param.gap))
+    return min(max(index, 0), bin_count(param) - 1)
+
+
+def bin_value(param, index: int):
+    """Return the physical value of bin index of param."""
+    value = _lower(param) + index * abs(param.gap)
+    return round(value) if param.type is ParamType.INT else value
+
+
+def random_bin_value(param, low: float, high: float, rng=random):
+    """Return the value of a random bin of param within [low, high]."""
+    origin = _lower(param)
+    gap = abs(param.gap)
+    first = max(0, math.ceil((min(low, high) - origin) / gap - EPSILON))
+    last = min(
+        bin_count(param) - 1, math.floor((max(low, high) - origin) / gap + EPSILON)
+    )
+    if first > last:
+        return bin_value(param, bin_index(param, (low + high) / 2.0))
+    return bin_value(param, rng.randint(first, last))
+
+
+def neighbour_value(param, value, radius: int, rng=random, move: bool = False):
+    """
+    Return the value of a random bin at most radius bins away from the bin
+    of value. With move, the bin of value itself is excluded when possible.
+    """
+    index = bin_index(param, value)
+    first = max(0, index - radius)
+    last = min(bin_count(param) - 1, index + radius)
+    if move and last > first:
+        choice = rng.randint(first, last - 1)
+        return bin_value(param, choice + (choice >= index))
+    return bin_value(param, rng.randint(first, last))
+
+
+class Lattice:
+    """
+    Bin indices of a parameter vector, as an int16 array (int32 when a
+    parameter has more bins than int16 holds). Entries of parameters that
+    are not discrete are 0 and their values are kept as they are.
+    """
+
+    def __init__(self, parameters: Sequence) -> None:
+        self.discrete = np.array([is_discrete(p) for p in parameters], dtype=bool)
+        self.origins = np.array(
+            [_lower(p) if d else 0.0 for p, d in zip(parameters, self.discrete)],
+            dtype=np.float64,
+        )
+        self.gaps = np.array(
+            [abs(p.gap) if d else 1.0 for p, d in zip(parameters, self.discrete)],
+            dtype=np.float64,
+        )
+        self.bins = np.array(
+            [bin_count(p) if d else 1 for p, d in zip(parameters, self.discrete)],
+            dtype=np.int64,
+        )
+        self.integer = np.array(
+            [p.type is ParamType.INT for p in parameters], dtype=bool
+        )
+        self.dtype = (
+            np.int16 if self.max_bins <= np.iinfo(np.int16).max + 1 else np.int32
+        )
+
+    @property
+    def size(self) -> int:
+        return len(self.discrete)
+
+    @property
+    def max_bins(self) -> int:
+        return int(self.bins.max(initial=1))
+
+    def encode(self, values: Iterable[float]) -> np.ndarray:
+        """Return the bin index of every parameter value."""
+        values = np.asarray(list(values), dtype=np.float64)
+        if values.shape != (self.size,):
+            raise ValueError(f"Expected {self.size} values, got {values.shape}")
+        codes = np.rint((values - self.origins) / self.gaps)
+        codes = np.clip(np.nan_to_num(codes), 0, self.bins - 1)
+        codes[~self.discrete] = 0
+        return codes.astype(self.dtype)
+
+    def key(self, values: Iterable[float]) -> tuple[int | str, ...]:
+        """
+        Return a hashable representation of a parameter vector, used for
+        the evaluation cache keys: the bin of every discrete parameter and
+        the rest rounded to FLOAT_DIGITS significant digits, which matches
+        the single precision buffers exchanged with the workers.
+        """
+        values = list(values)
+        codes = self.encode(values)
+        return tuple(
+            int(code) if discrete else f"{float(value):.{FLOAT_DIGITS}g}"
+            for code, value, discrete in zip(codes, values, self.discrete)
+        )
@@ -1,10 +1,27 @@
 #!/usr/bin/env python3
 
+"""
+Logging configuration.
+
+Provides:
+
+- The dabmpi logger: rotating log file, colored console output, MPI rank
+  and the custom BEST level
+- Per-rank log files written by a background thread
+- Rate-limited logging for per-evaluation events in the hot paths
+- An optional JSON-lines event log written by a background thread
+"""
+
 from __future__ import annotations
 
+import atexit
+import json
 import logging
-from logging.handlers import RotatingFileHandler
+import time
+from collections.abc import Callable
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
+from queue import SimpleQueue
 from typing import Any
 
 
@@ -105,6 +122,68 @@ class ColoredFormatter(logging.Formatter):
             record.levelname = original
 
 
+def rank_log_path(
+    log_path: Path,
+    rank: int,
+) -> Path:
+    """Return the log file of rank: the driver keeps log_path."""
+
+    if rank == 0:
+        return log_path
+
+    return log_path.with_name(f"{log_path.stem}.{rank}{log_path.suffix}")
+
+
+class BufferedRotatingFileHandler(RotatingFileHandler):
+    """
+    Rotating file handler that flushes at most every flush_interval seconds.
+
+    Records are written to the buffered file stream as they arrive; the
+    stream is flushed when flush_interval has passed since the previous
+    flush, on warnings and errors, and when the handler is closed.
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        flush_interval: float = 5.0,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.flush_interval = flush_interval
+        self._last_flush = time.monotonic()
+        self._force_flush = False
+
+    def emit(
+        self,
+        record: logging.LogRecord,
+    ) -> None:
+        self._force_flush = record.levelno >= logging.WARNING
+        super().emit(record)
+
+    def flush(self) -> None:
+        now = time.monotonic()
+
+        if self._force_flush or now - self._last_flush >= self.flush_interval:
+            super().flush()
+            self._last_flush = now
+
+    def close(self) -> None:
+        self._force_flush = True
+        super().close()
+
+
+def stop_listener(
+    listener: QueueListener,
+) -> None:
+    """Write the queued records and close the handlers of listener."""
+
+    listener.stop()
+
+    for handler in listener.handlers:
+        handler.close()
+
+
 class LoggerConfig:
     """Logger configuration with sensible defaults."""
 
@@ -124,8 +203,17 @@ class LoggerConfig:
         console_level: int | None = None,
         file_level: int | None = None,
         rank: int = 0,
+        per_rank: bool = False,
     ) -> logging.Logger:
-        """Create and configure a logger."""
+        """
+        Create and configure a logger.
+
+        By default every rank appends to log_file, which rank 0 rotates on
+        startup. With per_rank, each rank writes its own file (the driver
+        log_file, rank r log_file with .r before the suffix) through a
+        queue and a background thread, so ranks never share a file and
+        logging never waits for the filesystem.
+        """
 
         _register_custom_levels()
 
@@ -172,13 +260,21 @@ class LoggerConfig:
                 parents=True,
                 exist_ok=True,
             )
-            if rank == 0:  # Only do this on rank 0 to avoid conflicts
+
+            if per_rank:
+                log_path = rank_log_path(log_path, rank)
+
+            if rank == 0 or per_rank:  # Only one rank rotates each file
                 rotate_on_startup(
                     log_path,
                     cls.MAX_LOG_FILES,
                 )
 
-            file_handler = RotatingFileHandler(
+            handler_class = (
+                BufferedRotatingFileHandler if per_rank else RotatingFileHandler
+            )
+
+            file_handler = handler_class(
                 filename=log_path,
                 maxBytes=cls.MAX_LOG_SIZE,
                 backupCount=cls.MAX_LOG_FILES,
@@ -189,7 +285,27 @@ class LoggerConfig:
             file_handler.setLevel(file_level)
             file_handler.setFormatter(formatter)
 
-            logger.addHandler(file_handler)
+            if per_rank:
+                #
+                # The listener thread writes the file, the queued records
+                # are written before the logging module closes its handlers
+                #
+                queue: SimpleQueue = SimpleQueue()
+                queue_handler = QueueHandler(queue)
+                queue_handler.setLevel(file_level)
+
+                listener = QueueListener(
+                    queue,
+                    file_handler,
+                    respect_handler_level=True,
+                )
+                listener.start()
+                atexit.register(stop_listener, listener)
+                queue_handler.listener = listener
+
+                logger.addHandler(queue_handler)
+            else:
+                logger.addHandler(file_handler)
 
         #
         # Console handler
@@ -214,6 +330,25 @@ def get_logger(
     return logging.getLogger(name)
 
 
+def close_logger(
+    logger: logging.Logger,
+) -> None:
+    """
+    Write the queued records and close the handlers of logger, for a process
+    about to end without running its exit handlers (MPI Abort).
+    """
+
+    for handler in list(logger.handlers):
+        listener = getattr(handler, "listener", None)
+
+        if listener is not None:
+            atexit.unregister(stop_listener)
+            stop_listener(listener)
+
+        handler.close()
+        logger.removeHandler(handler)
+
+
 class MPIRankFilter(logging.Filter):
     """Inject MPI rank into log records."""
 
@@ -230,3 +365,166 @@ class MPIRankFilter(logging.Filter):
     ) -> bool:
         record.rank = self.rank if self.rank is not None else -1
         return True
+
+
+class RateLimitedLogger:
+    """
+    Logs per-evaluation events at most once per key every interval seconds.
+
+    The level is checked before anything else, so a disabled level costs a
+    single method call, and the arguments are only formatted when the record
+    is emitted. The next emitted message of a key reports how many were
+    suppressed since the previous one. An interval of 0 logs every message.
+    """
+
+    def __init__(
+        self,
+        logger: logging.Logger,
+        interval: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.logger = logger
+        self.interval = interval
+        self._clock = clock
+        self._last: dict[str, float] = {}
+        self._suppressed: dict[str, int] = {}
+
+    def log(
+        self,
+        level: int,
+        key: str,
+        message: str,
+        *args: Any,
+    ) -> None:
+        if not self.logger.isEnabledFor(level):
+            return
+
+        if self.interval > 0.0:
+            now = self._clock()
+            last = self._last.get(key)
+
+            if last is not None and now - last < self.interval:
+                self._suppressed[key] = self._suppressed.get(key, 0) + 1
+                return
+
+            self._last[key] = now
+
+        suppressed = self._suppressed.pop(key, 0)
+
+        if suppressed:
+            message += " (%d similar messages suppressed)"
+            args = (*args, suppressed)
+
+        self.logger.log(level, message, *args)
+
+    def debug(
+        self,
+        key: str,
+        message: str,
+        *args: Any,
+    ) -> None:
+        self.log(logging.DEBUG, key, message, *args)
+
+    def info(
+        self,
+        key: str,
+        message: str,
+        *args: Any,
+    ) -> None:
+        self.log(logging.INFO, key, message, *args)
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """Format event records as one JSON object per line."""
+
+    def format(
+        self,
+        record: logging.LogRecord,
+    ) -> str:
+        event = {
+            "time": round(record.created, 6),
+            "rank": getattr(record, "rank", -1),
+            "event": record.getMessage(),
+        }
+        event.update(getattr(record, "fields", {}))
+
+        return json.dumps(event, default=str)
+
+
+class EventLog:
+    """
+    Optional JSON-lines log of run events (results, new best values, ...).
+
+    Events go through a QueueHandler and are written to the file by a
+    QueueListener thread, so emitting one costs the caller a queue put.
+    Emitting on a log that was not started returns immediately.
+    """
+
+    def __init__(
+        self,
+        name: str = "dabmpi.events",
+    ) -> None:
+        self._logger = logging.getLogger(name)
+        self._logger.propagate = False
+        self._logger.setLevel(logging.INFO)
+        self._listener: QueueListener | None = None
+
+    @property
+    def enabled(self) -> bool:
+        return self._listener is not None
+
+    def start(
+        self,
+        path: str,
+        rank: int = 0,
+    ) -> None:
+        """Start writing events to path, replacing its contents."""
+
+        self.close()
+
+        queue: SimpleQueue = SimpleQueue()
+
+        file_handler = logging.FileHandler(
+            path,
+            mode="w",
+            encoding="utf-8",
+            delay=True,
+        )
+        file_handler.setFormatter(JsonLinesFormatter())
+
+        handler = QueueHandler(queue)
+        handler.addFilter(MPIRankFilter(rank))
+
+        self._logger.handlers = [handler]
+        self._listener = QueueListener(queue, file_handler)
+        self._listener.start()
+
+    def emit(
+        self,
+        event: str,
+        **fields: Any,
+    ) -> None:
+        if self._listener is None:
+            return
+
+        self._logger.info(event, extra={"fields": fields})
+
+    def close(self) -> None:
+        """Write the queued events and close the file."""
+
+        if self._listener is None:
+            return
+
+        stop_listener(self._listener)
+
+        self._logger.handlers = []
+        self._listener = None
+
+
+_EVENT_LOG = EventLog()
+
+
+def get_event_log() -> EventLog:
+    """Return the event log of this process."""
+
+    return _EVENT_LOG
@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+
+"""
+Synthetic evaluations for mock mode.
+
+Provides:
+
+- Analytic objectives (sphere, Rosenbrock, Rastrigin) over the parameters
+  of any solution type
+- Evaluation durations drawn from a configurable distribution
+- Random failures and hung evaluations
+
+Mock runs skip the external codes; with a cost model they still take
+production-like time and fail at production-like rates, so the driver
+scheduling, timeouts and drain can be exercised on a workstation.
+"""
+
+from __future__ import annotations
+
+import configparser
+import math
+import random
+import time
+from collections.abc import Callable, Sequence
+
+DISTRIBUTIONS = ("fixed", "uniform", "exponential", "lognormal")
+
+# Search domain of each analytic objective, parameters are mapped onto it
+OBJECTIVE_DOMAINS: dict[str, tuple[float, float]] = {
+    "sphere": (-1.0, 1.0),
+    "rosenbrock": (-2.048, 2.048),
+    "rastrigin": (-5.12, 5.12),
+}
+OBJECTIVES = ("random", *OBJECTIVE_DOMAINS)
+
+
+def sphere(x: Sequence[float]) -> float:
+    return sum(xi * xi for xi in x)
+
+
+def rosenbrock(x: Sequence[float]) -> float:
+    return sum(
+        100.0 * (x[i + 1] - x[i] ** 2) ** 2 + (1.0 - x[i]) ** 2
+        for i in range(len(x) - 1)
+    )
+
+
+def rastrigin(x: Sequence[float]) -> float:
+    return 10.0 * len(x) + sum(xi * xi - 10.0 * math.cos(2 * math.pi * xi) for xi in x)
+
+
+OBJECTIVE_FUNCTIONS: dict[str, Callable[[Sequence[float]], float]] = {
+    "sphere": sphere,
+    "rosenbrock": rosenbrock,
+    "rastrigin": rastrigin,
+}
+
+
+class MockCostModel:
+    """
+    Evaluates solutions in mock mode.
+
+    Every evaluation sleeps for a duration drawn from ``distribution`` with
+    mean ``duration`` seconds. With probability ``failure_probability`` it
+    fails after a random fraction of that time, and with probability
+    ``timeout_probability`` it hangs for ``timeout`` seconds before failing.
+    Successful evaluations return the analytic ``objective`` of the
+    solution, or a random value within ``random_range`` for ``random``.
+
+    Objective values are reported as ``1 + f / n`` (``n`` the number of
+    numeric parameters) when minimizing and ``1 / (1 + f / n)`` when
+    maximizing, which keeps them positive and within the range the solvers
+    accept as valid.
+    """
+
+    def __init__(
+        self,
+        objective: str = "random",
+        distribution: str = "fixed",
+        duration: float = 0.0,
+        sigma: float = 1.0,
+        failure_probability: float = 0.0,
+        timeout_probability: float = 0.0,
+        timeout: float = 3600.0,
+        maximize: bool = False,
+        seed: int | None = None,
+        sleep: Callable[[float], None] = time.sleep,
+        random_range: tuple[float, float] = (0.0, 1.0),
+    ) -> None:
+        if objective not in OBJECTIVES:
+            raise ValueError(f"Unknown mock objective: {objective}")
+        if distribution not in DISTRIBUTIONS:
+            raise ValueError(f"Unknown mock duration distribution: {distribution}")
+        if duration < 0.0 or timeout < 0.0:
+            raise ValueError("Mock durations must be >= 0")
+        if not 0.0 <= failure_probability + timeout_probability <= 1.0:
+            raise ValueError("Mock failure probabilities must add up to at most 1")
+
+        self.objective = objective
+        self.distribution = distribution
+        self.duration = duration
+        self.sigma = sigma
+        self.failure_probability = failure_probability
+        self.timeout_probability = timeout_probability
+        self.timeout = timeout
+        self.maximize = maximize
+        self.random_range = random_range
+        self._random = random.Random(seed)
+        self._sleep = sleep
+
+    @staticmethod
+    def configured(cfile: str) -> bool:
+        """Return whether a configuration file has a ``[Mock]`` section."""
+        config = configparser.ConfigParser()
+        config.read(cfile)
+        return config.has_section("Mock")
+
+    @classmethod
+    def from_config(
+        cls,
+        cfile: str,
+        maximize: bool = False,
+        rank: int = 0,
+        random_range: tuple[float, float] = (0.0, 1.0),
+    ) -> MockCostModel:
+        """
+        Build the model from the ``[Mock]`` section of a configuration file.
+
+        Args:
+            cfile: INI configuration file.
+            maximize: Whether the optimization maximizes the objective.
+            rank: MPI rank, added to the seed so workers draw different
+                durations and failures.
+            random_range: Range of the values of the ``random`` objective.
+        """
+        config = configparser.ConfigParser()
+        config.read(cfile)
+        section = "Mock"
+        seed = config.getint(section, "seed", fallback=None)
+        return cls(
+            objective=config.get(section, "objective", fallback="random").lower(),
+            distribution=config.get(section, "distribution", fallback="fixed").lower(),
+            duration=config.getfloat(section, "duration", fallback=0.0),
+            sigma=config.getfloat(section, "sigma", fallback=1.0),
+            failure_probability=config.getfloat(
+                section, "failureProbability", fallback=0.0
+            ),
+            timeout_probability=config.getfloat(
+                section, "timeoutProbability", fallback=0.0
+            ),
+            timeout=config.getfloat(section, "timeout", fallback=3600.0),
+            maximize=maximize,
+            seed=None if seed is None else seed + rank,
+            random_range=random_range,
+        )
+
+    @property
+    def failure_value(self) -> float:
+        return -math.inf if self.maximize else math.inf
+
+    def draw_duration(self) -> float:
+        """Return the duration of one successful evaluation, in seconds."""
+        mean = self.duration
+        if mean <= 0.0:
+            return 0.0
+        if self.distribution == "uniform":
+            return self._random.uniform(0.0, 2.0 * mean)
+        if self.distribution == "exponential":
+            return self._random.expovariate(1.0 / mean)
+        if self.distribution == "lognormal":
+            # mu chosen so that the mean of the distribution is duration
+            mu = math.log(mean) - self.sigma**2 / 2.0
+            return self._random.lognormvariate(mu, self.sigma)
+        return mean
+
+    def objective_value(self, parameters) -> float:
+        """
+        Return the reported objective value of a parameter list.
+
+        Each numeric parameter with finite bounds is mapped linearly from
+        its range onto the domain of the objective.
+        """
+        if self.objective == "random":
+            return self._random.uniform(*self.random_range)
+
+        x = self._domain_point(parameters)
+        if not x:
+            return self.failure_value
+        return self._report(
+            OBJECTIVE_FUNCTIONS[self.objective](x) / len(x), self.maximize
+        )
+
+    def objective_vector(self, parameters, maximize: Sequence[bool]) -> list[float]:
+        """
+        Return one value per objective of a multi-objective run, reported in
+        the sense given by maximize. Objective k is the analytic objective
+        shifted to a point (k + 1) / (m + 1) of the way along every axis of
+        its domain, so the m objectives conflict and their Pareto front joins
+        those points.
+        """
+        if self.objective == "random":
+            return [self._random.uniform(0.0, 1.0) for _ in maximize]
+
+        x = self._domain_point(parameters)
+        if not x:
+            return [math.nan] * len(maximize)
+        low, high = OBJECTIVE_DOMAINS[self.objective]
+        function = OBJECTIVE_FUNCTIONS[self.objective]
+        values = []
+        for k, sense in enumerate(maximize):
+            shift = (high - low) * (k + 1) / (len(maximize) + 1)
+            f = function([xi - low - shift for xi in x]) / len(x)
+            values.append(self._report(f, sense))
+        return values
+
+    def _domain_point(self, parameters) -> list[float]:
+        # Each numeric parameter with finite bounds, mapped onto the domain
+        low, high = OBJECTIVE_DOMAINS[self.objective]
+        x = []
+        for param in parameters:
+            if not param.is_numeric():
+                continue
+            lower, upper = float(param.min_value), float(param.max_value)
+            if not (math.isfinite(lower) and math.isfinite(upper)) or upper <= lower:
+                continue
+            u = (float(param.value) - lower) / (upper - lower)
+            x.append(low + u * (high - low))
+        return x
+
+    @staticmethod
+    def _report(f: float, maximize: bool) -> float:
+        return 1.0 / (1.0 + f) if maximize else 1.0 + f
+
+    def evaluate(self, solution) -> float:
+        """Simulate the evaluation of solution and return its value."""
+        draw = self._random.random()
+        if draw < self.timeout_probability:
+            self._sleep(self.timeout)
+            return self.failure_value
+        if draw < self.timeout_probability + self.failure_probability:
+            self._sleep(self._random.random() * self.draw_duration())
+            return self.failure_value
+
+        self._sleep(self.draw_duration())
+        return self.objective_value(solution.get_parameters())
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+
+"""
+Pareto archive for multi-objective runs.
+
+Provides:
+
+- dominates: Pareto dominance between two objective vectors
+- crowding_distances: NSGA-II crowding distance of a set of vectors
+- ParetoArchive: a bounded set of non-dominated solutions, with selection
+  of the least crowded ones
+
+Objectives are stored as minimized values (maximized ones are negated), so
+dominance and crowding do not depend on the sense of each objective.
+"""
+
+from __future__ import annotations
+
+import json
+import random
+from collections.abc import Sequence
+
+import numpy as np
+
+from core.status import write_atomic
+
+
+def dominates(a: Sequence[float], b: Sequence[float]) -> bool:
+    """Return whether minimized vector a dominates b."""
+    a = np.asarray(a, dtype=np.float64)
+    b = np.asarray(b, dtype=np.float64)
+    return bool(np.all(a <= b) and np.any(a < b))
+
+
+def crowding_distances(points: np.ndarray) -> np.ndarray:
+    """
+    Return the crowding distance of every row of points (n x m).
+
+    Boundary points of every objective get an infinite distance; the others
+    the sum over objectives of the normalized gap between their neighbours.
+    """
+    n, m = points.shape
+    distances = np.zeros(n)
+    if n <= 2:
+        distances[:] = np.inf
+        return distances
+    for k in range(m):
+        order = np.argsort(points[:, k], kind="stable")
+        column = points[order, k]
+        distances[order[0]] = distances[order[-1]] = np.inf
+        span = column[-1] - column[0]
+        if span > 0.0:
+            distances[order[1:-1]] += (column[2:] - column[:-2]) / span
+    return distances
+
+
+class ParetoArchive:
+    """
+    Non-dominated solutions found so far, at most max_size of them.
+
+    A new solution is rejected if a member dominates or equals it; otherwise
+    the members it dominates are removed. Both checks are vectorized over
+    the archive. When the archive is full, the member with the smallest
+    crowding distance is dropped, which keeps the front evenly covered.
+    """
+
+    def __init__(
+        self,
+        names: Sequence[str],
+        maximize: Sequence[bool],
+        max_size: int = 100,
+        seed: int | None = None,
+    ) -> None:
+        if len(names) != len(maximize):
+            raise ValueError("One sense is needed per objective")
+        self.names = list(names)
+        self.max_size = max(2, int(max_size))
+        self._signs = np.where(np.asarray(maximize, dtype=bool), -1.0, 1.0)
+        self._points = np.empty((0, len(self.names)))
+        self._parameters: list[list[float]] = []
+        self._origins: list[int] = []
+        self._random = random.Random(seed)
+
+    def __len__(self) -> int:
+        return len(self._parameters)
+
+    def insert(self, parameters, objectives, origin: int = -1) -> bool:
+        """
+        Add a solution with the given objective values (in their own sense).
+        Returns whether it entered the archive.
+        """
+        point = self._signs * np.asarray(objectives, dtype=np.float64)
+        if point.shape != (len(self.names),) or not np.all(np.isfinite(point)):
+            return False
+        if len(self) and np.any(np.all(self._points <= point, axis=1)):
+            return False
+
+        keep = ~(
+            np.all(point <= self._points, axis=1) & np.any(point < self._points, axis=1)
+        )
+        self._points = np.vstack([self._points[keep], point])
+        self._parameters = [p for p, k in zip(self._parameters, keep) if k]
+        self._origins = [o for o, k in zip(self._origins, keep) if k]
+        self._parameters.append([float(v) for v in parameters])
+        self._origins.append(int(origin))
+
+        if len(self) > self.max_size:
+            self._remove(int(np.argmin(crowding_distances(self._points))))
+        return True
+
+    def _remove(self, index: int) -> None:
+        self._points = np.delete(self._points, index, axis=0)
+        del self._parameters[index]
+        del self._origins[index]
+
+    def select(self) -> tuple[list[float], list[float], int]:
+        """
+        Return (parameters, objectives, origin) of a member chosen by binary
+        tournament on crowding distance: of two random members, the one in
+        the less crowded region of the front.
+        """
+        if not len(self):
+            raise IndexError("The Pareto archive is empty")
+        distances = crowding_distances(self._points)
+        first = self._random.randrange(len(self))
+        second = self._random.randrange(len(self))
+        index = second if distances[second] > distances[first] else first
+        return (
+            list(self._parameters[index]),
+            list(self._signs * self._points[index]),
+            self._origins[index],
+        )
+
+    def entries(self) -> list[dict]:
+        """Return the members, ordered by their first objective."""
+        order = np.argsort(self._points[:, 0], kind="stable") if len(self) else []
+        return [
+            {
+                "objectives": dict(
+                    zip(self.names, map(float, self._signs * self._points[i]))
+                ),
+                "parameters": self._parameters[i],
+                "origin": self._origins[i],
+            }
+            for i in order
+        ]
+
+    def write(self, path: str) -> None:
+        write_atomic(path, json.dumps({"front": self.entries()}, indent=2))
+
+    def get_state(self) -> dict:
+        return {
+            "names": list(self.names),
+            "points": self._points.copy(),
+            "parameters": [list(p) for p in self._parameters],
+            "origins": list(self._origins),
+        }
+
+    def set_state(self, state: dict) -> None:
+        if list(state["names"]) != self.names:
+            raise ValueError("Checkpoint does not match the Pareto objectives")
+        self._points = np.asarray(state["points"], dtype=np.float64).reshape(
+            -1, len(self.names)
+        )
+        self._parameters = [list(p) for p in state["parameters"]]
+        self._origins = list(state["origins"])
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+
+"""
+Lazy registries of solvers, problems and solutions.
+
+Provides:
+
+- resolve: import a "module:attribute" reference
+- LazyRegistry: a mapping that imports each entry on first lookup
+- The registries used by the driver, the workers and the queues
+- Discovery of problems published by other packages through entry points
+
+Entries are references rather than classes so that a run only imports the
+modules of the solver and problem it uses: VMECProcess, YAML and XML
+parsing, the other solver... are never loaded for problems that do not
+need them, which shortens the startup of every rank.
+
+A package adds a problem by declaring entry points with the same name in
+the ``dabmpi.problems`` (ProblemBase subclass) and ``dabmpi.solutions``
+(SolutionBase subclass) groups, and optionally ``dabmpi.readers`` (a
+function that parses the input file once for broadcast_schema)::
+
+    [project.entry-points."dabmpi.problems"]
+    SPHERE = "fastobjectives.sphere:SphereProblem"
+
+    [project.entry-points."dabmpi.solutions"]
+    SPHERE = "fastobjectives.sphere:SphereSolution"
+
+The name is the value of ``-p``; plugin problems are identified by their
+name wherever built-in ones use ProblemType and SolutionType.
+"""
+
+from __future__ import annotations
+
+import importlib
+from collections.abc import Hashable, Iterator, Mapping
+from typing import Any
+
+from core.enums import ProblemType, SolutionType, SolverType
+
+# A reference, or a tuple of references resolved to a tuple
+Reference = str | tuple[str, ...]
+
+PROBLEM_ENTRY_POINTS = "dabmpi.problems"
+SOLUTION_ENTRY_POINTS = "dabmpi.solutions"
+READER_ENTRY_POINTS = "dabmpi.readers"
+
+
+def resolve(reference: str) -> Any:
+    """
+    Import and return the object named by reference.
+
+    Args:
+        reference: "package.module:attribute", where attribute may be
+            dotted (e.g. "data.VMECData:VMECData.read_schema").
+    """
+    module_name, _, attribute = reference.partition(":")
+    obj: Any = importlib.import_module(module_name)
+    for name in filter(None, attribute.split(".")):
+        obj = getattr(obj, name)
+    return obj
+
+
+class LazyRegistry(Mapping):
+    """Mapping whose values are imported on first lookup, see register."""
+
+    def __init__(self, references: Mapping[Hashable, Reference]) -> None:
+        self._references = dict(references)
+        self._resolved: dict[Hashable, Any] = {}
+
+    def __getitem__(self, key: Hashable) -> Any:
+        if key not in self._resolved:
+            reference = self._references[key]
+            if isinstance(reference, tuple):
+                self._resolved[key] = tuple(resolve(r) for r in reference)
+            else:
+                self._resolved[key] = resolve(reference)
+        return self._resolved[key]
+
+    def __contains__(self, key: object) -> bool:
+        # Checking membership must not import the entry
+        return key in self._references
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(self._references)
+
+    def __len__(self) -> int:
+        return len(self._references)
+
+    def reference(self, key: Hashable) -> Reference:
+        return self._references[key]
+
+    def register(self, key: Hashable, reference: Reference) -> None:
+        """Add an entry; registering the same reference again is a no-op."""
+        if self._references.get(key, reference) != reference:
+            raise ValueError(f"{key} is already registered as {self._references[key]}")
+        self._references[key] = reference
+
+    def copy(self) -> LazyRegistry:
+        return LazyRegistry(self._references)
+
+
+SOLVER_REGISTRY = LazyRegistry(
+    {
+        SolverType.DAB: "solvers.SolverDAB:SolverDAB",
+        SolverType.SA: "solvers.SolverSA:SolverSA",
+    }
+)
+
+# Problem type -> (problem class, solution class)
+PROBLEM_TYPE_REGISTRY = LazyRegistry(
+    {
+        ProblemType.FUSION: (
+            "problems.ProblemFusion:ProblemFusion",
+            "solution.SolutionFusion:SolutionFusion",
+        ),
+        ProblemType.NONSEPARABLE: (
+            "problems.ProblemNonSeparable:ProblemNonSeparable",
+            "solution.SolutionNonSeparable:SolutionNonSeparable",
+        ),
+        ProblemType.CRISTINA: (
+            "problems.ProblemCristina:ProblemCristina",
+            "solution.SolutionCristina:SolutionCristina",
+        ),
+    }
+)
+
+SOLUTION_TYPE_REGISTRY = LazyRegistry(
+    {
+        SolutionType.FUSION: "solution.SolutionFusion:SolutionFusion",
+        SolutionType.CRISTINA: "solution.SolutionCristina:SolutionCristina",
+        SolutionType.NONSEPARABLE: "solution.SolutionNonSeparable:SolutionNonSeparable",
+    }
+)
+
+# Parses the input file of a problem type once, see core.schema
+SCHEMA_READER_REGISTRY = LazyRegistry(
+    {
+        ProblemType.FUSION: "data.VMECData:VMECData.read_schema",
+        ProblemType.NONSEPARABLE: "data.NonSeparableData:NonSeparableData.read_entries",
+    }
+)
+
+
+def type_name(problem_type: Any) -> str:
+    """Return the name of a built-in (enum) or plugin (str) problem type."""
+    return getattr(problem_type, "name", str(problem_type))
+
+
+def type_key(problem_type: Any) -> int | str:
+    """Return the enum value of a built-in problem type, the name of a plugin."""
+    return problem_type if isinstance(problem_type, str) else int(problem_type)
+
+
+def load_plugins() -> list[str]:
+    """
+    Register the problems published through entry points and return their
+    names.
+
+    Only the entry point metadata is read; a plugin module is imported when
+    its problem is looked up. Problems without a matching solution entry
+    point, and names of built-in problems, are ignored.
+    """
+    # importlib.metadata is slow to import, runs of built-in problems skip it
+    from importlib.metadata import entry_points
+
+    builtin = {problem_type.name for problem_type in ProblemType}
+    solutions = {ep.name: ep.value for ep in entry_points(group=SOLUTION_ENTRY_POINTS)}
+    readers = {ep.name: ep.value for ep in entry_points(group=READER_ENTRY_POINTS)}
+
+    names = []
+    for ep in entry_points(group=PROBLEM_ENTRY_POINTS):
+        if ep.name in builtin or ep.name not in solutions:
+            continue
+        PROBLEM_TYPE_REGISTRY.register(ep.name, (ep.value, solutions[ep.name]))
+        SOLUTION_TYPE_REGISTRY.register(ep.name, solutions[ep.name])
+        if ep.name in readers:
+            SCHEMA_READER_REGISTRY.register(ep.name, readers[ep.name])
+        names.append(ep.name)
+    return sorted(names)
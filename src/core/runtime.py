@@ -27,13 +27,20 @@ class GlobalRuntime:
     iterations: int = field(default=10)
     objective: e.ObjectiveType = field(default=e.ObjectiveType.MINIMIZE)
     comm_model: e.CommModelType = field(default=e.CommModelType.DRIVERWORKER)
-    problem_type: e.ProblemType = field(default=e.ProblemType.FUSION)
-    solution_type: e.SolutionType = field(default=e.SolutionType.FUSION)
+    # Plugin problems (core.registry) use their name as problem and solution type
+    problem_type: e.ProblemType | str = field(default=e.ProblemType.FUSION)
+    solution_type: e.SolutionType | str = field(default=e.SolutionType.FUSION)
     solver_type: e.SolverType = field(default=e.SolverType.DAB)
     # Logger instance
     logger: Logger = field(default_factory=lambda: get_logger())
     max_valid_solution_value: float = field(default=1e6)
     mock: bool = field(default=False)  # For testing without actual problem execution
+    resume: bool = field(default=False)  # Continue from the solver checkpoint
+    performance_report: str = field(default="performance.json")
+    # Minimum seconds between two sampled per-evaluation log messages
+    log_sample_interval: float = field(default=1.0)
+    # Directory of the parsed input file cache (empty: disabled)
+    schema_cache: str = field(default="")
 
     def __post_init__(self) -> None:
         """Validate configuration after initialization."""
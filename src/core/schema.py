@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+
+"""
+Input file loading shared by all ranks.
+
+Provides:
+
+- A per-process registry, so every data object built from the input file
+  reuses one parsed copy
+- An optional on-disk cache of parsed input files keyed by their SHA-256
+- Broadcast of the parsed input from rank 0 to the other ranks
+
+Parsing the FUSION input takes a noticeable fraction of a second per rank
+(seconds without the LibYAML loader) and every rank reading it at once
+loads the shared filesystem. With broadcast_schema only rank 0 reads the
+file, or its cached copy, and the other ranks receive it over MPI.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+# Bump when a reader changes the structure it returns
+SCHEMA_CACHE_VERSION = 1
+
+Reader = Callable[[str], Any]
+
+_SCHEMAS: dict[tuple[str, str], Any] = {}
+
+
+def resolve_input(path: str) -> str:
+    """Return path, or ../path when path does not exist (run from a subdirectory)."""
+    if not os.path.exists(path):
+        return os.path.join("..", path)
+    return path
+
+
+def file_digest(path: str) -> str:
+    """Return the SHA-256 of the contents of path."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for block in iter(lambda: file.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _reader_name(reader: Reader) -> str:
+    name = getattr(reader, "__qualname__", type(reader).__qualname__)
+    return f"{reader.__module__}.{name}"
+
+
+def cached_read(path: str, reader: Reader, cache_dir: str) -> Any:
+    """
+    Return reader(path), reusing a pickled copy from cache_dir.
+
+    The cache key covers the file contents, the reader and
+    SCHEMA_CACHE_VERSION, so edited inputs are parsed again. Unreadable
+    cache files are ignored and rewritten.
+    """
+    name = _reader_name(reader).replace(".", "-")
+    cache_file = (
+        Path(cache_dir) / f"{name}-{file_digest(path)}-v{SCHEMA_CACHE_VERSION}.pickle"
+    )
+    try:
+        with open(cache_file, "rb") as file:
+            return pickle.load(file)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+        pass
+
+    schema = reader(path)
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    tmp = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+    with open(tmp, "wb") as file:
+        pickle.dump(schema, file, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp, cache_file)
+    return schema
+
+
+def load_schema(path: str, reader: Reader, cache_dir: str | None = None) -> Any:
+    """
+    Return the parsed contents of an input file.
+
+    The first call for a (path, reader) pair parses the file, through the
+    on-disk cache when cache_dir is given; later calls, and calls after
+    broadcast_schema, return the same object, which callers must not
+    modify.
+    """
+    key = (_reader_name(reader), path)
+    if key not in _SCHEMAS:
+        resolved = resolve_input(path)
+        _SCHEMAS[key] = (
+            cached_read(resolved, reader, cache_dir) if cache_dir else reader(resolved)
+        )
+    return _SCHEMAS[key]
+
+
+def broadcast_schema(
+    comm, path: str, reader: Reader, cache_dir: str | None = None
+) -> Any:
+    """
+    Parse an input file on rank 0 and broadcast it to every rank of comm.
+
+    Collective: every rank must call it. An error on rank 0 is raised on
+    all ranks instead of leaving them waiting.
+    """
+    payload = None
+    failure = None
+    if comm.Get_rank() == 0:
+        try:
+            payload = (load_schema(path, reader, cache_dir), None)
+        # Any reader error has to reach the other ranks, which would otherwise
+        # wait forever in bcast
+        except Exception as e:  # noqa: BLE001
+            failure = e
+            payload = (None, f"{type(e).__name__}: {e}")
+    schema, error = comm.bcast(payload, root=0)
+    if error is not None:
+        raise RuntimeError(f"Cannot read input file {path}: {error}") from failure
+    _SCHEMAS[(_reader_name(reader), path)] = schema
+    return schema
+
+
+def clear_schemas() -> None:
+    """Forget the parsed input files of this process."""
+    _SCHEMAS.clear()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+
+"""
+Run status snapshots.
+
+Provides:
+
+- Atomic JSON status files
+- Prometheus text exposition of the numeric status fields
+- A background writer that keeps status updates off the critical path
+
+The Prometheus output follows the text format read by the textfile
+collector of node_exporter, so pointing ``prometheusFile`` at its
+directory publishes the run metrics without running an HTTP server.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import os
+from pathlib import Path
+from typing import Any
+
+from core.background import LatestOnlyWriter
+
+PROMETHEUS_PREFIX = "dabmpi"
+
+
+def write_atomic(path: str, text: str) -> None:
+    """
+    Replace the contents of ``path`` with ``text`` in a single rename.
+
+    Readers polling the file see either the previous or the new contents,
+    never a partially written file.
+    """
+    target = Path(path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp = target.with_name(f".{target.name}.tmp")
+    tmp.write_text(text, encoding="utf-8")
+    os.replace(tmp, target)
+
+
+def _number(value: Any) -> str:
+    value = float(value)
+    if math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(value)
+
+
+def _escape(label: str) -> str:
+    return str(label).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def format_prometheus(status: dict[str, Any], prefix: str = PROMETHEUS_PREFIX) -> str:
+    """
+    Format a status snapshot as Prometheus text.
+
+    Scalar numbers become gauges named ``<prefix>_<key>``; dictionaries of
+    numbers become one gauge labelled by key (``queue``, ``state`` or
+    ``reason``). Other fields (the best value trajectory, strings) are only
+    published in the JSON status.
+
+    Args:
+        status: Snapshot returned by ``SolverDAB.get_status``.
+        prefix: Metric name prefix.
+
+    Returns:
+        The metrics, one per line.
+    """
+    labels = {"queues": "queue", "workers": "state", "failures": "reason"}
+    lines = []
+    for key, value in status.items():
+        name = f"{prefix}_{key}"
+        if isinstance(value, bool):
+            lines += [f"# TYPE {name} gauge", f"{name} {int(value)}"]
+        elif isinstance(value, int | float):
+            lines += [f"# TYPE {name} gauge", f"{name} {_number(value)}"]
+        elif key in labels and isinstance(value, dict):
+            lines.append(f"# TYPE {name} gauge")
+            for label, number in value.items():
+                lines.append(
+                    f'{name}{{{labels[key]}="{_escape(label)}"}} {_number(number)}'
+                )
+    return "\n".join(lines) + "\n"
+
+
+class StatusWriter(LatestOnlyWriter):
+    """
+    Writes status snapshots from a background thread.
+
+    As with checkpoints, only the most recent snapshot is kept: a snapshot
+    submitted while the previous one is being written replaces any pending
+    one, so a slow file system never delays the scheduling loop.
+    """
+
+    def __init__(
+        self, path: str, prometheus_path: str | None = None, logger=None
+    ) -> None:
+        """
+        Start the writer thread.
+
+        Args:
+            path: JSON status file.
+            prometheus_path: Optional Prometheus text file.
+            logger: Logger used to report write errors.
+        """
+        self._path = path
+        self._prometheusPath = prometheus_path
+        super().__init__(
+            self.write, "status-writer", logger, f"Status. Error writing {path}"
+        )
+
+    def write(self, status: dict[str, Any]) -> None:
+        write_atomic(self._path, json.dumps(status, indent=2))
+        if self._prometheusPath:
+            write_atomic(self._prometheusPath, format_prometheus(status))
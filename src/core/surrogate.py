@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+
+"""
+Surrogate models used to pre-screen candidate solutions.
+
+Provides:
+
+- Random Fourier features ridge regression, trained incrementally
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Sequence
+
+import numpy as np
+
+
+class RandomFeaturesRidge:
+    """
+    Ridge regression on random Fourier features (RBF kernel approximation).
+
+    Inputs are scaled to the unit box defined by ``lower``/``upper``
+    before being projected, so ``length_scale`` is relative to the
+    parameter ranges. Training only accumulates the normal equations,
+    which makes each update O(features^2) regardless of the number of
+    samples seen.
+    """
+
+    def __init__(
+        self,
+        lower: Sequence[float],
+        upper: Sequence[float],
+        n_features: int = 256,
+        length_scale: float = 0.2,
+        alpha: float = 1e-3,
+        seed: int | None = None,
+    ) -> None:
+        """
+        Initialize the model.
+
+        Args:
+            lower: Lower bound of each input.
+            upper: Upper bound of each input.
+            n_features: Number of random features.
+            length_scale: RBF length scale in normalized units.
+            alpha: Ridge regularization.
+            seed: Seed of the random projection.
+        """
+        if n_features <= 0:
+            raise ValueError(f"n_features must be positive, got {n_features}")
+        if length_scale <= 0.0:
+            raise ValueError(f"length_scale must be positive, got {length_scale}")
+
+        lower_arr = np.asarray(lower, dtype=np.float64)
+        upper_arr = np.asarray(upper, dtype=np.float64)
+        if lower_arr.shape != upper_arr.shape:
+            raise ValueError("lower and upper must have the same length")
+
+        # Unbounded inputs are used as they are
+        finite = np.isfinite(lower_arr) & np.isfinite(upper_arr)
+        span = np.where(finite, upper_arr - lower_arr, 1.0)
+        self._offset = np.where(finite, lower_arr, 0.0)
+        self._scale = np.where(span > 0.0, span, 1.0)
+
+        rng = np.random.default_rng(seed)
+        n_inputs = lower_arr.shape[0]
+        self._weights_in = rng.normal(
+            0.0, 1.0 / length_scale, size=(n_inputs, n_features)
+        )
+        self._phase = rng.uniform(0.0, 2.0 * math.pi, size=n_features)
+        self._norm = math.sqrt(2.0 / n_features)
+
+        self._gram = alpha * np.eye(n_features + 1)
+        self._moment = np.zeros(n_features + 1)
+        self._coef: np.ndarray | None = None
+        self._n_samples = 0
+
+    @property
+    def n_samples(self) -> int:
+        return self._n_samples
+
+    def _features(self, x: np.ndarray) -> np.ndarray:
+        x = np.atleast_2d(np.asarray(x, dtype=np.float64))
+        scaled = (x - self._offset) / self._scale
+        projected = np.cos(scaled @ self._weights_in + self._phase) * self._norm
+        # Bias column so the model does not need centred targets
+        return np.hstack([projected, np.ones((projected.shape[0], 1))])
+
+    def update(self, x, y) -> None:
+        """
+        Add samples to the model.
+
+        Args:
+            x: Inputs, shape (n_inputs,) or (k, n_inputs).
+            y: Targets, scalar or shape (k,).
+        """
+        phi = self._features(x)
+        target = np.atleast_1d(np.asarray(y, dtype=np.float64))
+        self._gram += phi.T @ phi
+        self._moment += phi.T @ target
+        self._n_samples += phi.shape[0]
+        self._coef = None
+
+    def predict(self, x) -> np.ndarray:
+        """
+        Predict targets.
+
+        Args:
+            x: Inputs, shape (n_inputs,) or (k, n_inputs).
+
+        Returns:
+            Predictions, shape (k,).
+        """
+        if self._coef is None:
+            self._coef = np.linalg.solve(self._gram, self._moment)
+        return self._features(x) @ self._coef
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+
+"""
+Archive of converged equilibria used to warm-start new evaluations.
+
+Provides:
+
+- A bounded, per-worker store of output files keyed by parameter vector
+- Nearest-neighbour lookup in the normalized parameter space
+"""
+
+from __future__ import annotations
+
+import math
+import shutil
+from collections import OrderedDict
+from collections.abc import Sequence
+from pathlib import Path
+
+import numpy as np
+
+
+class WarmStartArchive:
+    """
+    Keeps the output of the most recent converged evaluations.
+
+    Each entry is a copy of an output file (e.g. the VMEC wout file)
+    together with the parameter vector that produced it. Distances are
+    measured after scaling every parameter to its range, so parameters
+    with large values do not dominate the lookup. When the archive is
+    full the least recently used entry is dropped.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        lower: Sequence[float],
+        upper: Sequence[float],
+        capacity: int = 16,
+        max_distance: float = math.inf,
+    ) -> None:
+        """
+        Create an empty archive.
+
+        Args:
+            directory: Where the copies of the output files are kept.
+            lower: Lower bound of each parameter.
+            upper: Upper bound of each parameter.
+            capacity: Maximum number of entries.
+            max_distance: Largest normalized (RMS) distance at which an
+                entry is still used as a starting point.
+        """
+        if capacity <= 0:
+            raise ValueError(f"capacity must be positive, got {capacity}")
+
+        lower_arr = np.asarray(lower, dtype=np.float64)
+        upper_arr = np.asarray(upper, dtype=np.float64)
+        if lower_arr.shape != upper_arr.shape:
+            raise ValueError("lower and upper must have the same length")
+
+        span = upper_arr - lower_arr
+        self._scale = np.where(np.isfinite(span) & (span > 0.0), span, 1.0)
+        self._directory = Path(directory)
+        self._capacity = capacity
+        self._max_distance = max_distance
+        self._entries: OrderedDict[str, tuple[np.ndarray, Path]] = OrderedDict()
+        self._counter = 0
+        self.hits = 0
+        self.misses = 0
+
+        # Files left by a previous run are not indexed, start clean
+        if self._directory.exists():
+            shutil.rmtree(self._directory, ignore_errors=True)
+        self._directory.mkdir(parents=True, exist_ok=True)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _key(self, values: np.ndarray) -> str:
+        return ",".join(f"{v:.7g}" for v in values)
+
+    def add(self, values: Sequence[float], source: str) -> None:
+        """
+        Store a copy of ``source`` for the configuration ``values``.
+
+        Args:
+            values: Parameter vector of the evaluated configuration.
+            source: Output file to keep.
+        """
+        if not Path(source).is_file():
+            return
+
+        vector = np.asarray(values, dtype=np.float64)
+        key = self._key(vector)
+
+        if key in self._entries:
+            target = self._entries.pop(key)[1]
+        else:
+            self._counter += 1
+            target = self._directory / f"{self._counter}_{Path(source).name}"
+        shutil.copyfile(source, target)
+        self._entries[key] = (vector, target)
+
+        while len(self._entries) > self._capacity:
+            _, (_, path) = self._entries.popitem(last=False)
+            path.unlink(missing_ok=True)
+
+    def nearest(self, values: Sequence[float]) -> str | None:
+        """
+        Return the stored file closest to ``values``, or None.
+
+        Args:
+            values: Parameter vector of the configuration to evaluate.
+        """
+        if not self._entries:
+            self.misses += 1
+            return None
+
+        vector = np.asarray(values, dtype=np.float64)
+        keys = list(self._entries)
+        stored = np.stack([self._entries[k][0] for k in keys])
+        distances = np.sqrt(np.mean(((stored - vector) / self._scale) ** 2, axis=1))
+        best = int(np.argmin(distances))
+
+        if distances[best] > self._max_distance:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._entries.move_to_end(keys[best])
+        return str(self._entries[keys[best]][1])
@@ -0,0 +1,402 @@
+"""Driver throughput and scaling benchmark (``dabmpi-bench``).
+
+Runs short DAB (or SA) searches with ``mpirun`` on the local host for every
+combination of the requested solver, rank, parameter, bee and queue sizes, and
+reports throughput, driver CPU usage, message latencies and memory as
+JSON. The NONSEPARABLE problem evaluates in microseconds, so its runs
+measure the driver hot paths; FUSION runs use mock mode. NONSEPARABLE
+cases also report the objective throughput of this process, per solution
+and in vectorized batches.
+"""
+
+from __future__ import annotations
+
+import argparse
+import configparser
+import importlib.util
+import itertools
+import json
+import os
+import platform
+import shlex
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from copy import deepcopy
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+PROBLEMS = ("NONSEPARABLE", "FUSION")
+SOLVERS = ("DAB", "SA")
+STATUS_FILE = "status.json"
+PERFORMANCE_FILE = "performance.json"
+# Parameter bounds of the generated NONSEPARABLE inputs, small enough for
+# most Rosenbrock values to be below the validity limit of the solver
+NONSEPARABLE_BOUNDS = (-1.0, 1.0)
+NONSEPARABLE_GAP = 0.01
+DEFAULT_FUSION_INPUT = Path(__file__).parents[2] / "data" / "param_config.yaml"
+
+
+def int_list(text: str) -> list[int]:
+    """Parse a comma separated list of positive integers."""
+    try:
+        values = [int(item) for item in text.split(",") if item.strip()]
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(f"invalid integer list: {text}") from e
+    if not values or min(values) <= 0:
+        raise argparse.ArgumentTypeError(f"expected positive integers: {text}")
+    return values
+
+
+def solver_list(text: str) -> list[str]:
+    """Parse a comma separated list of solver names."""
+    values = [item.strip().upper() for item in text.split(",") if item.strip()]
+    if not values or not set(values) <= set(SOLVERS):
+        raise argparse.ArgumentTypeError(
+            f"expected solvers among {', '.join(SOLVERS)}: {text}"
+        )
+    return values
+
+
+def parse_arguments(argv=None) -> argparse.Namespace:
+    """Parse command-line arguments and return the namespace."""
+    parser = argparse.ArgumentParser(
+        prog="dabmpi-bench",
+        description="Benchmark the DAB driver throughput and scaling.",
+    )
+    parser.add_argument("-p", "--problem", choices=PROBLEMS, default="NONSEPARABLE")
+    parser.add_argument(
+        "-s",
+        "--solvers",
+        type=solver_list,
+        default=["DAB"],
+        help="solvers to compare on the same budget, e.g. DAB,SA",
+    )
+    parser.add_argument(
+        "-n", "--ranks", type=int_list, default=[2, 4], help="MPI ranks, e.g. 2,4,8"
+    )
+    parser.add_argument(
+        "--params",
+        type=int_list,
+        default=[10],
+        help="number of parameters (NONSEPARABLE only)",
+    )
+    parser.add_argument("--employed", type=int_list, default=[10])
+    parser.add_argument("--onlookers", type=int_list, default=[4])
+    parser.add_argument("--pending-size", type=int_list, default=[30])
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=1024,
+        help="candidates per vectorized objective call (NONSEPARABLE only)",
+    )
+    parser.add_argument(
+        "-t", "--time", type=int, default=20, help="duration of each run (seconds)"
+    )
+    parser.add_argument(
+        "-i",
+        "--ifile",
+        default=str(DEFAULT_FUSION_INPUT),
+        help="input parameters file for FUSION runs",
+    )
+    parser.add_argument("--mpirun", default="mpirun", help="MPI launcher")
+    parser.add_argument(
+        "--mpirun-args",
+        default="",
+        help='extra launcher arguments, e.g. "--oversubscribe"',
+    )
+    parser.add_argument("-o", "--output", help="JSON output file (default: stdout)")
+    parser.add_argument("--keep", action="store_true", help="keep the run directories")
+    return parser.parse_args(argv)
+
+
+def write_nonseparable_input(path: Path, num_params: int) -> None:
+    """Write a NONSEPARABLE input file with num_params float parameters."""
+    low, high = NONSEPARABLE_BOUNDS
+    params = [
+        {
+            "index": str(i),
+            "name": f"x{i}",
+            "value": "0",
+            "type": "float",
+            "gap": str(NONSEPARABLE_GAP),
+            "min_value": str(low),
+            "max_value": str(high),
+        }
+        for i in range(num_params)
+    ]
+    path.write_text(yaml.safe_dump({"NonSeparableParams": {"param": params}}))
+
+
+def write_config(
+    path: Path, employed: int, onlookers: int, pending_size: int, duration: int
+) -> None:
+    """Write the INI configuration of one benchmark run."""
+    config = configparser.ConfigParser()
+    config.optionxform = str
+    config["General"] = {"commModel": "DRIVERWORKER"}
+    config["Bees"] = {
+        "nemployed": str(employed),
+        "nonlooker": str(onlookers),
+        "iterationsAbandoned": "30",
+        "useProbMatrix": "True",
+    }
+    config["Algorithm"] = {
+        "pendingSize": str(pending_size),
+        "objective": "min",
+        "drainMargin": "1",
+    }
+    config["Instrumentation"] = {"enabled": "True", "report": PERFORMANCE_FILE}
+    # Only the final snapshot is used
+    config["Status"] = {
+        "enabled": "True",
+        "interval": str(duration),
+        "file": STATUS_FILE,
+    }
+    with open(path, "w", encoding="utf-8") as file:
+        config.write(file)
+
+
+def objective_throughput(
+    input_file: Path, batch_size: int, repeats: int = 3
+) -> dict[str, float]:
+    """
+    Measure the NONSEPARABLE objective in this process.
+
+    Args:
+        input_file: NONSEPARABLE input parameters file.
+        batch_size: Number of candidates evaluated per solve_batch call.
+        repeats: Number of timed passes, the fastest is reported.
+
+    Returns:
+        Evaluations per second of solve, one solution at a time, and of
+        solve_batch.
+    """
+    import numpy as np
+
+    from core.runtime import GlobalRuntime
+    from data.NonSeparableData import NonSeparableData
+    from problems.ProblemNonSeparable import ProblemNonSeparable
+    from solution.SolutionNonSeparable import SolutionNonSeparable
+
+    runtime = GlobalRuntime()
+    problem = ProblemNonSeparable(runtime, None)
+    template = NonSeparableData(runtime)
+    template.initialize(str(input_file))
+    values = np.random.default_rng(0).uniform(
+        *NONSEPARABLE_BOUNDS, size=(batch_size, template.num_params)
+    )
+    solutions = []
+    for row in values:
+        solution = SolutionNonSeparable(runtime, None, deepcopy(template))
+        solution.set_parameters_values(row)
+        solutions.append(solution)
+
+    def best_time(function) -> float:
+        times = []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            function()
+            times.append(time.perf_counter() - start)
+        return min(times)
+
+    def solve_each() -> None:
+        for solution in solutions:
+            problem.solve(solution)
+
+    return {
+        "batch_size": batch_size,
+        "solve_per_second": batch_size / best_time(solve_each),
+        "solve_batch_per_second": batch_size
+        / best_time(lambda: problem.solve_batch(values)),
+    }
+
+
+def span_mean(summary: dict[str, Any], name: str) -> float | None:
+    stats = summary.get("spans", {}).get(name)
+    return stats["mean"] if stats else None
+
+
+def summarize(status: dict[str, Any], report: dict[str, Any]) -> dict[str, Any]:
+    """
+    Extract the benchmark metrics of one run.
+
+    Args:
+        status: Final run status (``status.json``).
+        report: Performance report (``performance.json``).
+
+    Returns:
+        Throughput, driver CPU utilization, message latencies (seconds),
+        peak memory (MiB) and the mean time of the driver hot paths.
+    """
+    ranks = report["ranks"]
+    driver = ranks["0"]
+    workers = [summary for rank, summary in ranks.items() if rank != "0"]
+    resources = driver.get("resources", {})
+    wall = resources.get("wall_seconds") or status["elapsed_seconds"]
+    waits = [span_mean(worker, "mpi.wait.candidate") for worker in workers]
+    waits = [wait for wait in waits if wait is not None]
+
+    return {
+        "evaluations": status["evaluations_total"],
+        "evaluations_per_second": status["evaluations_per_second"],
+        "worker_utilization": status["worker_utilization"],
+        "driver_cpu_utilization": resources.get("cpu_seconds", 0.0) / wall,
+        "driver_memory_mb": resources.get("max_rss_kb", 0) / 1024,
+        "worker_memory_mb": max(
+            (w.get("resources", {}).get("max_rss_kb", 0) for w in workers),
+            default=0,
+        )
+        / 1024,
+        "latency": {
+            "candidate_wait": sum(waits) / len(waits) if waits else None,
+            "candidate_send": span_mean(driver, "mpi.send.candidate"),
+            "solution_receive": span_mean(driver, "mpi.recv.solution"),
+        },
+        "driver_spans": {
+            name: stats["mean"] for name, stats in driver.get("spans", {}).items()
+        },
+        "best_value": status["best_value"],
+    }
+
+
+def run_case(args, case: dict[str, Any], directory: Path) -> dict[str, Any]:
+    """Run one benchmark case in directory and return its results."""
+    directory.mkdir(parents=True, exist_ok=True)
+    if args.problem == "NONSEPARABLE":
+        input_file = directory / "params.yaml"
+        write_nonseparable_input(input_file, case["params"])
+    else:
+        input_file = Path(args.ifile).resolve()
+    write_config(
+        directory / "config.ini",
+        case["employed"],
+        case["onlookers"],
+        case["pending_size"],
+        args.time,
+    )
+
+    # Locate disop without importing it: importing mpi4py here would make
+    # this process an MPI singleton before it launches mpirun
+    disop = importlib.util.find_spec("disop")
+    if disop is None or disop.origin is None:
+        raise RuntimeError("Cannot find the disop module")
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        filter(None, [str(Path(disop.origin).parent), env.get("PYTHONPATH")])
+    )
+    command = [
+        args.mpirun,
+        "-np",
+        str(case["ranks"]),
+        *shlex.split(args.mpirun_args),
+        sys.executable,
+        disop.origin,
+        "-p",
+        args.problem,
+        "-s",
+        case["solver"],
+        "-i",
+        str(input_file),
+        "-c",
+        "config.ini",
+        "-t",
+        str(args.time),
+        "-v",
+        "1",
+    ]
+    if args.problem == "FUSION":
+        command.append("-m")
+
+    start = time.monotonic()
+    with open(directory / "output.txt", "w", encoding="utf-8") as output:
+        completed = subprocess.run(
+            command,
+            cwd=directory,
+            env=env,
+            stdout=output,
+            stderr=subprocess.STDOUT,
+            timeout=args.time * 3 + 60,
+            check=False,
+        )
+    result: dict[str, Any] = {
+        **case,
+        "returncode": completed.returncode,
+        "wall_seconds": time.monotonic() - start,
+    }
+    try:
+        status = json.loads((directory / STATUS_FILE).read_text())
+        report = json.loads((directory / PERFORMANCE_FILE).read_text())
+    except (OSError, ValueError):
+        result["error"] = f"missing results, see {directory / 'output.txt'}"
+        return result
+    result.update(summarize(status, report))
+    if args.problem == "NONSEPARABLE":
+        result["objective"] = objective_throughput(input_file, args.batch_size)
+    return result
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Run the benchmark and write its JSON report."""
+    args = parse_arguments(argv)
+    # FUSION runs use the parameters of the input file
+    params = args.params if args.problem == "NONSEPARABLE" else [None]
+    cases = [
+        dict(
+            zip(
+                (
+                    "solver",
+                    "ranks",
+                    "params",
+                    "employed",
+                    "onlookers",
+                    "pending_size",
+                ),
+                values,
+                strict=True,
+            )
+        )
+        for values in itertools.product(
+            args.solvers,
+            args.ranks,
+            params,
+            args.employed,
+            args.onlookers,
+            args.pending_size,
+        )
+    ]
+
+    root = Path(tempfile.mkdtemp(prefix="dabmpi-bench-"))
+    results = []
+    for number, case in enumerate(cases):
+        print(f"dabmpi-bench: case {number + 1}/{len(cases)} {case}", file=sys.stderr)
+        results.append(run_case(args, case, root / f"case{number}"))
+
+    report = {
+        "problem": args.problem,
+        "time": args.time,
+        "host": platform.node(),
+        "python": platform.python_version(),
+        "results": results,
+    }
+    text = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(text + "\n")
+    else:
+        print(text)
+
+    if args.keep:
+        print(f"dabmpi-bench: run directories kept in {root}", file=sys.stderr)
+    else:
+        shutil.rmtree(root, ignore_errors=True)
+
+    if any(result["returncode"] != 0 or "error" in result for result in results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
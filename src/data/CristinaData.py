@@ -49,7 +49,7 @@ class CristinaData:
     def set_parameters_values(self, buff):
         """Updates internal parameter states from an iterable buffer."""
         self._runtime.logger.debug(
-            f"CristinaData. Setting parameters (number: {len(buff)})"
+            "CristinaData. Setting parameters (number: %d)", len(buff)
         )
         for i, val in enumerate(buff):
             if i < len(self._parameters):
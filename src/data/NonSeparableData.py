@@ -1,11 +1,15 @@
 #!/usr/bin/env python3
 
-import os
 from array import array
-import xml.etree.ElementTree as ET
+
+import yaml
+
+from core.schema import load_schema
 
 from .Parameter import Parameter, ParamType
 
+PARAMETER_FIELDS = ("name", "index", "type", "value", "gap", "min_value", "max_value")
+
 
 class NonSeparableData:
     """
@@ -44,7 +48,7 @@ class NonSeparableData:
     def set_params_values(self, buff: list[float] | array) -> None:
         """Updates internal parameter states sequence-wise from an iterable buffer."""
         self._logger.debug(
-            f"NonSeparableData. Setting parameters (number: {len(buff)})"
+            "NonSeparableData. Setting parameters (number: %d)", len(buff)
         )
         for i, val in enumerate(buff):
             if i < len(self._params):
@@ -68,42 +72,41 @@ class NonSeparableData:
         if index >= len(self._params):
             self._params.append(parameter)
 
-    def initialize(self, filepath: str) -> None:
-        """Reads the XML input file and instantiates immutable-ready parameter states."""
-        if not os.path.exists(filepath):
-            filepath = os.path.join("..", filepath)
+    @staticmethod
+    def read_entries(filepath: str) -> list[dict]:
+        """Returns the raw fields of every parameter in a YAML or XML input file."""
+        if filepath.endswith((".yaml", ".yml")):
+            with open(filepath, encoding="utf-8") as f:
+                raw_data = yaml.safe_load(f) or {}
+            # A single root element (NonSeparableParams) holding the param list
+            root = next(iter(raw_data.values()), None) or {}
+            entries = root.get("param", [])
+            if isinstance(entries, dict):
+                entries = [entries]
+            return [
+                {key: entry.get(key) for key in PARAMETER_FIELDS} for entry in entries
+            ]
+
+        import xml.etree.ElementTree as ET
+
+        root = ET.parse(filepath).getroot()
+        return [
+            {child.tag: child.text for child in node if child.tag in PARAMETER_FIELDS}
+            for node in root
+        ]
 
+    def initialize(self, filepath: str) -> None:
+        """Reads the input file and instantiates immutable-ready parameter states."""
         try:
-            tree = ET.parse(filepath)
-            root = tree.getroot()
-
-            for node in root:
+            for entry in load_schema(filepath, NonSeparableData.read_entries):
                 # 1. Use explicitly typed local variables to keep Mypy happy
-                p_name = ""
-                p_index_str: str | None = None
-                p_type_str = "string"
-                p_value: str | None = None
-                p_gap_str: str | None = None
-                p_min_value: str | None = None
-                p_max_value: str | None = None
-
-                for param_node in node:
-                    tag = param_node.tag
-                    val = param_node.text
-                    if tag == "name" and val is not None:
-                        p_name = val
-                    elif tag == "index":
-                        p_index_str = val
-                    elif tag == "type" and val is not None:
-                        p_type_str = val
-                    elif tag == "value":
-                        p_value = val
-                    elif tag == "gap":
-                        p_gap_str = val
-                    elif tag == "min_value":
-                        p_min_value = val
-                    elif tag == "max_value":
-                        p_max_value = val
+                p_name = str(entry.get("name") or "")
+                p_index_str = entry.get("index")
+                p_type_str = str(entry.get("type") or "string")
+                p_value = entry.get("value")
+                p_gap_str = entry.get("gap")
+                p_min_value = entry.get("min_value")
+                p_max_value = entry.get("max_value")
 
                 try:
                     # Resolve string to ParamType Enum to satisfy expected type
@@ -155,7 +158,7 @@ class NonSeparableData:
 
         except Exception as e:
             self._logger.exception(
-                "NonSeparableData. Exception while initializing from XML file"
+                "NonSeparableData. Exception while initializing from input file"
             )
             raise RuntimeError(
                 "Failed to safely build framework structural elements from configuration source."
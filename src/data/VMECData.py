@@ -1,10 +1,11 @@
 #!/usr/bin/env python
 
-import os
 import sys
 from array import array
 import yaml
 
+from core.schema import load_schema
+
 from .Parameter import ParamType
 from .ParameterVMEC import ParameterVMEC
 
@@ -250,7 +251,7 @@ class VMECData:
 
     def set_parameters_values(self, buff):
         self._runtime.logger.debug(
-            f"VMECData. Setting parameters (number: {len(buff)})"
+            "VMECData. Setting parameters (number: %d)", len(buff)
         )
         idx = 0
         for param in self._iter_params(include_config=False):
@@ -378,24 +379,27 @@ class VMECData:
             self._runtime.logger.warning(f"Unassigned element with index: {index}")
         return -1
 
+    @staticmethod
+    def read_schema(filepath):
+        """Returns the parsed contents of a YAML input file."""
+        with open(filepath, "r", encoding="utf-8") as f:
+            # Use CSafeLoader for optimized performance if available
+            try:
+                from yaml import CSafeLoader as SafeLoader
+            except ImportError:
+                from yaml import SafeLoader
+
+            return yaml.load(f, Loader=SafeLoader) or {}
+
     def initialize(self, filepath):
         """
         Method that reads the YAML input file, fixes structural key changes,
         and sanitizes stringified YAML or dictionary values into native Python types.
+        The file is parsed once per process (or received from rank 0).
         """
         try:
             self._runtime.logger.debug("VMEC data initialization")
-            if not os.path.exists(filepath):
-                filepath = "../" + filepath
-
-            with open(filepath, "r", encoding="utf-8") as f:
-                # Use CSafeLoader for optimized performance if available
-                try:
-                    from yaml import CSafeLoader as SafeLoader
-                except ImportError:
-                    from yaml import SafeLoader
-
-                raw_data = yaml.load(f, Loader=SafeLoader) or {}
+            raw_data = load_schema(filepath, VMECData.read_schema)
 
             # Handle the top-level 'parameters_config' wrapper if present
             data = raw_data.get("parameters_config", raw_data)
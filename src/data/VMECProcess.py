@@ -5,7 +5,6 @@ import contextlib
 import glob
 import math
 import os
-import random
 import shutil
 import subprocess
 import time
@@ -16,9 +15,11 @@ import numpy as np
 from core.comms import GlobalComms
 from core.enums import ObjectiveType
 from core.file_utils import tail
+from core.instrumentation import span
 
 # from core.matrix import Matrix
 from core.runtime import GlobalRuntime
+from core.warm_start import WarmStartArchive
 
 INFINITY = math.inf
 
@@ -60,6 +61,13 @@ class VMECProcess:
         self._max_beta = INFINITY
         self._save_configs = False
 
+        self._warm_start = False
+        self._warm_start_size = 16
+        self._warm_start_distance = INFINITY
+        self._warm_start_archive: WarmStartArchive | None = None
+        self._warm_start_values = None
+        self._reset_file: str | None = None
+
         self._netcdf = ""
 
         self.read_ini_config_file(self._runtime.config_file)
@@ -102,6 +110,23 @@ class VMECProcess:
     def get_bgradbval(self):
         return self._bgradbval
 
+    def computes(self, objective: str) -> bool:
+        """Return whether the configured pipeline computes objective."""
+        return {
+            "beta": self._get_beta,
+            "bgradb": self._bgradb,
+            "bootstrap": self._dkes,
+        }.get(objective, False)
+
+    def objective_values(self, objectives) -> list[float]:
+        """Return the figures of merit of the last configuration executed."""
+        values = {
+            "beta": self._beta,
+            "bgradb": self._bgradbval,
+            "bootstrap": self._bootstrap,
+        }
+        return [float(values[name]) for name in objectives]
+
     def read_ini_config_file(self, cfile):
         config = configparser.ConfigParser()
         config.read(cfile)
@@ -149,6 +174,14 @@ class VMECProcess:
                 val = config.getboolean("Fusion", "save_configurations")
                 if val is not None:
                     self._save_configs = val
+            if config.has_option("Fusion", "warm_start"):
+                self._warm_start = config.getboolean("Fusion", "warm_start")
+            if config.has_option("Fusion", "warm_start_size"):
+                self._warm_start_size = config.getint("Fusion", "warm_start_size")
+            if config.has_option("Fusion", "warm_start_distance"):
+                self._warm_start_distance = config.getfloat(
+                    "Fusion", "warm_start_distance"
+                )
             if config.has_option("General", "netcdf"):
                 val = config.get("General", "netcdf")
                 if val is not None:
@@ -166,6 +199,8 @@ class VMECProcess:
                 + str(self._extra_threed1)
                 + " - beta "
                 + str(self._get_beta)
+                + " - warm start "
+                + str(self._warm_start)
             )
         except Exception:
             self._runtime.logger.exception(
@@ -191,7 +226,47 @@ class VMECProcess:
             self._runtime.logger.exception("VMECProcess: error removing old input file")
             return False
 
-        return solution.prepare(f"{self._comms.rank}/{self._filename}")
+        with span("vmec.input"):
+            return solution.prepare(f"{self._comms.rank}/{self._filename}")
+
+    """
+    Selects the converged equilibrium used to seed the next VMEC run: the
+    archived wout file closest (in normalized parameter space) to the
+    configuration about to be evaluated.
+    """
+
+    def prepare_warm_start(self, solution) -> None:
+        self._reset_file = None
+        self._warm_start_values = None
+        if not self._warm_start or self._runtime.mock or self._comms.rank == 0:
+            return
+
+        try:
+            if self._warm_start_archive is None:
+                parameters = solution.get_parameters()
+                self._warm_start_archive = WarmStartArchive(
+                    os.path.join(self._execPath, "warmstart"),
+                    [float(p.min_value) for p in parameters],
+                    [float(p.max_value) for p in parameters],
+                    self._warm_start_size,
+                    self._warm_start_distance,
+                )
+            self._warm_start_values = list(solution.get_parameters_values())
+            self._reset_file = self._warm_start_archive.nearest(self._warm_start_values)
+        except Exception:
+            self._runtime.logger.exception("VMECProcess: error preparing warm start")
+            self._reset_file = None
+
+    def archive_wout(self) -> None:
+        if self._warm_start_archive is None or self._warm_start_values is None:
+            return
+        try:
+            self._warm_start_archive.add(
+                self._warm_start_values,
+                os.path.join(self._execPath, f"wout_tj{self._comms.rank}.txt"),
+            )
+        except Exception:
+            self._runtime.logger.exception("VMECProcess: error archiving wout file")
 
     def clean_folder(self):
         files = [
@@ -235,9 +310,6 @@ class VMECProcess:
             Objective value on success.
             +/-INFINITY on invalid configurations.
         """
-        if self._runtime.mock:
-            return random.uniform(0.0, 1.0)
-
         failure_value = (
             -INFINITY if self._runtime.objective == ObjectiveType.MAXIMIZE else INFINITY
         )
@@ -250,29 +322,36 @@ class VMECProcess:
                 # Execute sequential physics steps. If run_vmec() hits an unhandled
                 # FileNotFoundError, it will bubble out past this function, but the
                 # working_directory context manager will STILL safely restore your path first.
-                if not self.run_vmec():
-                    return failure_value
+                with span("vmec.run"):
+                    if not self.run_vmec():
+                        return failure_value
+                self.archive_wout()
 
-                if not self.run_mercier():
-                    return failure_value
+                with span("vmec.mercier"):
+                    if not self.run_mercier():
+                        return failure_value
 
-                if not self.run_threed():
-                    return failure_value
+                with span("vmec.threed1"):
+                    if not self.run_threed():
+                        return failure_value
 
                 # Base objective starting value
                 value = self._beta
 
-                if not self.run_ballooning():
-                    return failure_value
+                with span("vmec.cobra"):
+                    if not self.run_ballooning():
+                        return failure_value
 
                 if self._bgradb:
-                    if not self.run_b_grad_b():
-                        return failure_value
+                    with span("vmec.bgradb"):
+                        if not self.run_b_grad_b():
+                            return failure_value
                     value = self._bgradbval
 
                 if self._dkes:
-                    if not self.run_dkes():
-                        return failure_value
+                    with span("vmec.dkes"):
+                        if not self.run_dkes():
+                            return failure_value
                     value = self._bootstrap
 
                 if not self._is_mercier_stable:
@@ -811,10 +890,18 @@ class VMECProcess:
                 f"VMECProcess({self._comms.rank}). {executable} is not executable"
             )
 
+        command = [executable, f"tj{self._comms.rank}"]
+        if self._reset_file is not None:
+            # VMEC reads the initial guess from a previous wout file
+            command.append(f"reset={self._reset_file}")
+            self._runtime.logger.info(
+                f"VMECProcess({self._comms.rank}). Warm start from {self._reset_file}"
+            )
+
         # --- 2. Runtime Execution ---
         try:
             with subprocess.Popen(
-                [executable, f"tj{self._comms.rank}"],
+                command,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,  # Capture stderr to avoid buffer blocks
                 text=True,  # Automatically decodes bytes to strings
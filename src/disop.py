@@ -6,19 +6,26 @@ import logging
 import sys
 import time
 from array import array
-from importlib.metadata import PackageNotFoundError
-from importlib.metadata import version as package_version
 from pathlib import Path
 
 from mpi4py import MPI
 
 from core.comms import GlobalComms
-from core.enums import CommModelType, ObjectiveType, ProblemType, SolverType
-from core.logging import LoggerConfig
+from core.enums import (
+    CommModelType,
+    ObjectiveType,
+    ProblemType,
+    SolutionType,
+    SolverType,
+)
+from core.instrumentation import get_instrumentation, process_resources, write_report
+from core.logging import LoggerConfig, close_logger, get_event_log
+from core.registry import SCHEMA_READER_REGISTRY, SOLVER_REGISTRY, load_plugins
 from core.runtime import GlobalRuntime
-from runtime.EvaluationWorker import EvaluationWorker
-from solvers.SolverDAB import SolverDAB
-from solvers.SolverSA import SolverSA
+from core.schema import broadcast_schema
+
+# Solvers, problems and the worker are imported when a run selects them, see
+# core.registry
 
 PROBLEM_MAP = {
     "FUSION": ProblemType.FUSION,
@@ -26,16 +33,17 @@ PROBLEM_MAP = {
     "NONSEPARABLE": ProblemType.NONSEPARABLE,
 }
 
+SOLUTION_TYPE_MAP = {
+    ProblemType.FUSION: SolutionType.FUSION,
+    ProblemType.CRISTINA: SolutionType.CRISTINA,
+    ProblemType.NONSEPARABLE: SolutionType.NONSEPARABLE,
+}
+
 CLI_SOLVER_MAP = {
     "DAB": SolverType.DAB,
     "SA": SolverType.SA,
 }
 
-SOLVER_MAP = {
-    SolverType.DAB: SolverDAB,
-    SolverType.SA: SolverSA,
-}
-
 LOG_LEVELS = {
     1: logging.WARNING,
     2: logging.INFO,
@@ -45,14 +53,22 @@ LOG_LEVELS = {
 # Configuration file constants
 CONFIG_SECTION_GENERAL = "General"
 CONFIG_SECTION_ALGORITHM = "Algorithm"
+CONFIG_SECTION_INSTRUMENTATION = "Instrumentation"
+CONFIG_SECTION_LOGGING = "Logging"
 CONFIG_KEY_COMM_MODEL = "commModel"
+CONFIG_KEY_SCHEMA_CACHE = "schemaCache"
 CONFIG_KEY_OBJECTIVE = "objective"
+CONFIG_KEY_ENABLED = "enabled"
+CONFIG_KEY_REPORT = "report"
+CONFIG_KEY_EVENT_LOG = "eventLog"
+CONFIG_KEY_SAMPLE_INTERVAL = "sampleInterval"
+CONFIG_KEY_PER_RANK_FILES = "perRankFiles"
 
 
 def create_solver(runtime, comms):
     """Factory function to create the appropriate solver instance."""
     try:
-        solver_class = SOLVER_MAP[runtime.solver_type]
+        solver_class = SOLVER_REGISTRY[runtime.solver_type]
     except KeyError as e:
         raise ValueError(f"Invalid solver type: {runtime.solver_type}") from e
     return solver_class(runtime, comms)
@@ -67,12 +83,44 @@ def is_valid_file(parser, arg) -> str:
 
 
 def get_package_version():
+    # importlib.metadata is slow to import and only needed for --version
+    from importlib.metadata import PackageNotFoundError
+    from importlib.metadata import version as package_version
+
     try:
         return package_version("dabmpi")
     except PackageNotFoundError:
         return "unknown"
 
 
+class VersionAction(argparse.Action):
+    """Prints the package version, looked up only when --version is given."""
+
+    def __init__(self, option_strings, dest=argparse.SUPPRESS, **kwargs):
+        super().__init__(
+            option_strings,
+            dest=dest,
+            default=argparse.SUPPRESS,
+            nargs=0,
+            help="show program's version number and exit",
+        )
+
+    def __call__(self, parser, namespace, values, option_string=None):
+        parser.exit(message=f"{parser.prog} {get_package_version()}\n")
+
+
+def problem_name(text: str) -> str:
+    """Accept a built-in problem or one published by an installed plugin."""
+    if text in PROBLEM_MAP:
+        return text
+    plugins = load_plugins()
+    if text in plugins:
+        return text
+    raise argparse.ArgumentTypeError(
+        f"invalid problem: {text} (choose from {', '.join([*PROBLEM_MAP, *plugins])})"
+    )
+
+
 def parse_arguments(argv=None) -> argparse.Namespace:
     """Parse command-line arguments and return the namespace."""
     parser = argparse.ArgumentParser(
@@ -86,9 +134,8 @@ def parse_arguments(argv=None) -> argparse.Namespace:
         "-p",
         "--problem",
         required=True,
-        type=str,
-        choices=list(PROBLEM_MAP.keys()),
-        help="Problem type",
+        type=problem_name,
+        help=f"Problem type: {', '.join(PROBLEM_MAP)} or an installed plugin",
     )
     parser.add_argument(
         "-v",
@@ -138,38 +185,59 @@ def parse_arguments(argv=None) -> argparse.Namespace:
         help="Run in mock mode without executing actual problem evaluations",
     )
     parser.add_argument(
-        "--version", action="version", version="%(prog)s " + get_package_version()
+        "--resume",
+        action="store_true",
+        required=False,
+        default=False,
+        help="Continue the search from the solver checkpoint",
     )
+    parser.add_argument("--version", action=VersionAction)
 
     return parser.parse_args(argv)
 
 
 def configure_runtime(runtime: GlobalRuntime, comms: GlobalComms, args) -> None:
     """Apply parsed CLI values to runtime and initialize config."""
-    problem_type = PROBLEM_MAP[args.problem]
+    # Plugin problems are identified by their name
+    problem_type = PROBLEM_MAP.get(args.problem, args.problem)
     solver_type = CLI_SOLVER_MAP[args.solver]
 
     bootstrap_runtime(args.cfile, runtime, comms, args.verbose)
 
     runtime.problem_type = problem_type
+    runtime.solution_type = SOLUTION_TYPE_MAP.get(problem_type, problem_type)
     runtime.solver_type = solver_type
     runtime.config_file = args.cfile
     runtime.input_file = args.ifile
     runtime.max_execution_time = args.time
     runtime.mock = args.mock
+    runtime.resume = args.resume
 
     if runtime.logger is not None:
         runtime.logger.setLevel(LOG_LEVELS[args.verbose])
 
 
+def broadcast_input(runtime: GlobalRuntime, comms: GlobalComms) -> None:
+    """Parse the input file on rank 0 only and send it to the other ranks."""
+    if runtime.problem_type not in SCHEMA_READER_REGISTRY:
+        return
+    reader = SCHEMA_READER_REGISTRY[runtime.problem_type]
+    broadcast_schema(comms.comm, runtime.input_file, reader, runtime.schema_cache)
+
+
 def create_mpi_comms() -> GlobalComms:
     """Create the MPI communicator wrapper used by the runtime."""
     comm = MPI.COMM_WORLD
     return GlobalComms(comm.Get_rank(), comm.Get_size(), comm)
 
 
-def run_driver(runtime: GlobalRuntime, global_comms: GlobalComms) -> None:
-    """Run the driver-side MPI execution path."""
+def run_driver(runtime: GlobalRuntime, global_comms: GlobalComms) -> set[int]:
+    """
+    Run the driver-side MPI execution path.
+
+    Returns the workers that cannot take part in the final synchronization:
+    those lost and those still evaluating after the deadline grace period.
+    """
     runtime.logger.warning("Driver. Starting execution")
     solver = create_solver(runtime, global_comms)
     solver.initialize()
@@ -177,10 +245,13 @@ def run_driver(runtime: GlobalRuntime, global_comms: GlobalComms) -> None:
     runtime.logger.warning("Driver. Finished evaluating solutions")
     solver.finish()
     runtime.logger.warning("Driver. End of the execution")
+    return solver.lost_workers | solver.unfinished_workers
 
 
 def run_worker(runtime: GlobalRuntime, global_comms: GlobalComms) -> None:
     """Run the worker-side MPI execution path."""
+    from runtime.EvaluationWorker import EvaluationWorker
+
     runtime.logger.warning(f"Worker {global_comms.rank}. Starting execution")
     worker = EvaluationWorker(runtime, global_comms)
     worker.run()
@@ -200,6 +271,46 @@ def run_all2all(runtime: GlobalRuntime, global_comms: GlobalComms) -> None:
     runtime.logger.warning(f"Rank {global_comms.rank}. End of the execution")
 
 
+def gather_performance_report(
+    runtime: GlobalRuntime, global_comms: GlobalComms, missing: set[int] = frozenset()
+):
+    """
+    Collect the instrumentation summaries of all ranks on rank 0. When
+    workers are missing the gather cannot complete, so the driver reports
+    its own summary only.
+    """
+    instrumentation = get_instrumentation()
+    if not instrumentation.enabled:
+        return
+    summary = instrumentation.summary()
+    summary["resources"] = {
+        **process_resources(),
+        "wall_seconds": time.time() - runtime.start_time,
+    }
+    if missing:
+        summaries = [summary]
+    else:
+        summaries = global_comms.comm.gather(summary, root=0)
+    if global_comms.rank == 0:
+        write_report(runtime.performance_report, summaries)
+        runtime.logger.info(
+            f"Driver. Performance report written to {runtime.performance_report}"
+        )
+
+
+def read_per_rank_logging(cfile: str) -> bool:
+    """Return whether each rank writes its own log file ([Logging] perRankFiles)."""
+    config = configparser.ConfigParser()
+    try:
+        config.read(cfile)
+        return config.getboolean(
+            CONFIG_SECTION_LOGGING, CONFIG_KEY_PER_RANK_FILES, fallback=False
+        )
+    except (configparser.Error, ValueError):
+        # Fall back to the shared log file, bootstrap_runtime reports parse errors
+        return False
+
+
 def bootstrap_runtime(
     cfile: str, runtime: GlobalRuntime, comms: GlobalComms, verbose: int
 ) -> None:
@@ -213,14 +324,17 @@ def bootstrap_runtime(
         FileNotFoundError: If configuration file doesn't exist
         configparser.Error: If configuration file is malformed
     """
+    per_rank = read_per_rank_logging(cfile)
     logger = LoggerConfig.create_logger(
         log_file="disop.log",
         console_level=LOG_LEVELS[verbose],  # Map verbosity to log level
         rank=comms.rank,
+        per_rank=per_rank,
     )
     # Call a barrier since only one rank inside the logger created a backup of the log files
     # It's not really needed, but it's good to have
-    comms.comm.Barrier()
+    if not per_rank:
+        comms.comm.Barrier()
     # logger.addFilter(MPIRankFilter(comms.rank))
     # Get runtime and update it
     runtime.logger = logger
@@ -243,6 +357,10 @@ def bootstrap_runtime(
             elif val:
                 runtime.comm_model = CommModelType.ALL2ALL
 
+        runtime.schema_cache = config.get(
+            CONFIG_SECTION_GENERAL, CONFIG_KEY_SCHEMA_CACHE, fallback=""
+        )
+
         # Parse objective
         if config.has_option(CONFIG_SECTION_ALGORITHM, CONFIG_KEY_OBJECTIVE):
             val = config.get(CONFIG_SECTION_ALGORITHM, CONFIG_KEY_OBJECTIVE)
@@ -251,6 +369,27 @@ def bootstrap_runtime(
             elif val:
                 runtime.objective = ObjectiveType.MINIMIZE
 
+        # Parse instrumentation settings
+        instrumentation = get_instrumentation()
+        instrumentation.enabled = config.getboolean(
+            CONFIG_SECTION_INSTRUMENTATION, CONFIG_KEY_ENABLED, fallback=False
+        )
+        runtime.performance_report = config.get(
+            CONFIG_SECTION_INSTRUMENTATION,
+            CONFIG_KEY_REPORT,
+            fallback=runtime.performance_report,
+        )
+
+        # Parse logging settings, the event log is written by the driver
+        runtime.log_sample_interval = config.getfloat(
+            CONFIG_SECTION_LOGGING, CONFIG_KEY_SAMPLE_INTERVAL, fallback=1.0
+        )
+        event_log = config.get(
+            CONFIG_SECTION_LOGGING, CONFIG_KEY_EVENT_LOG, fallback=""
+        )
+        if event_log and comms.rank == 0:
+            get_event_log().start(event_log, comms.rank)
+
     except FileNotFoundError:
         logger.warning(f"Configuration file not found: {cfile}. Using defaults.")
     except configparser.Error as e:
@@ -267,14 +406,29 @@ def main(runtime, argv=None):
             runtime.logger.debug(f"Verbosity level: {args.verbose}")
 
         configure_runtime(runtime, global_comms, args)
+        broadcast_input(runtime, global_comms)
+        missing: set[int] = set()
         if runtime.comm_model == CommModelType.DRIVERWORKER:
             if global_comms.rank == 0:
-                run_driver(runtime, global_comms)
+                missing = run_driver(runtime, global_comms)
             else:
                 run_worker(runtime, global_comms)
         else:
             run_all2all(runtime, global_comms)
 
+        gather_performance_report(runtime, global_comms, missing)
+        get_event_log().close()
+
+        if missing:
+            # Missing workers never join the final synchronization, so end
+            # the job here, once the report, the event log and the log files
+            # are written, instead of waiting for the scheduler to kill it
+            runtime.logger.error(
+                f"Driver. Aborting, workers {sorted(missing)} did not finish"
+            )
+            close_logger(runtime.logger)
+            global_comms.comm.Abort(1)
+
         dump = array("i", [0]) * 1
         global_comms.comm.Bcast(dump)
     except Exception:
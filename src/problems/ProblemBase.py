@@ -3,17 +3,84 @@
 
 from abc import ABC, abstractmethod
 
+from core.enums import ObjectiveType
+from core.mock import MockCostModel
+
 
 class ProblemBase(ABC):
+    # Problems that compute their own objective cheaply keep it in mock mode
+    # unless the configuration has a [Mock] section
+    MOCK_REQUIRES_CONFIG = False
+    # Range of the values of the random mock objective
+    MOCK_RANDOM_RANGE = (0.0, 1.0)
+
     def __init__(self, runtime, comms):
         self._runtime = runtime
         self._comms = comms
+        # In mock mode solutions are evaluated by the synthetic cost model
+        self._mock: MockCostModel | None = None
+        if runtime.mock and (
+            not self.MOCK_REQUIRES_CONFIG
+            or MockCostModel.configured(runtime.config_file)
+        ):
+            self._mock = MockCostModel.from_config(
+                runtime.config_file,
+                runtime.objective == ObjectiveType.MAXIMIZE,
+                comms.rank,
+                self.MOCK_RANDOM_RANGE,
+            )
         return
 
     @abstractmethod
     def solve(self, solution) -> None:
         pass
 
+    # Problems with an analytic objective override this to evaluate K
+    # candidates, one per row of values (shape K x P), in one vectorized
+    # call and return their K values
+    def solve_batch(self, values):
+        raise NotImplementedError(f"{type(self).__name__} has no batch evaluation")
+
+    @property
+    def batch_capable(self) -> bool:
+        # Mock mode keeps the per-evaluation durations and failures
+        return (
+            self._mock is None and type(self).solve_batch is not ProblemBase.solve_batch
+        )
+
+    # Evaluates a list of solutions, with solve_batch when the problem has
+    # one and with solve otherwise (external codes such as VMEC)
+    def solve_many(self, solutions) -> None:
+        if not solutions:
+            return
+        if not self.batch_capable:
+            for solution in solutions:
+                self.solve(solution)
+            return
+        # Problems of external codes never get here, they skip numpy
+        import numpy as np
+
+        values = np.array(
+            [solution.get_parameters_values() for solution in solutions],
+            dtype=np.float64,
+        )
+        for solution, value in zip(solutions, self.solve_batch(values), strict=True):
+            solution.value = float(value)
+
+    # Multi-objective problems name the objectives they report after every
+    # solve (objective_vector, in the sense given by objective_maximize);
+    # the driver keeps the Pareto front of their values
+    @property
+    def objective_names(self) -> tuple[str, ...]:
+        return ()
+
+    @property
+    def objective_maximize(self) -> tuple[bool, ...]:
+        return ()
+
+    def objective_vector(self) -> list[float]:
+        return []
+
     @abstractmethod
     def extractSolution(self) -> tuple[float, float]:
         pass
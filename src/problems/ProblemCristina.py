@@ -1,18 +1,19 @@
 #!/usr/bin/env python
 
 
-import random
-
 from problems.ProblemBase import ProblemBase
 
 
 class ProblemCristina(ProblemBase):
+    MOCK_RANDOM_RANGE = (0.0, 1000000.0)
+
     def __init__(self, runtime, comms):
         super().__init__(runtime, comms)
 
     def solve(self, solution) -> None:
-        if self._runtime.mock:
-            solution.value = random.randint(0, 1000000)
+        if self._mock is not None:
+            solution.value = self._mock.evaluate(solution)
+            return
         raise NotImplementedError("Solver not implemented")
 
     def extractSolution(self) -> tuple[float, float]:
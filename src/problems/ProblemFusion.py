@@ -1,9 +1,15 @@
 #!/usr/bin/env python
+import configparser
+import math
 from typing import Any
 
 from data.VMECProcess import VMECProcess
 from problems.ProblemBase import ProblemBase
 
+# Figures of merit available to multi-objective runs and whether they are
+# maximized
+FUSION_OBJECTIVES = {"beta": True, "bgradb": False, "bootstrap": False}
+
 
 class ProblemFusion(ProblemBase):
     _vmec: VMECProcess
@@ -12,11 +18,42 @@ class ProblemFusion(ProblemBase):
         try:
             super().__init__(runtime, comms)
             self._vmec = VMECProcess(runtime, comms)
+            self._objectives: tuple[str, ...] = ()
+            self._vector: list[float] = []
+            self.read_pareto_config(runtime.config_file)
 
         except Exception:
             self._runtime.logger.exception("ProblemFusion init failed")
             raise
 
+    def read_pareto_config(self, cfile) -> None:
+        config = configparser.ConfigParser()
+        config.read(cfile)
+        if not config.getboolean("Pareto", "enabled", fallback=False):
+            return
+        names = config.get("Pareto", "objectives", fallback="beta, bgradb")
+        self._objectives = tuple(n.strip() for n in names.split(",") if n.strip())
+        for name in self._objectives:
+            if name not in FUSION_OBJECTIVES:
+                raise ValueError(f"Unknown Pareto objective: {name}")
+            if self._mock is None and not self._vmec.computes(name):
+                raise ValueError(
+                    f"Pareto objective {name} is not computed, see [Fusion] options"
+                )
+        if len(self._objectives) < 2:
+            raise ValueError("A Pareto run needs at least two objectives")
+
+    @property
+    def objective_names(self) -> tuple[str, ...]:
+        return self._objectives
+
+    @property
+    def objective_maximize(self) -> tuple[bool, ...]:
+        return tuple(FUSION_OBJECTIVES[name] for name in self._objectives)
+
+    def objective_vector(self) -> list[float]:
+        return list(self._vector)
+
     def create_input_file(self, solution) -> bool:
         try:
             return self._vmec.create_input_file(solution)
@@ -35,8 +72,19 @@ class ProblemFusion(ProblemBase):
         try:
             self._runtime.logger.debug("Start solving Fusion problem")
 
+            self._vector = [math.nan] * len(self._objectives)
             self.create_input_file(solution)
-            solution.value = self.execute_configuration()
+            if self._mock is not None:
+                solution.value = self._mock.evaluate(solution)
+                if self._objectives and math.isfinite(solution.value):
+                    self._vector = self._mock.objective_vector(
+                        solution.get_parameters(), self.objective_maximize
+                    )
+            else:
+                self._vmec.prepare_warm_start(solution)
+                solution.value = self.execute_configuration()
+                if self._objectives and math.isfinite(solution.value):
+                    self._vector = self._vmec.objective_values(self._objectives)
 
             self._runtime.logger.debug("Finished solving Fusion problem")
 
@@ -3,15 +3,22 @@
 
 import math
 
+import numpy as np
+
 from problems.ProblemBase import ProblemBase
 
 
 class ProblemNonSeparable(ProblemBase):
+    MOCK_REQUIRES_CONFIG = True
+
     def __init__(self, runtime, comms):
         super().__init__(runtime, comms)
 
     # this implements Rosenbrock's Function
     def solve(self, solution) -> None:
+        if self._mock is not None:
+            solution.value = self._mock.evaluate(solution)
+            return
         try:
             parameters = solution.get_parameters_values()
             val = 0.0
@@ -26,6 +33,14 @@ class ProblemNonSeparable(ProblemBase):
                 "ProblemNonSeparable. Exception while solving"
             )
 
+    # Rosenbrock's Function over every row of values (K x P)
+    def solve_batch(self, values):
+        x = np.asarray(values, dtype=np.float64)
+        if x.ndim != 2:
+            raise ValueError(f"Expected a K x P array of values, got shape {x.shape}")
+        head, tail = x[:, :-1], x[:, 1:]
+        return np.sum(100.0 * (head * head - tail) ** 2 + (head + 1.0) ** 2, axis=1)
+
     def extractSolution(self) -> tuple[float, float]:
         raise NotImplementedError("Extract solution abstract problem")
 
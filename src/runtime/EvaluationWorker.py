@@ -1,31 +1,23 @@
 #!/usr/bin/env python
 
+import signal
 from array import array
 from copy import deepcopy
-from time import time
 
+import numpy as np
 from mpi4py import MPI
 
 from core.comms import GlobalComms
-from core.enums import ProblemType, Tags
+from core.enums import Tags
+from core.instrumentation import get_instrumentation, span
+from core.logging import RateLimitedLogger
+from core.registry import PROBLEM_TYPE_REGISTRY
 from core.runtime import GlobalRuntime
 from problems.ProblemBase import ProblemBase
-from problems.ProblemCristina import ProblemCristina
-from problems.ProblemFusion import ProblemFusion
-from problems.ProblemNonSeparable import ProblemNonSeparable
-from solution.SolutionCristina import SolutionCristina
-from solution.SolutionFusion import SolutionFusion
-from solution.SolutionNonSeparable import SolutionNonSeparable
-
-PROBLEM_TYPE_REGISTRY = {
-    ProblemType.FUSION: (ProblemFusion, SolutionFusion),
-    ProblemType.NONSEPARABLE: (ProblemNonSeparable, SolutionNonSeparable),
-    ProblemType.CRISTINA: (ProblemCristina, SolutionCristina),
-}
 
 
 class EvaluationWorker:
-    _problem: ProblemBase | ProblemFusion | ProblemNonSeparable | ProblemCristina
+    _problem: ProblemBase
 
     def __init__(self, runtime: GlobalRuntime, comm: GlobalComms):
         try:
@@ -36,6 +28,9 @@ class EvaluationWorker:
 
             self._end = array("i", [0])
             self._requestsEnd: list[MPI.Request] = []
+            self._sampledLog = RateLimitedLogger(
+                runtime.logger, runtime.log_sample_interval
+            )
 
             if self._runtime.problem_type in PROBLEM_TYPE_REGISTRY:
                 problem_cls, _ = PROBLEM_TYPE_REGISTRY[self._runtime.problem_type]
@@ -46,37 +41,35 @@ class EvaluationWorker:
             self._runtime.logger.exception("Worker initialization failed")
             raise
 
+    # The driver decides when the run ends (see SolverDAB drain protocol), so
+    # scheduler signals must not interrupt the evaluation in progress
+    def handle_signal(self, signum, frame):
+        pass
+
     # This is the worker. It sends a request for data, then receives
     # a solution and the bee index.
-    # Solves the solution and sends the solution back to the driver
+    # Solves the solution and sends the solution back to the driver.
+    # It stops when the driver answers a request with a TERMINATE message
     def run(self):
         try:
-            start_time = self._runtime.start_time
-            elapsed_time = 0
             solutions_evaluated = 0
+            for signum in (signal.SIGTERM, signal.SIGUSR1):
+                signal.signal(signum, self.handle_signal)
+
+            _, solution_cls = PROBLEM_TYPE_REGISTRY[self._runtime.problem_type]
+            template = solution_cls.get_template_data(self._runtime, self._comm)
+            # Analytic problems evaluate the received values directly, without
+            # building a solution for every candidate
+            batch = self._problem.batch_capable
+            # Multi-objective problems also send their objective vector
+            multi_objective = bool(self._problem.objective_names)
+            num_params = solution_cls(
+                self._runtime, self._comm, data=deepcopy(template)
+            ).get_number_of_params()
 
-            # Send the finish message 10 minutes before the end time to allow
-            # the jobs that are still running to finish on time
             while True:
-                elapsed_time = time() - start_time
-
-                if elapsed_time + 300 >= float(self._runtime.max_execution_time):
-                    break
-                self._runtime.logger.debug(
-                    "Worker ("
-                    + str(self._rank)
-                    + "). Elapsed "
-                    + str(elapsed_time)
-                    + " - Runtime "
-                    + str(self._runtime)
-                )
                 # Send a request for data
                 status = MPI.Status()
-                _, solution_cls = PROBLEM_TYPE_REGISTRY[self._runtime.problem_type]
-                template = solution_cls.get_template_data(self._runtime, self._comm)
-                solution = solution_cls(
-                    self._runtime, self._comm, data=deepcopy(template)
-                )
 
                 """
                 if self._runtime.problem_type == ProblemType.FUSION:
@@ -106,53 +99,83 @@ class EvaluationWorker:
                         f"Unknown problem type: {self._runtime.problem_type}"
                     )
                 """
-                num_params = solution.get_number_of_params()
                 buff = array("f", [0]) * num_params
                 solution_value = array("f", [0]) * 1
                 wait_signal = array("i", [0]) * 1
                 self._runtime.logger.debug(
-                    "Worker (" + str(self._rank) + "). Waiting for a solution"
+                    "Worker ( %d ). Waiting for a solution", self._rank
                 )
                 self._comm.comm.Send(wait_signal, dest=0, tag=Tags.REQINPUT)
 
-                agent_idx = array("i", [0]) * 1
-                # Receive the solution
-                req = self._comm.comm.Irecv(buff, 0, Tags.RECVFROMDRIVER)
-                req.wait(status)
-
-                # Receive the bee id
-                req = self._comm.comm.Irecv(agent_idx, 0, Tags.RECVFROMDRIVER)
-                req.wait(status)
+                # Time spent idle, waiting for the driver
+                with span("mpi.wait.candidate"):
+                    self._comm.comm.Probe(source=0, tag=MPI.ANY_TAG, status=status)
+                if status.tag == Tags.TERMINATE:
+                    self._comm.comm.Recv(wait_signal, 0, Tags.TERMINATE)
+                    self._runtime.logger.debug(
+                        "Worker ( %d ). Termination received", self._rank
+                    )
+                    break
 
-                self._runtime.logger.info(
-                    f"Worker ( {self._rank} ). Received a solution to evaluate from bee {agent_idx[0]}"
+                agent_idx = array("i", [0]) * 1
+                with span("mpi.recv.candidate"):
+                    # Receive the solution
+                    req = self._comm.comm.Irecv(buff, 0, Tags.RECVFROMDRIVER)
+                    req.wait(status)
+
+                    # Receive the bee id
+                    req = self._comm.comm.Irecv(agent_idx, 0, Tags.RECVFROMDRIVER)
+                    req.wait(status)
+
+                self._sampledLog.info(
+                    "worker.received",
+                    "Worker ( %d ). Received a solution to evaluate from bee %d",
+                    self._rank,
+                    agent_idx[0],
                 )
-                solution.set_parameters_values(buff)
-
                 # Evalute the solution
-                self._problem.solve(solution)
-
-                buff = solution.get_parameters_values()
-                solution_value[0] = float(solution.value)
+                if batch:
+                    with span("worker.solve"):
+                        values = np.frombuffer(buff, dtype=np.float32)[np.newaxis, :]
+                        solution_value[0] = float(self._problem.solve_batch(values)[0])
+                else:
+                    solution = solution_cls(
+                        self._runtime, self._comm, data=deepcopy(template)
+                    )
+                    solution.set_parameters_values(buff)
+                    with span("worker.solve"):
+                        self._problem.solve(solution)
+                    buff = solution.get_parameters_values()
+                    solution_value[0] = float(solution.value)
 
                 # Send the solution back together with the bee id
-                req = self._comm.comm.Isend(
-                    [wait_signal, MPI.INT], 0, Tags.REQSENDINPUT
-                )
-                req.Wait(status)
-
-                self._runtime.logger.debug(
-                    f"Worker ( {self._rank} ). Buffer size: {len(buff)}"
-                )
-                self._runtime.logger.info(
-                    f"Worker ( {self._rank} ). Found solution with value {solution_value[0]} sent by bee {agent_idx[0]}"
+                with span("mpi.wait.driver"):
+                    req = self._comm.comm.Isend(
+                        [wait_signal, MPI.INT], 0, Tags.REQSENDINPUT
+                    )
+                    req.Wait(status)
+
+                self._sampledLog.info(
+                    "worker.found",
+                    "Worker ( %d ). Found solution with value %s sent by bee %d",
+                    self._rank,
+                    solution_value[0],
+                    agent_idx[0],
                 )
 
-                self._comm.comm.Send(buff, 0, Tags.COMMSOLUTION)
-                self._comm.comm.Send(solution_value, 0, Tags.COMMSOLUTION)
-                self._comm.comm.Send(agent_idx, 0, Tags.COMMSOLUTION)
+                with span("mpi.send.solution"):
+                    self._comm.comm.Send(buff, 0, Tags.COMMSOLUTION)
+                    self._comm.comm.Send(solution_value, 0, Tags.COMMSOLUTION)
+                    self._comm.comm.Send(agent_idx, 0, Tags.COMMSOLUTION)
+                    if multi_objective:
+                        self._comm.comm.Send(
+                            array("d", self._problem.objective_vector()),
+                            0,
+                            Tags.COMMSOLUTION,
+                        )
 
                 solutions_evaluated += 1
+                get_instrumentation().count("evaluations.completed")
             self._runtime.logger.info(
                 f"Worker ( {self._rank} ). Configurations evaluated: {solutions_evaluated}"
             )
@@ -0,0 +1,180 @@
+#!/usr/bin/env python
+
+import math
+from bisect import bisect_left, bisect_right
+
+from core.comms import GlobalComms
+from core.enums import ObjectiveType
+from core.runtime import GlobalRuntime
+from solution.SolutionsQueue import SolutionsQueue
+
+
+class EliteSolutionsQueue(SolutionsQueue):
+    """
+    Priority queue of the best solutions found, kept apart in parameter space.
+
+    When niches are enabled (see set_niches), parameters are normalized by
+    their bounds and hashed onto a grid of cells niche_size wide; each cell
+    (niche) holds at most niche_capacity solutions. A solution enters the
+    queue if its niche has room, or replaces the worst solution of the niche
+    if it is better. The position of an entry is found by bisection of the
+    sorted values and its niche through a dictionary, so inserting never
+    walks the queue. Without niches, the queue keeps the diversity rule of
+    SolutionsQueue, based on the bees that produced the solutions.
+    """
+
+    def __init__(
+        self,
+        runtime: GlobalRuntime,
+        comms: GlobalComms,
+        solutions_file: str,
+        writeToFile: bool,
+    ):
+        self._nicheSize = 0.0
+        self._nicheCapacity = 1
+        # Sort key (lower is better) and niche of every entry, in queue order
+        self._keys: list[float] = []
+        self._cells: list[tuple[int, ...]] = []
+        # Sorted keys of the entries of each niche
+        self._niches: dict[tuple[int, ...], list[float]] = {}
+        self._bounds: list[tuple[float, float]] = []
+        super().__init__(runtime, comms, solutions_file, writeToFile, True)
+
+    @property
+    def niches_enabled(self) -> bool:
+        return self._nicheSize > 0.0
+
+    def set_niches(self, niche_size: float, niche_capacity: int = 1) -> None:
+        """
+        Enable niches of niche_size (a fraction of the range of every
+        parameter) holding niche_capacity solutions each; 0 disables them.
+        Entries already queued are filtered by the new niches.
+        """
+        self._nicheSize = float(niche_size)
+        self._nicheCapacity = max(1, int(niche_capacity))
+        self._bounds = []
+        for param in self._solutionBase.get_parameters():
+            low, high = float(param.min_value), float(param.max_value)
+            if math.isfinite(low) and math.isfinite(high) and high > low:
+                self._bounds.append((low, high - low))
+            else:
+                # Unbounded parameters are hashed on their raw value
+                self._bounds.append((0.0, 1.0))
+        self._reindex()
+
+    def niche(self, values) -> tuple[int, ...]:
+        """Return the grid cell of a parameter vector."""
+        return tuple(
+            math.floor((float(value) - low) / span / self._nicheSize)
+            for value, (low, span) in zip(values, self._bounds, strict=True)
+        )
+
+    def _key(self, value) -> float:
+        value = float(value)
+        return -value if self._runtime.objective == ObjectiveType.MAXIMIZE else value
+
+    @staticmethod
+    def _values(sol: str) -> list[float]:
+        return [float(p.split(":")[1]) for p in sol.split(",")]
+
+    def _forget(self, position: int) -> None:
+        key = self._keys.pop(position)
+        cell = self._cells.pop(position)
+        members = self._niches[cell]
+        members.pop(bisect_left(members, key))
+        if not members:
+            del self._niches[cell]
+
+    def _position_of(self, key: float, cell: tuple[int, ...]) -> int:
+        position = bisect_left(self._keys, key)
+        while self._cells[position] != cell:
+            position += 1
+        return position
+
+    def _insert(self, sol_tuple) -> bool:
+        key = self._key(sol_tuple[1])
+        cell = self.niche(self._values(sol_tuple[0]))
+        members = self._niches.get(cell, [])
+        if len(members) >= self._nicheCapacity:
+            if key >= members[-1]:
+                return False
+            worst = self._position_of(members[-1], cell)
+            self._queue.pop(worst)
+            self._forget(worst)
+        elif self.queue_size >= self._max_size:
+            if not self._keys or key >= self._keys[-1]:
+                return False
+            self._queue.pop()
+            self._forget(self.queue_size)
+
+        position = bisect_right(self._keys, key)
+        self._queue.insert(position, sol_tuple)
+        self._keys.insert(position, key)
+        self._cells.insert(position, cell)
+        members = self._niches.setdefault(cell, [])
+        members.insert(bisect_right(members, key), key)
+        return True
+
+    def _reindex(self) -> None:
+        entries = self._queue
+        self._queue = []
+        self._keys = []
+        self._cells = []
+        self._niches = {}
+        if not self.niches_enabled:
+            self._queue = entries
+            return
+        for sol_tuple in sorted(entries, key=lambda entry: self._key(entry[1])):
+            self._insert(sol_tuple)
+
+    def put_solution(
+        self,
+        solution,
+        value,
+        agent_idx,
+        sources: int = 3,
+    ) -> None:
+        if not self.niches_enabled:
+            super().put_solution(solution, value, agent_idx, sources)
+            return
+        if solution is None:
+            self._runtime.logger.warning(f"QUEUE. Solution is None. {self._filename}")
+            return
+
+        parameters = solution.get_parameters()
+        if len(parameters) != self._numParams:
+            self._runtime.logger.warning(
+                "QUEUE. Invalid number of parameters "
+                f"({len(parameters)} instead of {self._numParams})"
+            )
+            return
+
+        sol = ",".join(f"{param.index}:{param.value}" for param in parameters)
+        self._insert((sol, value, agent_idx))
+
+        if self._writeToFile:
+            with open(self._filename, "a", encoding="utf-8") as file:
+                file.write(f"{sol}#{value}#{agent_idx}\n")
+
+    def load_queue(self):
+        super().load_queue()
+        self._reindex()
+
+    def set_state(self, entries) -> None:
+        super().set_state(entries)
+        self._reindex()
+
+    @SolutionsQueue.max_size.setter
+    def max_size(self, maxS):
+        self._max_size = maxS
+        self._reindex()
+
+    def get_solution_tuple(self, remove=True):
+        if remove and self.niches_enabled and self.queue_size > 0:
+            self._forget(0)
+        return super().get_solution_tuple(remove)
+
+    def get_solution_list(self, remove=True, position=0):
+        if remove and self.niches_enabled and position < self.queue_size:
+            self._forget(position)
+        return super().get_solution_list(remove, position)
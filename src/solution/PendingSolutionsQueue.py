@@ -0,0 +1,146 @@
+#!/usr/bin/env python
+
+import time
+
+from core.comms import GlobalComms
+from core.runtime import GlobalRuntime
+from solution.SolutionsQueue import SolutionsQueue
+
+
+class PendingSolutionsQueue(SolutionsQueue):
+    """
+    FIFO queue of candidates waiting to be evaluated.
+
+    Besides the regular queue entries, every candidate records the worker
+    it should preferably be sent to (the worker that evaluated its parent,
+    -1 for none), the time it was queued, the generation of the bee food
+    source it was derived from (-1 if it does not depend on one) and the
+    operator that created it (employed, onlooker, scout).
+    Candidates are indexed by preferred worker so the scheduler can find the
+    ones that match an idle worker without scanning the whole queue.
+    """
+
+    def __init__(
+        self,
+        runtime: GlobalRuntime,
+        comms: GlobalComms,
+        solutions_file: str,
+        writeToFile: bool,
+    ):
+        self._preferred: list[int] = []
+        self._queuedAt: list[float] = []
+        self._generation: list[int] = []
+        self._operator: list[str] = []
+        self._byWorker: dict[int, int] = {}
+        super().__init__(runtime, comms, solutions_file, writeToFile, False)
+
+    def _push_metadata(
+        self, preferred: int, generation: int = -1, operator: str = ""
+    ) -> None:
+        self._preferred.append(preferred)
+        self._queuedAt.append(time.monotonic())
+        self._generation.append(generation)
+        self._operator.append(operator)
+        self._byWorker[preferred] = self._byWorker.get(preferred, 0) + 1
+
+    def _pop_metadata(self, position: int) -> None:
+        preferred = self._preferred.pop(position)
+        self._queuedAt.pop(position)
+        self._generation.pop(position)
+        self._operator.pop(position)
+        self._byWorker[preferred] -= 1
+        if self._byWorker[preferred] == 0:
+            del self._byWorker[preferred]
+
+    def put_solution(
+        self,
+        solution,
+        value,
+        agent_idx,
+        sources: int = 3,
+        preferred: int = -1,
+        generation: int = -1,
+        operator: str = "",
+    ) -> None:
+        size = self.queue_size
+        super().put_solution(solution, value, agent_idx, sources)
+        if self.queue_size > size:
+            self._push_metadata(preferred, generation, operator)
+
+    def load_queue(self):
+        size = self.queue_size
+        super().load_queue()
+        for _ in range(self.queue_size - size):
+            self._push_metadata(-1)
+
+    def get_solution_tuple(self, remove=True):
+        result = super().get_solution_tuple(remove)
+        if remove:
+            self._pop_metadata(0)
+        return result
+
+    def get_solution_list(self, remove=True, position=0):
+        if remove and position < self.queue_size:
+            self._pop_metadata(position)
+        return super().get_solution_list(remove, position)
+
+    def get_state(self) -> list:
+        return [
+            (*sol_tuple, preferred)
+            for sol_tuple, preferred in zip(
+                super().get_state(), self._preferred, strict=True
+            )
+        ]
+
+    def set_state(self, entries) -> None:
+        super().set_state(entry[:3] for entry in entries)
+        self._preferred = []
+        self._queuedAt = []
+        self._generation = []
+        self._operator = []
+        self._byWorker = {}
+        # Generations are not restored: resumed candidates are never stale
+        for entry in entries:
+            self._push_metadata(int(entry[3]))
+
+    def parent_at(self, position: int) -> tuple[int, int]:
+        """Return the bee and source generation of the candidate at position."""
+        return self._queue[position][2], self._generation[position]
+
+    def operator_at(self, position: int) -> str:
+        """Return the operator that created the candidate at position."""
+        return self._operator[position]
+
+    def defer(self, position: int) -> None:
+        """
+        Move the candidate at position behind every other one. It no longer
+        depends on a source generation, so it is never deferred again.
+        """
+        entry = self._queue.pop(position)
+        preferred = self._preferred[position]
+        operator = self._operator[position]
+        self._pop_metadata(position)
+        self._queue.append(entry)
+        self._push_metadata(preferred, operator=operator)
+
+    def count_preferring(self, worker: int) -> int:
+        """Return the number of candidates whose preferred worker is worker."""
+        return self._byWorker.get(worker, 0)
+
+    """
+    Returns the position of the candidate that should be sent to worker:
+    the oldest one that prefers it, otherwise the oldest one without a
+    preference or that has waited more than max_wait seconds for its
+    preferred worker. Returns -1 if every candidate is reserved for another
+    worker.
+    """
+
+    def position_for(self, worker: int, max_wait: float) -> int:
+        if self.count_preferring(worker) > 0:
+            return self._preferred.index(worker)
+
+        now = time.monotonic()
+        for position, preferred in enumerate(self._preferred):
+            if preferred < 0 or now - self._queuedAt[position] >= max_wait:
+                return position
+        return -1
@@ -6,6 +6,9 @@ from abc import ABC, abstractmethod
 
 from core.enums import ObjectiveType
 
+# Relative tolerance used when checking parameter bounds
+BOUNDS_TOLERANCE = 1e-6
+
 
 class SolutionBase(ABC):
     @classmethod
@@ -83,6 +86,34 @@ class SolutionBase(ABC):
         """
         raise NotImplementedError(f"{self.__class__.__name__} must implement print()")
 
+    def check_feasibility(self, physics: bool = False) -> str | None:
+        """Run cheap checks that rule out a candidate before evaluating it.
+
+        The base implementation checks that every numeric parameter is
+        finite and inside its bounds. Subclasses add problem specific
+        checks when ``physics`` is True.
+
+        Args:
+            physics: Also run the (more expensive) problem specific checks
+
+        Returns:
+            None if the candidate is feasible, otherwise the rejection reason
+        """
+        for param in self.get_parameters():
+            if not param.is_numeric():
+                continue
+            value = float(param.value)
+            if not math.isfinite(value):
+                return "non-finite"
+            # Values travel as single precision, allow for the rounding
+            tolerance = BOUNDS_TOLERANCE * max(1.0, abs(value))
+            if (
+                value < float(param.min_value) - tolerance
+                or value > float(param.max_value) + tolerance
+            ):
+                return "bounds"
+        return None
+
     def isValid(self) -> bool:
         """Return whether the solution is valid."""
         return self._isValid
@@ -6,11 +6,19 @@ from solution.SolutionBase import SolutionBase
 
 
 class SolutionCristina(SolutionBase):
+    _template_data = None
+
+    @classmethod
+    def get_template_data(cls, runtime, comms):
+        if cls._template_data is None:
+            d = CristinaData(runtime)
+            d.initialize(runtime.input_file)
+            cls._template_data = d
+        return cls._template_data
+
     def __init__(self, runtime, comms, data):
         SolutionBase.__init__(self, runtime, comms, data)
-        # TODO: Implemement how data is initialized
-        self._data = CristinaData(runtime)
-        self._data.initialize(runtime.input_file)
+        self._data = data
         return
 
     def initialize(self, data):
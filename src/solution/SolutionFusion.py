@@ -1,11 +1,13 @@
 #!/usr/bin/env python
 
 
+import numpy as np
+
 from data.VMECData import VMECData
 from solution.SolutionBase import SolutionBase
 
-# Range for polynomial derivative check
-DERIVATIVE_CHECK_RANGE = range(-100, 100)
+# Normalized flux (s) points where the profiles are checked
+PROFILE_CHECK_GRID = np.linspace(0.0, 1.0, 201)
 
 
 class SolutionFusion(SolutionBase):
@@ -70,24 +72,59 @@ class SolutionFusion(SolutionBase):
         """Return the underlying VMEC data object."""
         return self._data
 
+    def _profile_coefficients(self, name):
+        """Return the power series coefficients of a profile, highest first.
+
+        Args:
+            name: Profile attribute of the VMEC data (am, ai or ac)
+        """
+        params = getattr(self._data, name, None) or []
+        coefficients = [float(p.value) for p in params if p.display]
+        return np.asarray(coefficients[::-1], dtype=np.float64)
+
     def check_pressure_derivative(self):
-        """Check if pressure derivative is non-positive across range.
+        """Check if pressure derivative is non-positive across the radius.
 
-        Evaluates the derivative of a polynomial (coefficients in parameter
-        values) at each point in the derivative check range. Returns True only
-        if the derivative is <= 0 at all points.
+        The pressure profile is the AM power series in the normalized
+        flux s, evaluated on ``PROFILE_CHECK_GRID``. Returns True only if
+        the derivative is <= 0 at all points.
 
         Returns:
             bool: True if derivative is non-positive everywhere, False otherwise
         """
-        values = self.get_parameters_values()
-        for v in DERIVATIVE_CHECK_RANGE:
-            derivative = 0.0
-            for i in range(1, len(values)):
-                derivative += pow(v, i - 1) * values[i] * i
-            if derivative > 0.0:
+        coefficients = self._profile_coefficients("am")
+        if coefficients.size < 2:
+            return True
+        derivative = np.polyval(np.polyder(coefficients), PROFILE_CHECK_GRID)
+        return bool(np.all(derivative <= 0.0))
+
+    def check_profiles(self):
+        """Check that the pressure is non-negative and all profiles finite.
+
+        Returns:
+            bool: True if the profiles are physically admissible
+        """
+        for name in ("am", "ai", "ac"):
+            coefficients = self._profile_coefficients(name)
+            if coefficients.size == 0:
+                continue
+            profile = np.polyval(coefficients, PROFILE_CHECK_GRID)
+            if not np.all(np.isfinite(profile)):
+                return False
+            if name == "am" and np.any(profile < 0.0):
                 return False
         return True
 
+    def check_feasibility(self, physics=False):
+        """Check bounds and, if requested, the pressure profile."""
+        reason = super().check_feasibility(physics)
+        if reason is not None or not physics:
+            return reason
+        if not self.check_profiles():
+            return "profile"
+        if not self.check_pressure_derivative():
+            return "pressure-derivative"
+        return None
+
     def print(self):
         pass
@@ -6,10 +6,19 @@ from solution.SolutionBase import SolutionBase
 
 
 class SolutionNonSeparable(SolutionBase):
+    _template_data = None
+
+    @classmethod
+    def get_template_data(cls, runtime, comms):
+        if cls._template_data is None:
+            d = NonSeparableData(runtime)
+            d.initialize(runtime.input_file)
+            cls._template_data = d
+        return cls._template_data
+
     def __init__(self, runtime, comms, data):
         SolutionBase.__init__(self, runtime, comms, data)
-        self._data = NonSeparableData(runtime)
-        self._data.initialize(runtime.input_file)
+        self._data = data
         return
 
     def get_parameters_values(self):
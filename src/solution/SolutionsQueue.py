@@ -6,11 +6,9 @@ import os
 
 from core.comms import GlobalComms
 from core.enums import ObjectiveType, SolutionType
+from core.registry import SOLUTION_TYPE_REGISTRY
 from core.runtime import GlobalRuntime
 from solution.SolutionBase import SolutionBase
-from solution.SolutionCristina import SolutionCristina
-from solution.SolutionFusion import SolutionFusion
-from solution.SolutionNonSeparable import SolutionNonSeparable
 
 
 class SolutionsQueue:
@@ -32,24 +30,16 @@ class SolutionsQueue:
         self._runtime = runtime
         self._comms = comms
 
-        solution_map = {
-            SolutionType.FUSION: (
-                SolutionFusion,
-                "Fusion",
-            ),
-            SolutionType.CRISTINA: (
-                SolutionCristina,
-                "Cristina",
-            ),
-            SolutionType.NONSEPARABLE: (
-                SolutionNonSeparable,
-                "Non-separable",
-            ),
+        solution_names = {
+            SolutionType.FUSION: "Fusion",
+            SolutionType.CRISTINA: "Cristina",
+            SolutionType.NONSEPARABLE: "Non-separable",
         }
 
-        solution_class, solution_name = solution_map.get(self._solType, (None, None))
+        solution_class = SOLUTION_TYPE_REGISTRY.get(self._solType)
+        solution_name = solution_names.get(self._solType, str(self._solType))
         assert solution_class is not None, (
-            f"Type {self._solType} is missing from solution_map"
+            f"Type {self._solType} is missing from SOLUTION_TYPE_REGISTRY"
         )
 
         try:
@@ -218,6 +208,20 @@ class SolutionsQueue:
     def get_all_solutions(self):
         return self._queue
 
+    """
+    Returns a copy of the queue entries, used for checkpoints
+    """
+
+    def get_state(self) -> list:
+        return [tuple(sol_tuple) for sol_tuple in self._queue]
+
+    """
+    Replaces the queue entries with the ones returned by get_state
+    """
+
+    def set_state(self, entries) -> None:
+        self._queue = [tuple(sol_tuple) for sol_tuple in entries]
+
     """
     Empties the queue and writes all it's content in a text file
     """
@@ -284,10 +288,10 @@ class SolutionsQueue:
     """
     if remove is true, it behaves as a regular queue, where the front of the
     queue is removed. If false, it just checks the front of the queue, but
-    doesn't remove anything
+    doesn't remove anything. position selects an entry other than the front
     """
 
-    def get_solution_list(self, remove=True):
+    def get_solution_list(self, remove=True, position=0):
         solution = []
         val = -1.0
         agent_idx = -1
@@ -295,27 +299,15 @@ class SolutionsQueue:
             if len(self._queue) == 0:
                 return val, agent_idx, solution
             if remove:
-                sol_tuple = self._queue.pop(0)
+                sol_tuple = self._queue.pop(position)
             else:
-                sol_tuple = self._queue[0]
+                sol_tuple = self._queue[position]
 
             val = float(sol_tuple[1])
             agent_idx = int(sol_tuple[2])
             # split to get each idx:val
-            parameters = sol_tuple[0].split(",")
-            # iterate through the elements in the list
-            self._runtime.logger.debug(
-                f"Queue. Number of parameters: {len(parameters)}"
-            )
-            for p in parameters:
-                parts = p.split(":")
-                if len(parts) == 0:
-                    self._runtime.logger.error(
-                        "Queue. Incorrect parameter received (empty)"
-                    )
-                    raise
-                self._runtime.logger.debug("Queue. Appending: " + str(p.split(":")[1]))
-                solution.append(float(p.split(":")[1]))
+            solution = [float(p.split(":")[1]) for p in sol_tuple[0].split(",")]
+            self._runtime.logger.debug("Queue. Number of parameters: %d", len(solution))
         except Exception:
             self._runtime.logger.exception("Queue. Error getting solution list")
             raise
@@ -363,17 +355,18 @@ class SolutionsQueue:
 
             temp_sum += increment
 
-            self._runtime.logger.debug(f"Queue. TempSum: {temp_sum}/{score}")
-
             if temp_sum > value:
                 params = [
                     float(param.split(":")[1]) for param in solution_str.split(",")
                 ]
 
                 self._runtime.logger.debug(
-                    "Queue. Returning solution in position "
-                    f"{index} / {temp_sum} / {value} / "
-                    f"{self.queue_size} / {total_val}"
+                    "Queue. Returning solution in position %d / %s / %s / %d / %s",
+                    index,
+                    temp_sum,
+                    value,
+                    self.queue_size,
+                    total_val,
                 )
 
                 self._solutionBase.set_parameters_values(params)
@@ -385,7 +378,7 @@ class SolutionsQueue:
                 )
 
         self._runtime.logger.debug(
-            f"Queue. Returning None. {value}/{total_val}/{temp_sum}"
+            "Queue. Returning None. %s/%s/%s", value, total_val, temp_sum
         )
 
         return None, None, None
@@ -0,0 +1,527 @@
+#!/usr/bin/env python
+
+"""
+Driver side of the DRIVERWORKER protocol, shared by SolverDAB and SolverSA.
+
+The driver keeps every worker busy with one job at a time: a parameter
+buffer and an index (the bee or chain that created it). Every dispatched job
+is tracked until its result arrives, so the driver can:
+  - Release workers whose requests fail and reissue their job, and reissue
+  the jobs of workers that exceed the evaluation timeout.
+  - Predict when to stop dispatching (drain) so the evaluations in progress
+  complete before the deadline.
+  - Answer the requests of idle workers with TERMINATE and wait for their
+  ENDSIM message before finishing, for at most deadlineGrace seconds after
+  the deadline.
+  - Write periodic run status snapshots.
+
+Subclasses decide what a reissued job is and add their own status fields.
+"""
+
+from __future__ import annotations
+
+import configparser
+import math
+import shutil
+import signal
+import time
+from abc import abstractmethod
+from array import array
+from collections import Counter
+from datetime import datetime
+
+from mpi4py import MPI
+
+from core.comms import GlobalComms
+from core.enums import CommModelType, SolutionType, Tags
+from core.instrumentation import span
+from core.logging import RateLimitedLogger, get_event_log
+from core.runtime import GlobalRuntime
+from core.status import StatusWriter
+from solution.SolutionBase import SolutionBase
+from solvers.SolverBase import SolverBase
+
+
+class DriverSolverBase(SolverBase):
+    """
+    Base class of the solvers that drive evaluation workers.
+
+    Entries of ``_inFlight`` are tuples whose first item is the dispatch
+    time; the rest is whatever the subclass needs to reissue the job.
+    """
+
+    _bestSolution: SolutionBase
+
+    def __init__(self, runtime: GlobalRuntime, comms: GlobalComms):
+        super().__init__(runtime, comms)
+        # default values
+        self._evaluationTimeout = 0.0
+        self._drainFactor = 1.5
+        self._drainMargin = 30.0
+        self._deadlineGrace = 60.0
+        self._statusWriter: StatusWriter | None = None
+        self._statusInterval = 30.0
+        self._lastStatus = (time.time(), 0)
+
+        self._evaluated = 0
+        self._failedEvaluations = 0
+        self._rejectedCandidates: Counter[str] = Counter()
+        self._busyTime = 0.0
+        self._bestHistory: list[tuple[float, float]] = []
+        self._evalDuration: float | None = None
+        self._draining = False
+        self._drainRequested = False
+
+        self._idleWorkers: list[int] = []
+        self._inFlight: dict[int, tuple] = {}
+        self._lostWorkers: set[int] = set()
+        # Workers whose job was reissued after evaluationTimeout
+        self._overdueWorkers: set[int] = set()
+        # Workers still running deadlineGrace seconds after the deadline
+        self._unfinishedWorkers: set[int] = set()
+        self._terminated: set[int] = set()
+        self._terminateRequests: list[MPI.Request] = []
+        self._terminateSignal = array("i", [0]) * 1
+        self._pastDeadline = False
+        self._reissued = 0
+        self._lateResults = 0
+        self._requestsEnd: list[MPI.Request] = [MPI.REQUEST_NULL] * comms.size
+        self._requestsInput: list[MPI.Request] = [MPI.REQUEST_NULL] * comms.size
+        self._requestSolution: list[MPI.Request] = [MPI.REQUEST_NULL] * comms.size
+        self._wait_signal = array("i", [0]) * 1
+
+        # Per-evaluation messages are sampled, run events go to the event log
+        self._sampledLog = RateLimitedLogger(
+            runtime.logger, runtime.log_sample_interval
+        )
+        self._events = get_event_log()
+
+    @property
+    def name(self) -> str:
+        return type(self).__name__
+
+    def read_driver_configuration(self, config: configparser.ConfigParser) -> None:
+        """
+        Read the [Algorithm] options of the driver (evaluationTimeout,
+        drainFactor, drainMargin, deadlineGrace) and, on rank 0, the [Status]
+        section.
+        """
+        algorithm = "Algorithm"
+        self._evaluationTimeout = config.getfloat(
+            algorithm, "evaluationTimeout", fallback=self._evaluationTimeout
+        )
+        self._drainFactor = config.getfloat(
+            algorithm, "drainFactor", fallback=self._drainFactor
+        )
+        self._drainMargin = config.getfloat(
+            algorithm, "drainMargin", fallback=self._drainMargin
+        )
+        self._deadlineGrace = config.getfloat(
+            algorithm, "deadlineGrace", fallback=self._deadlineGrace
+        )
+        if self._comms.rank == 0 and config.getboolean(
+            "Status", "enabled", fallback=False
+        ):
+            self._statusInterval = config.getfloat(
+                "Status", "interval", fallback=self._statusInterval
+            )
+            self._statusWriter = StatusWriter(
+                config.get("Status", "file", fallback="status.json"),
+                config.get("Status", "prometheusFile", fallback="") or None,
+                self._runtime.logger,
+            )
+
+    def open_driver(self) -> None:
+        """
+        Prepare the driver to talk to the workers: communication errors
+        (failed ranks) are reported as exceptions instead of aborting, so
+        the driver can carry on without them, scheduler signals start the
+        drain, and the requests for input and the ENDSIM messages of every
+        worker are posted.
+        """
+        self._comms.comm.Set_errhandler(MPI.ERRORS_RETURN)
+        for signum in (signal.SIGTERM, signal.SIGUSR1):
+            signal.signal(signum, self.handle_signal)
+        for i in range(self._comms.size):
+            if i == self._comms.rank:
+                continue
+            self._requestsEnd[i] = self._comms.comm.Irecv(
+                self._wait_signal, source=i, tag=Tags.ENDSIM
+            )
+            self._requestsInput[i] = self._comms.comm.Irecv(
+                self._wait_signal, source=i, tag=Tags.REQINPUT
+            )
+
+    """
+    Dispatch. Idle workers are collected from their requests for input; a
+    job is sent as the parameter buffer followed by its index, and the
+    requests for its result and for the next input are posted.
+    """
+
+    def collect_idle_workers(self) -> None:
+        status = MPI.Status()
+        flag = False
+        iters = 0
+        try:
+            while not flag and iters < 3:
+                with span("mpi.test.input"):
+                    idx, flag = MPI.Request.Testany(self._requestsInput, status)
+                iters += 1
+
+            while flag and idx >= 0:
+                if status.tag == Tags.REQINPUT:
+                    self._runtime.logger.debug(
+                        "DRIVER. Worker %d was waiting for a solution", status.source
+                    )
+                    self._idleWorkers.append(status.source)
+                idx, flag = MPI.Request.Testany(self._requestsInput, status)
+        except MPI.Exception:
+            self.release_failed_workers(self._requestsInput)
+
+    def send_job(self, destination: int, buff: array, index: array) -> None:
+        with span("mpi.send.candidate"):
+            # sends the parameters
+            self._comms.comm.Isend([buff, MPI.FLOAT], destination, Tags.RECVFROMDRIVER)
+            # sends the index of the bee or chain that created the job
+            self._comms.comm.Isend([index, MPI.INT], destination, Tags.RECVFROMDRIVER)
+            # adds a request for receiving the result
+            self._requestSolution[destination] = self._comms.comm.Irecv(
+                [self._wait_signal, MPI.INT], destination, Tags.REQSENDINPUT
+            )
+            # adds a request for sending more input
+            self._requestsInput[destination] = self._comms.comm.Irecv(
+                self._wait_signal, source=destination, tag=Tags.REQINPUT
+            )
+
+    """
+    Drain protocol. The driver keeps an exponentially weighted average of
+    the evaluation time and stops dispatching when the remaining time is
+    shorter than the predicted duration of one more evaluation (times
+    drainFactor, plus drainMargin for the final bookkeeping). Workers finish
+    their current evaluation and, once no work is in flight, each idle
+    worker receives a TERMINATE message. SIGTERM and SIGUSR1 (sent by batch
+    schedulers before killing a job) trigger an immediate drain; the handler
+    only sets flags, the main loop acts on them.
+
+    Evaluations cannot be interrupted. At the deadline, every worker that has
+    not been terminated yet is sent TERMINATE, so it stops as soon as its
+    current evaluation returns; results arriving after the deadline are
+    received and discarded. Workers that have not sent their ENDSIM
+    deadlineGrace seconds later are left behind as unfinished.
+    """
+
+    def handle_signal(self, signum, frame):
+        self._drainRequested = True
+
+    def record_duration(self, seconds: float) -> None:
+        if self._evalDuration is None:
+            self._evalDuration = seconds
+        else:
+            self._evalDuration = 0.8 * self._evalDuration + 0.2 * seconds
+
+    def should_drain(self) -> bool:
+        if self._drainRequested:
+            return True
+        remaining = self._runtime.max_execution_time - (
+            time.time() - self._runtime.start_time
+        )
+        predicted = (self._evalDuration or 0.0) * self._drainFactor
+        return remaining < predicted + self._drainMargin
+
+    def update_drain(self) -> None:
+        if not self._draining and self.should_drain():
+            self._draining = True
+            self._runtime.logger.info(
+                f"{self.name}. Draining: {len(self._inFlight)} evaluations in "
+                f"flight (average evaluation time {self._evalDuration or 0.0:.1f} s)"
+            )
+
+    def terminate_idle_workers(self) -> None:
+        if self._inFlight:
+            return
+        for worker in list(self._idleWorkers):
+            # Workers terminated at the deadline ask for input once more
+            if worker not in self._terminated:
+                try:
+                    self._comms.comm.Send(
+                        [self._terminateSignal, MPI.INT], worker, Tags.TERMINATE
+                    )
+                except MPI.Exception:
+                    self.release_worker(worker, "cannot send the termination message")
+                    continue
+                self._terminated.add(worker)
+                self._runtime.logger.debug(
+                    "%s. Worker %d terminated", self.name, worker
+                )
+            self._idleWorkers.remove(worker)
+
+    def stop_at_deadline(self, elapsed: float) -> None:
+        if not self._pastDeadline:
+            self._pastDeadline = True
+            running = [
+                worker
+                for worker, request in enumerate(self._requestsEnd)
+                if request != MPI.REQUEST_NULL and worker not in self._terminated
+            ]
+            self._runtime.logger.warning(
+                f"{self.name}. Deadline reached, terminating workers {running} "
+                f"after their current evaluation (grace {self._deadlineGrace} s)"
+            )
+            for worker in running:
+                try:
+                    self._terminateRequests.append(
+                        self._comms.comm.Isend(
+                            [self._terminateSignal, MPI.INT], worker, Tags.TERMINATE
+                        )
+                    )
+                except MPI.Exception:
+                    self.release_worker(worker, "cannot send the termination message")
+                    continue
+                self._terminated.add(worker)
+        elif elapsed >= self._runtime.max_execution_time + self._deadlineGrace:
+            for worker, request in enumerate(self._requestsEnd):
+                if request != MPI.REQUEST_NULL:
+                    self._runtime.logger.error(
+                        f"{self.name}. Worker {worker} still running "
+                        f"{self._deadlineGrace} s after the deadline"
+                    )
+                    self._unfinishedWorkers.add(worker)
+                    self.cancel_requests(worker)
+                    self._inFlight.pop(worker, None)
+
+    def check_finish(self):
+        try:
+            if self._runtime.comm_model != CommModelType.DRIVERWORKER:
+                return self.should_drain()
+            # first check if it's too early to finish
+            elapsedTime = time.time() - self._runtime.start_time
+            if not self._draining:
+                return False
+            if elapsedTime >= self._runtime.max_execution_time:
+                self.stop_at_deadline(elapsedTime)
+            all_null = all(request == MPI.REQUEST_NULL for request in self._requestsEnd)
+            if all_null:
+                self._runtime.logger.debug(
+                    "%s [Driver]. All workers have finished", self.name
+                )
+                return True
+            status = MPI.Status()
+            idx, flag = MPI.Request.Testany(self._requestsEnd, status)
+            if flag and idx >= 0:
+                source = status.source
+                self._requestsEnd[source] = MPI.REQUEST_NULL
+                self._runtime.logger.info(
+                    f"{self.name} [Driver]. Received a termination request from "
+                    f"worker {source}"
+                )
+            return False
+        except Exception:
+            self._runtime.logger.exception(f"{self.name} exception in finish check")
+            return True
+
+    """
+    Worker fault tolerance. A worker whose requests fail (ULFM-style error
+    reporting through MPI.ERRORS_RETURN) is considered lost: its pending
+    requests are cancelled and its job is handed to reissue. A worker that
+    exceeds evaluationTimeout may only be slow: its job is reissued, but its
+    requests stay posted, so its late result is received (and discarded)
+    and the worker carries on.
+    """
+
+    def check_workers(self):
+        if self._evaluationTimeout <= 0.0:
+            return
+        now = time.time()
+        for worker, (dispatched, *_) in list(self._inFlight.items()):
+            if now - dispatched > self._evaluationTimeout:
+                self._runtime.logger.warning(
+                    f"{self.name}. Worker {worker} overdue: no result after "
+                    f"{now - dispatched:.0f} s, reissuing its job"
+                )
+                self._overdueWorkers.add(worker)
+                self.reissue(self._inFlight.pop(worker))
+                self._reissued += 1
+
+    def discard_result(self, origin: int) -> bool:
+        """
+        Return whether the result just received from origin is discarded:
+        its job was reissued after evaluationTimeout, or it arrived after
+        the deadline.
+        """
+        if origin not in self._overdueWorkers and not self._pastDeadline:
+            return False
+        self._overdueWorkers.discard(origin)
+        self._inFlight.pop(origin, None)
+        self._lateResults += 1
+        self._runtime.logger.info(
+            f"{self.name}. Late result from worker {origin} discarded"
+        )
+        return True
+
+    def release_failed_workers(self, requests):
+        for worker, req in enumerate(requests):
+            if req == MPI.REQUEST_NULL:
+                continue
+            try:
+                # Unlike Test, Get_status does not consume a completed request
+                req.Get_status()
+            except MPI.Exception as err:
+                self.release_worker(worker, f"communication error ({err})")
+
+    def release_worker(self, worker: int, reason: str):
+        self._runtime.logger.error(f"{self.name}. Worker {worker} lost: {reason}")
+        self._lostWorkers.add(worker)
+        self._overdueWorkers.discard(worker)
+        self.cancel_requests(worker)
+        if worker in self._inFlight:
+            self.reissue(self._inFlight.pop(worker))
+            self._reissued += 1
+
+    def cancel_requests(self, worker: int) -> None:
+        for requests in (self._requestSolution, self._requestsInput, self._requestsEnd):
+            req = requests[worker]
+            if req != MPI.REQUEST_NULL:
+                try:
+                    req.Cancel()
+                except MPI.Exception:
+                    pass
+            requests[worker] = MPI.REQUEST_NULL
+        if worker in self._idleWorkers:
+            self._idleWorkers.remove(worker)
+
+    @abstractmethod
+    def reissue(self, job: tuple) -> None:
+        """Give the in-flight entry of a released worker to another one."""
+
+    @property
+    def lost_workers(self) -> set[int]:
+        return set(self._lostWorkers)
+
+    @property
+    def unfinished_workers(self) -> set[int]:
+        return set(self._unfinishedWorkers)
+
+    def is_valid_value(self, value: float) -> bool:
+        return (
+            math.isfinite(value)
+            and value > 0.0
+            and value < self._runtime.max_valid_solution_value / 100.0
+        )
+
+    """
+    Output files produced by a worker for the configuration it just evaluated,
+    as (path, name) pairs. Only the fusion problem produces output files.
+    """
+
+    def evaluation_outputs(self, origin: int) -> list[tuple[str, str]]:
+        if (
+            self._runtime.mock
+            or origin < 0
+            or self._runtime.solution_type != SolutionType.FUSION
+        ):
+            return []
+        return [
+            (f"{origin}/threed1.tj{origin}", "threed1"),
+            (f"{origin}/wout_tj{origin}.txt", "wout"),
+            (f"{origin}/OUTPUT/results.av", "results"),
+        ]
+
+    def save_best_outputs(self, artifacts) -> None:
+        # TODO: this logic needs to be moved to VMECProcess or similar, to avoid having solver-specific code in the solver
+        if self._runtime.mock or self._runtime.solution_type != SolutionType.FUSION:
+            return
+        filenametime = datetime.now().strftime("%Y-%m-%d-%H:%M:%S:%f")[:-3]
+        self._bestSolution.prepare("input.best." + filenametime)
+        for path, name in artifacts:
+            try:
+                shutil.copyfile(path, f"{name}.best.{filenametime}")
+            except Exception:
+                self._runtime.logger.exception(
+                    f"{self.name}. Exception copying {name} for best solution"
+                )
+
+    """
+    Run status. Every statusInterval seconds the driver takes a snapshot of
+    the run (throughput, queue depths, worker usage, best values, failures
+    and remaining time) and hands it to a background writer, so the
+    scheduling loop never waits for the file system. Subclasses add their
+    own fields to the snapshot.
+    """
+
+    def get_status(self, finished: bool = False) -> dict:
+        now = time.time()
+        elapsed = now - self._runtime.start_time
+        lastTime, lastEvaluated = self._lastStatus
+        workers = max(0, self._comms.size - 1 - len(self._lostWorkers))
+        busyTime = self._busyTime + sum(now - job[0] for job in self._inFlight.values())
+        capacity = workers * elapsed
+        failures = {
+            f"rejected-{reason}": n for reason, n in self._rejectedCandidates.items()
+        }
+        failures["invalid-value"] = self._failedEvaluations
+        failures["reissued"] = self._reissued
+        failures["late-result"] = self._lateResults
+        failures["lost-worker"] = len(self._lostWorkers)
+        best = float(self._bestSolution.value)
+        return {
+            "finished": finished,
+            "draining": self._draining,
+            "elapsed_seconds": elapsed,
+            "eta_seconds": (
+                0.0
+                if finished
+                else max(0.0, self._runtime.max_execution_time - elapsed)
+            ),
+            "evaluations_total": self._evaluated,
+            "evaluations_per_second": self._evaluated / elapsed if elapsed > 0 else 0.0,
+            "recent_evaluations_per_second": (
+                (self._evaluated - lastEvaluated) / (now - lastTime)
+                if now > lastTime
+                else 0.0
+            ),
+            "mean_evaluation_seconds": self._evalDuration or 0.0,
+            "queues": {
+                "finished": self._finishedSolutions.queue_size,
+                "top": self._topSolutions.queue_size,
+            },
+            "workers": {
+                "busy": len(self._inFlight),
+                "idle": len(self._idleWorkers),
+                "overdue": len(self._overdueWorkers),
+                "lost": len(self._lostWorkers),
+            },
+            "worker_utilization": busyTime / capacity if capacity > 0 else 0.0,
+            "worker_idle_seconds": max(0.0, capacity - busyTime),
+            "best_value": best if self.is_valid_value(best) else None,
+            "best_trajectory": list(self._bestHistory),
+            "failures": failures,
+        }
+
+    def maybe_write_status(self) -> None:
+        if self._statusWriter is None:
+            return
+        now = time.time()
+        if now - self._lastStatus[0] < self._statusInterval:
+            return
+        status = self.get_status()
+        self._lastStatus = (now, self._evaluated)
+        self._statusWriter.submit(status)
+
+    def close_driver(self) -> None:
+        """
+        Write the final status snapshot and report the lost and unfinished
+        workers.
+        """
+        if self._statusWriter is not None:
+            self._statusWriter.submit(self.get_status(finished=True))
+            self._statusWriter.close()
+        if self._lostWorkers:
+            self._runtime.logger.warning(
+                f"{self.name}. Lost workers {sorted(self._lostWorkers)}, "
+                f"{self._reissued} jobs reissued"
+            )
+        if self._unfinishedWorkers:
+            self._runtime.logger.warning(
+                f"{self.name}. Workers {sorted(self._unfinishedWorkers)} did not "
+                f"finish, {self._lateResults} late results discarded"
+            )
@@ -4,7 +4,10 @@
 from abc import ABC, abstractmethod
 
 from core.comms import GlobalComms
+from core.enums import CommModelType
 from core.runtime import GlobalRuntime
+from solution.EliteSolutionsQueue import EliteSolutionsQueue
+from solution.PendingSolutionsQueue import PendingSolutionsQueue
 from solution.SolutionsQueue import SolutionsQueue
 
 
@@ -22,15 +25,40 @@ class SolverBase(ABC):
         self._runtime.logger.info(f"Initializing solver {self.__class__.__name__}")
 
         self._finishedSolutions: SolutionsQueue = SolutionsQueue(
-            runtime, comms, "finished.queue", writeToFile=True, isPriority=True
+            runtime,
+            comms,
+            self.queue_file("finished.queue"),
+            writeToFile=True,
+            isPriority=True,
         )
-        self._pendingSolutions: SolutionsQueue = SolutionsQueue(
-            runtime, comms, "pending.queue", writeToFile=False
+        self._pendingSolutions: PendingSolutionsQueue = PendingSolutionsQueue(
+            runtime, comms, self.queue_file("pending.queue"), writeToFile=False
         )
-        self._topSolutions: SolutionsQueue = SolutionsQueue(
-            runtime, comms, "top.queue", writeToFile=False, isPriority=True
+        self._topSolutions: EliteSolutionsQueue = EliteSolutionsQueue(
+            runtime, comms, self.queue_file("top.queue"), writeToFile=False
         )
 
+    def queue_file(self, name: str) -> str:
+        """
+        Return the file of a solutions queue. ALL2ALL ranks run their own
+        search in the same directory, so ranks other than 0 use
+        <name>.<rank>.queue.
+        """
+        if self._runtime.comm_model == CommModelType.ALL2ALL and self._comms.rank > 0:
+            stem, _, suffix = name.rpartition(".")
+            return f"{stem}.{self._comms.rank}.{suffix}"
+        return name
+
+    @property
+    def lost_workers(self) -> set[int]:
+        """Ranks whose communication failed during the run."""
+        return set()
+
+    @property
+    def unfinished_workers(self) -> set[int]:
+        """Ranks still evaluating when the driver stopped waiting for them."""
+        return set()
+
     @abstractmethod
     def initialize(self) -> None: ...
 
@@ -2,37 +2,49 @@
 
 
 import configparser
+import logging
 import math
 import random
 import shutil
 import time
 from array import array
+from collections import Counter, deque
 from datetime import datetime
+from pathlib import Path
 from copy import deepcopy
 
+import numpy as np
 from mpi4py import MPI
 
+from core.adaptive import OperatorBandit, adapt_rate
+from core.checkpoint import CheckpointWriter, read_checkpoint, write_checkpoint
 from core.comms import GlobalComms
-from core.enums import CommModelType, ObjectiveType, ProblemType, SolutionType, Tags
+from core.enums import CommModelType, ObjectiveType, ProblemType, Tags
+from core.eval_cache import (
+    STATUS_FAILED,
+    STATUS_OK,
+    EvaluationCache,
+    build_context,
+)
+from core.instrumentation import get_instrumentation, span
+from core.lattice import (
+    Lattice,
+    bin_count,
+    bin_value,
+    is_discrete,
+    neighbour_value,
+    random_bin_value,
+)
 from core.matrix import Matrix
+from core.pareto import ParetoArchive
+from core.registry import PROBLEM_TYPE_REGISTRY, type_key, type_name
 from core.runtime import GlobalRuntime
+from core.surrogate import RandomFeaturesRidge
 from data.Parameter import ParamType
 from problems.ProblemBase import ProblemBase
-from problems.ProblemCristina import ProblemCristina
-from problems.ProblemFusion import ProblemFusion
-from problems.ProblemNonSeparable import ProblemNonSeparable
 from solution.SolutionBase import SolutionBase
-from solution.SolutionCristina import SolutionCristina
-from solution.SolutionFusion import SolutionFusion
-from solution.SolutionNonSeparable import SolutionNonSeparable
 from solution.SolutionsQueue import SolutionsQueue
-from solvers.SolverBase import SolverBase
-
-PROBLEM_TYPE_REGISTRY = {
-    ProblemType.FUSION: (ProblemFusion, SolutionFusion),
-    ProblemType.NONSEPARABLE: (ProblemNonSeparable, SolutionNonSeparable),
-    ProblemType.CRISTINA: (ProblemCristina, SolutionCristina),
-}
+from solvers.DriverSolverBase import DriverSolverBase
 
 """
 Class that implements the DAB solver. It has to:
@@ -54,20 +66,19 @@ that created that solution and set the value for that solution in the bee
 
 
 class BeeBase:
-    _problem: ProblemBase | ProblemFusion | ProblemNonSeparable | ProblemCristina
-    _solution: SolutionBase | SolutionFusion | SolutionNonSeparable | SolutionCristina
-    _bestLocalSolution: (
-        SolutionBase | SolutionFusion | SolutionNonSeparable | SolutionCristina
-    )
-    _bestGlobalSolution: (
-        SolutionBase | SolutionFusion | SolutionNonSeparable | SolutionCristina
-    )
+    _problem: ProblemBase
+    _solution: SolutionBase
+    _bestLocalSolution: SolutionBase
+    _bestGlobalSolution: SolutionBase
 
     def __init__(self, runtime: GlobalRuntime, comms: GlobalComms, matrix: Matrix):
         random.seed()
         # Number of iterations since the local solution
         # was created
         self.iterations_since_update = 0
+        # Incremented every time the local solution is replaced, so that
+        # candidates derived from an older one can be recognised
+        self.generation = 0
         self._runtime = runtime
         self._comms = comms
         self._max_attempts = 1000
@@ -176,18 +187,16 @@ class BeeBase:
                     if ptype is ParamType.STRING:
                         continue
 
+                    elif is_discrete(param):
+                        new_value = bin_value(param, random.randrange(bin_count(param)))
+
                     elif ptype is ParamType.FLOAT:
                         minVal, maxVal = sorted((param.min_value, param.max_value))
 
                         if minVal == maxVal:
                             new_value = minVal
                         else:
-                            gap = param.gap
-
-                            if gap == 0.0:
-                                new_value = random.uniform(minVal, maxVal)
-                            else:
-                                new_value = self.randrange_float(minVal, maxVal, gap)
+                            new_value = random.uniform(minVal, maxVal)
 
                     elif ptype is ParamType.BOOL:
                         new_value = random.choice((True, False))
@@ -223,20 +232,7 @@ class BeeBase:
 
     def setSolution(self, solution):
         self._bestLocalSolution = solution
-
-    """
-    This function allows to create a random number between start and
-    stop, using a step of step
-    for example, we can call it like randrange_float (2.5, 4.0, 0.5) and
-    it will generate random numbers in the set 2.5, 3, 3.5, 4.0
-    """
-
-    def randrange_float(self, start, stop, step):
-        if start > stop:
-            start, stop = stop, start
-        if start == stop:
-            return start
-        return random.randint(0, int(abs((stop - start) / step))) * step + start
+        self.generation += 1
 
 
 """
@@ -267,34 +263,22 @@ class Employed(BeeBase):
         solutionCopy = solution
         try:
             parameters = solutionCopy.get_parameters()
-            numCols = self._matrix.get_num_cols()
-            for i in range(len(parameters)):
-                sumRow = 0.0
-                for j in range(numCols):
-                    sumRow += self._matrix.getitem(i, j)
-                if sumRow == numCols:
+            # Row i holds the weights of the bins of parameter i
+            for i, row in enumerate(self._matrix.array):
+                if i >= len(parameters) or not is_discrete(parameters[i]):
                     continue
-                # randomly select a position in the row. The larger the value, the
-                # higher the possibility for selecting a given row
-                val = random.uniform(numCols, sumRow)
-                tempSum = 0.0
-                selectedPos = -1
-                for j in range(numCols):
-                    tempSum += self._matrix.getitem(i, j)
-                    if tempSum >= val:
-                        selectedPos = j
-                        break
-                if selectedPos == -1:
-                    self._runtime.logger.warning(
-                        "getSolutionBasedOnMatrix couldn't select a position. "
-                        + str(val)
-                        + " -- "
-                        + str(sumRow)
-                    )
-                value = float(parameters[i].min_value) + float(selectedPos) * float(
-                    parameters[i].gap
+                weights = row[: bin_count(parameters[i])]
+                if np.all(weights == 1.0):
+                    continue
+                # randomly select a bin. The larger the value, the
+                # higher the possibility for selecting a given bin
+                cumulative = np.cumsum(weights)
+                selectedPos = int(
+                    np.searchsorted(cumulative, random.uniform(0.0, cumulative[-1]))
+                )
+                parameters[i].value = bin_value(
+                    parameters[i], min(selectedPos, len(weights) - 1)
                 )
-                parameters[i].value = value
             solutionCopy.set_parameters(parameters)
         except Exception:
             self._runtime.logger.exception("Error creating solution based on matrix")
@@ -331,7 +315,7 @@ class Employed(BeeBase):
                 parameters = solution.get_parameters()
 
                 for param in parameters:
-                    val = random.randint(0, self._probEmployedChange)
+                    val = random.randint(0, int(self._probEmployedChange))
 
                     if val != 0:
                         continue
@@ -342,35 +326,24 @@ class Employed(BeeBase):
                     if ptype is ParamType.STRING:
                         continue
 
-                    elif ptype is ParamType.FLOAT:
-                        currentVal = param.value
-
-                        gap = abs(param.gap)
-
-                        minVal = currentVal - 10.0 * gap
-                        maxVal = currentVal + 10.0 * gap
-
-                        minVal = max(param.min_value, minVal)
-                        maxVal = min(param.max_value, maxVal)
-
-                        minVal, maxVal = sorted((minVal, maxVal))
-
-                        if minVal == maxVal:
-                            new_value = minVal
+                    elif is_discrete(param):
+                        if ptype is ParamType.FLOAT or random.randint(0, 10) == 0:
+                            radius = 10
                         else:
-                            if gap == 0.0:
-                                new_value = random.uniform(minVal, maxVal)
-                            else:
-                                new_value = self.randrange_float(
-                                    minVal, maxVal, param.gap
-                                )
+                            radius = 5
+                        new_value = neighbour_value(param, param.value, radius)
+
+                    elif ptype is ParamType.FLOAT:
+                        # Without a gap the value is continuous and the search
+                        # range collapses to the current value
+                        new_value = param.value
 
                     elif ptype is ParamType.BOOL:
                         new_value = random.choice((True, False))
 
                     elif ptype is ParamType.INT:
                         currentVal = param.value
-                        gap = abs(param.gap)
+                        gap = abs(param.gap or 0.0)
 
                         if random.randint(0, 10) == 0:
                             minVal = currentVal - 10 * gap
@@ -466,6 +439,24 @@ class Onlooker(BeeBase):
         super().__init__(runtime, comms, matrix)
         self._modFactor = modFactor
         self._probOnlookerChange = probChange
+        # Multi-objective runs select sources from the Pareto front
+        self.archive: ParetoArchive | None = None
+
+    """
+    Chooses the food source to modify: a solution of the elite queue, with
+    a probability proportional to its value, or in multi-objective runs the
+    least crowded of two random members of the Pareto front. Returns
+    (solution, value, bee credited with it); solution is None if there is
+    nothing to choose from.
+    """
+
+    def select_source(self, topSolutions: SolutionsQueue, totalSumGoodSolutions):
+        if self.archive is not None and len(self.archive) > 0:
+            values, _, origin = self.archive.select()
+            self._solution.set_parameters_values(values)
+            return self._solution, None, origin
+        val = random.uniform(0.0, totalSumGoodSolutions)
+        return topSolutions.get_tuple_on_priority_by_value(val)
 
     def createNewCandidate(
         self,
@@ -477,9 +468,7 @@ class Onlooker(BeeBase):
     ):
         self._runtime.logger.debug("Create new candidate onlooker")
 
-        val = random.uniform(0.0, totalSumGoodSolutions)
-
-        solutionTuple = topSolutions.get_tuple_on_priority_by_value(val)
+        solutionTuple = self.select_source(topSolutions, totalSumGoodSolutions)
         base_solution = solutionTuple[0]
 
         if base_solution is None:
@@ -514,21 +503,22 @@ class Onlooker(BeeBase):
                         maxVal = min(param.max_value, maxNewVal)
                         minVal, maxVal = sorted((minVal, maxVal))
 
-                        if minVal == maxVal:
+                        if is_discrete(param):
+                            new_value = random_bin_value(param, minVal, maxVal)
+                        elif minVal == maxVal:
                             new_value = minVal
                         else:
-                            new_value = (
-                                random.uniform(minVal, maxVal)
-                                if not param.gap
-                                else self.randrange_float(minVal, maxVal, param.gap)
-                            )
+                            new_value = random.uniform(minVal, maxVal)
                     elif ptype is ParamType.BOOL:
                         new_value = random.choice((True, False))
 
+                    elif is_discrete(param):
+                        new_value = neighbour_value(param, param.value, 2, move=True)
+
                     elif ptype is ParamType.INT:
                         currentVal = param.value
-                        gap = abs(param.gap)
 
+                        gap = abs(param.gap or 0.0)
                         minVal = max(param.min_value, int(currentVal - 2 * gap))
                         maxVal = min(param.max_value, int(currentVal + 2 * gap))
                         minVal, maxVal = sorted((minVal, maxVal))
@@ -575,16 +565,31 @@ class Onlooker(BeeBase):
             raise
 
 
+def read_scheduling(config_file: str) -> str:
+    """Return the [Algorithm] scheduling of a configuration file."""
+    config = configparser.ConfigParser()
+    config.read(config_file)
+    scheduling = config.get("Algorithm", "scheduling", fallback="generational")
+    if scheduling not in ("generational", "steadyState"):
+        raise ValueError(f"Unknown scheduling: {scheduling}")
+    return scheduling
+
+
 """
 Solver DAB main class
 """
 
 
-class SolverDAB(SolverBase):
+class SolverDAB(DriverSolverBase):
     _probMatrix: Matrix
-    _problem: ProblemBase | ProblemFusion | ProblemNonSeparable | ProblemCristina
+    _problem: ProblemBase
 
     def __init__(self, runtime: GlobalRuntime, comms: GlobalComms):
+        # Checked before the base class creates the solution queues, which
+        # write their files when released
+        scheduling = "generational"
+        if comms.rank == 0:
+            scheduling = read_scheduling(runtime.config_file)
         super().__init__(runtime, comms)
         """
         probMatrix stores the probability for each parameter, for each
@@ -599,25 +604,56 @@ class SolverDAB(SolverBase):
         self._scout: BeeBase | None = None
         self._exectime = 0
         self._pendingSize = 10
+        self._steadyState = False
+        self._staleCandidates = "keep"
+        self._staleDropped = 0
+        self._staleDeferred = 0
+        # Bees owed a candidate for a returned result (-1: any employed bee)
+        self._readyBees: deque[int] = deque()
+        self._nextEmployed = 0
+        self._nextOnlooker = 0
         self._iterAbandoned = 10
-        self._probEmployedChange = 4
+        self._probEmployedChange: int | float = 4
         self._onlookerModFactor = 0.5
         self._probOnlookerChange: int | float = 50
         self._maxNumTopSolutions = 100
+        self._eliteNicheSize = 0.0
+        self._eliteNicheCapacity = 1
+        self._cache: EvaluationCache | None = None
+        self._surrogate: RandomFeaturesRidge | None = None
+        self._pareto: ParetoArchive | None = None
+        self._bandit: OperatorBandit | None = None
+        self._adaptiveWindow = 50
+        self._adaptiveTarget = 0.2
+        self._adaptiveFactor = 1.2
+        # Results and improvements of every operator in the current window
+        self._windowResults: Counter[str] = Counter()
+        self._windowImprovements: Counter[str] = Counter()
+        self._paretoFile = "pareto.json"
+        self._surrogateMinSamples = 20
+        self._surrogateKeepFraction = 0.5
+        self._surrogateExploration = 0.1
+        self._screenedOut = 0
+        self._checkFeasibility = False
+        self._checkPressure = False
+        self._feasibilityAttempts = 20
+        self._affinity = False
+        self._affinityWait = 60.0
+        self._beeWorker: dict[int, int] = {}
+        self._affinityMatches = 0
+        # In-flight jobs: dispatch time, bee index, parameters and operator
+        self._inFlight: dict[int, tuple[float, array, array, str]] = {}
+        self._checkpointRequested = False
+        self._checkpointFile = "dab.checkpoint"
+        self._checkpointInterval = 0.0
+        self._checkpointWriter: CheckpointWriter | None = None
+        self._lastCheckpoint = time.time()
 
         try:
             origin = -1
 
             self._totalSumGoodSolutions = 0.0
 
-            self._requestsEnd: list[MPI.Request] = []
-            self._requestsInput: list[MPI.Request] = []
-            self._requestSolution: list[MPI.Request] = []
-            for _ in range(self._comms.size):
-                self._requestSolution.append(MPI.REQUEST_NULL)
-
-            self._wait_signal = array("i", [0]) * 1
-
             self._bestSolution: SolutionBase
             self._bestGlobalSolution: SolutionBase
 
@@ -642,6 +678,7 @@ class SolverDAB(SolverBase):
                 raise ValueError(f"Unknown problem type: {self._runtime.problem_type}")
 
             self._numParams = self._bestSolution.get_number_of_params()
+            self._lattice = Lattice(self._bestSolution.get_parameters())
 
             # if top solutions is not empty, that means we have a best solution from the previous execution
             try:
@@ -708,11 +745,86 @@ class SolverDAB(SolverBase):
                         fallback=self._pendingSize,
                     )
 
+                    self._steadyState = scheduling == "steadyState"
+
+                    self._staleCandidates = config.get(
+                        "Algorithm",
+                        "staleCandidates",
+                        fallback=self._staleCandidates,
+                    )
+                    if self._staleCandidates not in ("keep", "defer", "drop"):
+                        raise ValueError(
+                            f"Unknown staleCandidates: {self._staleCandidates}"
+                        )
+
                     self._maxNumTopSolutions = config.getint(
                         "Algorithm",
                         "eliteQueue",
                         fallback=self._maxNumTopSolutions,
                     )
+                    self._eliteNicheSize = config.getfloat(
+                        "Algorithm", "eliteNicheSize", fallback=self._eliteNicheSize
+                    )
+                    self._eliteNicheCapacity = config.getint(
+                        "Algorithm",
+                        "eliteNicheCapacity",
+                        fallback=self._eliteNicheCapacity,
+                    )
+
+                    self._checkFeasibility = config.getboolean(
+                        "Algorithm",
+                        "feasibilityCheck",
+                        fallback=self._checkFeasibility,
+                    )
+                    self._checkPressure = config.getboolean(
+                        "Algorithm", "pressureCheck", fallback=self._checkPressure
+                    )
+                    self._feasibilityAttempts = max(
+                        1,
+                        config.getint(
+                            "Algorithm",
+                            "feasibilityAttempts",
+                            fallback=self._feasibilityAttempts,
+                        ),
+                    )
+
+                    # Warm-started evaluators keep the state of the parents
+                    self._affinity = config.getboolean(
+                        "Algorithm",
+                        "affinityScheduling",
+                        fallback=config.getboolean(
+                            "Fusion", "warm_start", fallback=self._affinity
+                        ),
+                    )
+                    self._affinityWait = config.getfloat(
+                        "Algorithm", "affinityWait", fallback=self._affinityWait
+                    )
+
+                    self.read_driver_configuration(config)
+                    self._checkpointFile = config.get(
+                        "Algorithm", "checkpointFile", fallback=self._checkpointFile
+                    )
+                    self._checkpointInterval = config.getfloat(
+                        "Algorithm",
+                        "checkpointInterval",
+                        fallback=self._checkpointInterval,
+                    )
+                    if self._checkpointInterval > 0.0:
+                        self._checkpointWriter = CheckpointWriter(
+                            self._checkpointFile, self._runtime.logger
+                        )
+
+                    if config.getboolean("Cache", "enabled", fallback=False):
+                        self.open_cache(config)
+
+                    if config.getboolean("Surrogate", "enabled", fallback=False):
+                        self.open_surrogate(config)
+
+                    if self._problem.objective_names:
+                        self.open_pareto(config)
+
+                    if config.getboolean("Adaptive", "enabled", fallback=False):
+                        self.open_adaptive(config)
 
                 except Exception:
                     self._runtime.logger.exception(
@@ -720,14 +832,16 @@ class SolverDAB(SolverBase):
                     )
                     raise
                 if self._useMatrix:
+                    # One row per parameter, one column per bin
                     self._probMatrix: Matrix = Matrix(
-                        self._bestSolution.get_max_number_of_values() + 1,
-                        self._bestSolution.get_number_of_params(),
-                        1.0,
+                        self._lattice.max_bins, self._lattice.size, 1.0
                     )
                 else:
                     self._probMatrix = Matrix(0, 0, 0.0)
                 self._topSolutions.max_size = self._maxNumTopSolutions
+                self._topSolutions.set_niches(
+                    self._eliteNicheSize, self._eliteNicheCapacity
+                )
                 """
                 Create bees
                 """
@@ -771,6 +885,9 @@ class SolverDAB(SolverBase):
                 Create only one scout. The scout creates a random solution, so
                 it is just called when needed
                 """
+                for bee in self._bees[self._nEmployed :]:
+                    bee.archive = self._pareto
+
                 self._scout = Scout(self._runtime, self._comms, self._probMatrix)
                 self._runtime.logger.info("Created 1 scout bee")
                 self.print_configuration()
@@ -778,6 +895,41 @@ class SolverDAB(SolverBase):
             self._runtime.logger.exception("SolverDAB exception during initialization")
             raise
 
+    def _new_solution(self) -> SolutionBase:
+        if self._runtime.problem_type not in PROBLEM_TYPE_REGISTRY:
+            raise ValueError(f"Unknown problem type: {self._runtime.problem_type}")
+        _, solution_cls = PROBLEM_TYPE_REGISTRY[self._runtime.problem_type]
+        template = solution_cls.get_template_data(self._runtime, self._comms)
+        return solution_cls(self._runtime, self._comms, deepcopy(template))
+
+    """
+    Opens the persistent evaluation cache. Entries are only reused when the
+    input template, the [Fusion] flags, the problem type and the mock flag
+    match the ones used to produce them.
+    """
+
+    def open_cache(self, config: configparser.ConfigParser) -> None:
+        context = build_context(
+            self._runtime.input_file,
+            self._runtime.config_file,
+            sections=("Fusion",),
+            extra=(
+                type_name(self._runtime.problem_type),
+                f"mock={self._runtime.mock}",
+            ),
+        )
+        artifacts_dir = None
+        if config.getboolean("Cache", "storeArtifacts", fallback=False):
+            artifacts_dir = config.get("Cache", "artifactsDir", fallback="cache")
+        self._cache = EvaluationCache(
+            config.get("Cache", "file", fallback="evaluations.sqlite"),
+            context,
+            artifacts_dir,
+        )
+        self._runtime.logger.info(
+            f"SolverDAB. Evaluation cache opened with {len(self._cache)} entries"
+        )
+
     def print_configuration(self):
         self._runtime.logger.info("SolverDAB configuration:")
         self._runtime.logger.info("   Number of scout bees: 1")
@@ -796,13 +948,46 @@ class SolverDAB(SolverBase):
             f"   Probability of change for onlooker bees: {self._probOnlookerChange}"
         )
         self._runtime.logger.info(f"   Use probability matrix: {self._useMatrix}")
+        self._runtime.logger.info(
+            f"   Adaptive operator control: {self._bandit is not None}"
+        )
         self._runtime.logger.info(f"   Execution time (seconds): {self._exectime}")
+        self._runtime.logger.info(
+            f"   Scheduling: {'steadyState' if self._steadyState else 'generational'}"
+        )
         self._runtime.logger.info(
             f"   Pending solutions queue size: {self._pendingSize}"
         )
+        self._runtime.logger.info(f"   Stale candidates: {self._staleCandidates}")
         self._runtime.logger.info(
             f"   Maximum number of top solutions stored: {self._maxNumTopSolutions}"
         )
+        self._runtime.logger.info(
+            f"   Elite niches: size {self._eliteNicheSize}, "
+            f"capacity {self._eliteNicheCapacity}"
+        )
+        self._runtime.logger.info(
+            f"   Feasibility pre-filter: {self._checkFeasibility} "
+            f"(pressure checks: {self._checkPressure})"
+        )
+        self._runtime.logger.info(f"   Evaluation cache: {self._cache is not None}")
+        self._runtime.logger.info(f"   Evaluation timeout: {self._evaluationTimeout} s")
+        self._runtime.logger.info(
+            f"   Checkpoint: {self._checkpointFile} "
+            f"(every {self._checkpointInterval} s, resume {self._runtime.resume})"
+        )
+        self._runtime.logger.info(
+            f"   Affinity scheduling: {self._affinity} (wait {self._affinityWait} s)"
+        )
+        self._runtime.logger.info(
+            f"   Surrogate pre-screening: {self._surrogate is not None}"
+        )
+        if self._surrogate is not None:
+            self._runtime.logger.info(
+                f"      Keep fraction: {self._surrogateKeepFraction}, "
+                f"exploration: {self._surrogateExploration}, "
+                f"min samples: {self._surrogateMinSamples}"
+            )
 
     """
     Initializer method (if needed)
@@ -812,35 +997,24 @@ class SolverDAB(SolverBase):
         self._runtime.logger.debug("SolverDAB. Initializing solver")
         try:
             if self._runtime.comm_model == CommModelType.DRIVERWORKER:
-                # initialises the lists of requests
-                for i in range(self._comms.size):
-                    self._requestsEnd.append(MPI.REQUEST_NULL)
-                    self._requestsInput.append(MPI.REQUEST_NULL)
-                for i in range(self._comms.size):
-                    if i == self._comms.rank:
-                        continue
-                    self._requestsEnd[i] = self._comms.comm.Irecv(
-                        self._wait_signal, source=i, tag=Tags.ENDSIM
-                    )
-                    self._requestsInput[i] = self._comms.comm.Irecv(
-                        self._wait_signal, source=i, tag=Tags.REQINPUT
-                    )
+                self.open_driver()
+
+                if self._runtime.resume:
+                    self.resume()
 
-                while self._pendingSolutions.queue_size < self._pendingSize:
+                # Steady state keeps one candidate per worker in flight
+                initialSize = (
+                    max(1, self._comms.size - 1)
+                    if self._steadyState
+                    else self._pendingSize
+                )
+                while self._pendingSolutions.queue_size < initialSize:
                     self._runtime.logger.debug(
                         "Creating initial solutions. Pending queue size: "
                         + str(self._pendingSolutions.queue_size)
                     )
                     self._pendingSolutions.put_solution(
-                        self._scout.createNewCandidate(
-                            self._pendingSolutions,
-                            self._finishedSolutions,
-                            self._probMatrix,
-                            self._topSolutions,
-                            self._totalSumGoodSolutions,
-                        )[0],
-                        -1.0,
-                        -1,
+                        self.create_scout_candidate(), -1.0, -1, operator="scout"
                     )
             self._runtime.logger.info(
                 "SolverDAB. Initialized. Created initial set of solutions"
@@ -855,139 +1029,626 @@ class SolverDAB(SolverBase):
     """
 
     def checkPendingSolutionsQueue(self):
+        if self._steadyState:
+            self.refill_steady_state()
+            return
         while self._pendingSolutions.queue_size < self._pendingSize:
             try:
-                for bee in range(len(self._bees)):
+                batch = []
+                for bee in self.pass_producers():
                     self._runtime.logger.debug(
-                        "Bee " + str(bee) + " putting solution on pending queue"
-                    )
-                    newSolution, beeIdx = self._bees[bee].createNewCandidate(
-                        self._pendingSolutions,
-                        self._finishedSolutions,
-                        self._probMatrix,
-                        self._topSolutions,
-                        self._totalSumGoodSolutions,
+                        "Bee %d putting solution on pending queue", bee
                     )
-                    if bee < self._nEmployed:
-                        beeIdx = bee
+                    newSolution, beeIdx, generation, operator = self.bee_candidate(bee)
                     if newSolution is None:
-                        newSolution = self._scout.createNewCandidate(
-                            self._pendingSolutions,
-                            self._finishedSolutions,
-                            self._probMatrix,
-                            self._topSolutions,
-                            self._totalSumGoodSolutions,
-                        )[0]
-                        self._pendingSolutions.put_solution(newSolution, -1.0, -1)
-                    else:
-                        self._pendingSolutions.put_solution(newSolution, -1.0, beeIdx)
+                        newSolution = self.create_scout_candidate()
+                        with span("queue.pending.put"):
+                            self._pendingSolutions.put_solution(
+                                newSolution, -1.0, -1, operator="scout"
+                            )
+                    elif self.is_feasible(newSolution, beeIdx):
+                        batch.append((newSolution, beeIdx, generation, operator))
+
+                self.put_candidates(batch)
 
                 # Check if there are abandoned solutions
                 for bee in range(self._nEmployed):
                     if self._bees[bee].iterations_since_update > self._iterAbandoned:
-                        self._runtime.logger.debug(
-                            "Bee " + str(bee) + ". Abandoning food source"
-                        )
-                        solution = self._scout.createNewCandidate(
-                            self._pendingSolutions,
-                            self._finishedSolutions,
-                            self._probMatrix,
-                            self._topSolutions,
-                            self._totalSumGoodSolutions,
-                        )[0]
-                        self._bees[bee].reset_iterations()
-                        self._bees[bee].setSolution(solution)
                         self._runtime.logger.debug(
                             "Scout bee putting solution on pending queue"
                         )
-                        self._pendingSolutions.put_solution(solution, -1.0, bee)
+                        self._pendingSolutions.put_solution(
+                            self.abandon(bee), -1.0, bee, operator="scout"
+                        )
             except Exception:
                 self._runtime.logger.exception(
                     "SolverDAB exception while checking pending solutions queue"
                 )
 
     """
-    This function checks if there are workers waiting for solutions to be evaluated.
+    Creates a candidate with bee. Employed bees are credited with their own
+    candidates, onlookers with the bee whose food source they modified.
+    Returns (candidate, credited bee, generation of the food source the
+    candidate was derived from, -1 for onlookers, which start from the elite
+    queue, operator), or a None candidate if an onlooker had no source to
+    choose from.
     """
 
-    def checkWaitingForSolutions(self):
-        status = MPI.Status()
-        flag = False
-        iters = 0
-        while not flag and iters < 3:
-            idx, flag = MPI.Request.Testany(self._requestsInput, status)
-            iters += 1
-
-        while flag and idx >= 0:
-            if status.tag == Tags.REQINPUT:
-                destination = status.source
-                try:
-                    self._runtime.logger.debug(
-                        "DRIVER. Worker "
-                        + str(destination)
-                        + " was waiting for a solution"
-                    )
-                    # Sends the front of the pending Solutions queue
-                    solTuple = self._pendingSolutions.get_solution_list()
-                    if self._pendingSolutions.queue_size == 0:
-                        self.checkPendingSolutionsQueue()
-                    while len(solTuple) < 3:
-                        solTuple = self._pendingSolutions.get_solution_list()
-                        if self._pendingSolutions.queue_size < 1:
-                            self._pendingSolutions.put_solution(
-                                self._scout.createNewCandidate(
-                                    self._pendingSolutions,
-                                    self._finishedSolutions,
-                                    self._probMatrix,
-                                    self._topSolutions,
-                                    self._totalSumGoodSolutions,
-                                )[0],
-                                -1.0,
-                                -1,
-                            )
+    def bee_candidate(self, bee: int):
+        beeType = "employed" if bee < self._nEmployed else "onlooker"
+        with span(f"candidate.{beeType}"):
+            newSolution, beeIdx = self._bees[bee].createNewCandidate(
+                self._pendingSolutions,
+                self._finishedSolutions,
+                self._probMatrix,
+                self._topSolutions,
+                self._totalSumGoodSolutions,
+            )
+        if bee < self._nEmployed:
+            return newSolution, bee, self._bees[bee].generation, beeType
+        return newSolution, beeIdx, -1, beeType
+
+    def put_candidates(self, batch) -> None:
+        for newSolution, beeIdx, generation, operator in self.screen_candidates(batch):
+            with span("queue.pending.put"):
+                self._pendingSolutions.put_solution(
+                    newSolution,
+                    -1.0,
+                    beeIdx,
+                    preferred=self.preferred_worker(beeIdx),
+                    generation=generation,
+                    operator=operator,
+                )
 
-                    beeIdx = array("i", [0]) * 1
-                    buff = array("f", [0]) * self._numParams
-                    try:
-                        beeIdx[0] = solTuple[1]
-                        # buff = solTuple[0].get_parameters_values()
-                        for i in range(len(buff)):
-                            buff[i] = float(solTuple[2][i])
-                            self._runtime.logger.debug(
-                                "Val param (" + str(i) + "): " + str(buff[i])
-                            )
-                    except Exception:
-                        self._runtime.logger.exception(
-                            f"SolverDAB exception preparing solution to send to worker {destination}"
+    """
+    Replaces the exhausted food source of employed bee with a random one,
+    which is returned to be evaluated.
+    """
+
+    def abandon(self, bee: int):
+        self._runtime.logger.debug("Bee " + str(bee) + ". Abandoning food source")
+        solution = self.create_scout_candidate()
+        self._bees[bee].reset_iterations()
+        self._bees[bee].setSolution(solution)
+        self._beeWorker.pop(bee, None)
+        return solution
+
+    """
+    Steady-state scheduling. Instead of refilling the pending queue with a
+    candidate from every bee at once, each returned result earns the bee it
+    is credited to exactly one new candidate, created with the latest state
+    of the queues and the matrix. The pending queue only holds as many
+    candidates as there are idle workers.
+    """
+
+    def refill_steady_state(self) -> None:
+        target = max(1, len(self._idleWorkers))
+        try:
+            while self._pendingSolutions.queue_size < target:
+                batch = []
+                for _ in range(target - self._pendingSolutions.queue_size):
+                    if self._nEmployed == 0:
+                        self._pendingSolutions.put_solution(
+                            self.create_scout_candidate(), -1.0, -1, operator="scout"
                         )
                         continue
-                    # sends the parameters
-                    self._comms.comm.Isend(
-                        [buff, MPI.FLOAT], destination, Tags.RECVFROMDRIVER
-                    )
-                    # sends the index of the bee that created the solution
-                    self._comms.comm.Isend(
-                        [beeIdx, MPI.INT], destination, Tags.RECVFROMDRIVER
-                    )
-                    # adds a request for receiving the solution
-                    req = self._comms.comm.Irecv(
-                        [self._wait_signal, MPI.INT], destination, Tags.REQSENDINPUT
-                    )
-                    self._requestSolution[destination] = req
-                    # adds a request for sending more input
-                    req = self._comms.comm.Irecv(
-                        self._wait_signal, source=destination, tag=Tags.REQINPUT
-                    )
-                    self._requestsInput[destination] = req
-                    self._runtime.logger.debug(
-                        "SolverDAB. Driver. Solution sent to worker " + str(destination)
-                    )
-                except Exception:
-                    self._runtime.logger.exception(
-                        f"SolverDAB exception exchanging solution with worker {destination}"
+                    bee = self.next_ready_bee()
+                    if self._bees[bee].iterations_since_update > self._iterAbandoned:
+                        self._pendingSolutions.put_solution(
+                            self.abandon(bee), -1.0, bee, operator="scout"
+                        )
+                        continue
+                    newSolution, beeIdx, generation, operator = self.bee_candidate(
+                        self.steady_state_producer(bee)
                     )
+                    if newSolution is None:
+                        self._pendingSolutions.put_solution(
+                            self.create_scout_candidate(), -1.0, -1, operator="scout"
+                        )
+                    elif self.is_feasible(newSolution, beeIdx):
+                        batch.append((newSolution, beeIdx, generation, operator))
+                    else:
+                        # Rejected by the pre-filter, the bee tries again
+                        self._readyBees.append(bee)
+                self.put_candidates(batch)
+        except Exception:
+            self._runtime.logger.exception(
+                "SolverDAB exception while refilling the pending queue"
+            )
 
-            idx, flag = MPI.Request.Testany(self._requestsInput, status)
+    """
+    Returns the employed bee owed the next candidate. Results that are not
+    credited to an employed bee (scouts, initial solutions) give the turn
+    to the employed bees in round robin.
+    """
+
+    def next_ready_bee(self) -> int:
+        bee = self._readyBees.popleft() if self._readyBees else -1
+        if 0 <= bee < self._nEmployed:
+            return bee
+        bee = self._nextEmployed
+        self._nextEmployed = (bee + 1) % self._nEmployed
+        return bee
+
+    """
+    Picks the bee that creates the candidate owed to employed bee: the bee
+    itself or the next onlooker, which chooses its food source from the
+    elite queue. Onlookers get a share of the candidates proportional to
+    their number or, with adaptive control, to their recent success.
+    """
+
+    def steady_state_producer(self, bee: int) -> int:
+        if self._nOnlooker > 0 and random.random() < self.onlooker_share():
+            bee = self.next_onlooker()
+        return bee
+
+    def onlooker_share(self) -> float:
+        if self._bandit is not None and self._nOnlooker > 0:
+            return self._bandit.probabilities()["onlooker"]
+        return self._nOnlooker / len(self._bees)
+
+    def next_onlooker(self) -> int:
+        bee = self._nEmployed + self._nextOnlooker
+        self._nextOnlooker = (self._nextOnlooker + 1) % self._nOnlooker
+        return bee
+
+    """
+    Bees that create a candidate in a generational refill: every bee once
+    or, with adaptive control, as many candidates as there are bees, split
+    between the employed bees and the onlookers (each in round robin) by
+    the operator bandit.
+    """
+
+    def pass_producers(self) -> list[int]:
+        if self._bandit is None or self._nEmployed == 0:
+            return list(range(len(self._bees)))
+        producers = []
+        for _ in range(len(self._bees)):
+            if self._bandit.choose() == "onlooker":
+                producers.append(self.next_onlooker())
+            else:
+                producers.append(self._nextEmployed)
+                self._nextEmployed = (self._nextEmployed + 1) % self._nEmployed
+        return producers
+
+    """
+    Adaptive operator control. Every result is credited to the operator
+    that created its candidate, as an improvement if it improved the food
+    source it was credited to. The bandit shifts the candidate mix towards
+    the operator with the best recent improvement rate, and every window
+    results of an operator its mutation strength follows the 1/5th success
+    rule: the probability of changing each parameter (and, for onlookers,
+    the modification factor) grows while more than targetRate of its
+    candidates improve, and shrinks otherwise.
+    """
+
+    def open_adaptive(self, config: configparser.ConfigParser) -> None:
+        self._bandit = OperatorBandit(
+            ["employed", "onlooker"] if self._nOnlooker > 0 else ["employed"],
+            p_min=config.getfloat("Adaptive", "pMin", fallback=0.1),
+            decay=config.getfloat("Adaptive", "decay", fallback=0.05),
+            seed=config.getint("Adaptive", "seed", fallback=None),
+        )
+        self._adaptiveWindow = max(
+            1, config.getint("Adaptive", "window", fallback=self._adaptiveWindow)
+        )
+        self._adaptiveTarget = config.getfloat(
+            "Adaptive", "targetRate", fallback=self._adaptiveTarget
+        )
+        self._adaptiveFactor = config.getfloat(
+            "Adaptive", "factor", fallback=self._adaptiveFactor
+        )
+
+    def reward_operator(self, operator: str, improved: bool) -> None:
+        if self._bandit is None or not operator:
+            return
+        self._bandit.update(operator, improved)
+        self._windowResults[operator] += 1
+        self._windowImprovements[operator] += int(improved)
+        if self._windowResults[operator] < self._adaptiveWindow:
+            return
+        rate = self._windowImprovements[operator] / self._windowResults[operator]
+        self._windowResults[operator] = 0
+        self._windowImprovements[operator] = 0
+        # The change probabilities are kept continuous, and only truncated
+        # where the bees draw randint(0, int(probChange)), so that repeated
+        # windows can move them back and forth
+        if operator == "employed":
+            change = adapt_rate(
+                1.0 / (self._probEmployedChange + 1),
+                rate,
+                0.01,
+                1.0,
+                self._adaptiveTarget,
+                self._adaptiveFactor,
+            )
+            self._probEmployedChange = 1.0 / change - 1.0
+        elif operator == "onlooker":
+            change = adapt_rate(
+                1.0 / (self._probOnlookerChange + 1),
+                rate,
+                0.01,
+                1.0,
+                self._adaptiveTarget,
+                self._adaptiveFactor,
+            )
+            self._probOnlookerChange = 1.0 / change - 1.0
+            self._onlookerModFactor = adapt_rate(
+                self._onlookerModFactor,
+                rate,
+                0.01,
+                1.0,
+                self._adaptiveTarget,
+                self._adaptiveFactor,
+            )
+        self.apply_mutation_rates()
+
+    def apply_mutation_rates(self) -> None:
+        for bee in self._bees[: self._nEmployed]:
+            bee._probEmployedChange = self._probEmployedChange
+        for bee in self._bees[self._nEmployed :]:
+            bee._probOnlookerChange = self._probOnlookerChange
+            bee._modFactor = self._onlookerModFactor
+
+    """
+    Feasibility pre-filter. Candidates that fail the cheap checks of their
+    solution type (bounds, pressure profile, ...) are rejected before they
+    enter the pending queue, and count as a failed trial for their bee.
+    """
+
+    def is_feasible(self, solution, beeIdx: int) -> bool:
+        if not self._checkFeasibility:
+            return True
+        reason = solution.check_feasibility(self._checkPressure)
+        if reason is None:
+            return True
+        self._rejectedCandidates[reason] += 1
+        if 0 <= beeIdx < self._nEmployed:
+            self._bees[beeIdx].increase_iterations()
+        self._runtime.logger.debug(f"SolverDAB. Candidate rejected ({reason})")
+        return False
+
+    def create_scout_candidate(self):
+        # Random solutions rarely satisfy every physics check, so after a
+        # few attempts the last one is sent anyway and the evaluator decides
+        for _ in range(self._feasibilityAttempts):
+            with span("candidate.scout"):
+                solution = self._scout.createNewCandidate(
+                    self._pendingSolutions,
+                    self._finishedSolutions,
+                    self._probMatrix,
+                    self._topSolutions,
+                    self._totalSumGoodSolutions,
+                )[0]
+            if self.is_feasible(solution, -1):
+                return solution
+        self._runtime.logger.debug(
+            f"SolverDAB. No feasible random solution after "
+            f"{self._feasibilityAttempts} attempts, using an infeasible one"
+        )
+        return solution
+
+    """
+    Surrogate pre-screening. The model is trained on every valid result and,
+    once it has seen enough samples, only the most promising fraction of each
+    batch of bee candidates is queued. A random share of the rejected ones is
+    kept anyway (exploration) so the model keeps learning outside the region
+    it favours. Rejected candidates count as a failed trial for their bee.
+    """
+
+    def open_surrogate(self, config: configparser.ConfigParser) -> None:
+        self._surrogateMinSamples = config.getint(
+            "Surrogate", "minSamples", fallback=self._surrogateMinSamples
+        )
+        self._surrogateKeepFraction = config.getfloat(
+            "Surrogate", "keepFraction", fallback=self._surrogateKeepFraction
+        )
+        self._surrogateExploration = config.getfloat(
+            "Surrogate", "exploration", fallback=self._surrogateExploration
+        )
+        if not 0.0 < self._surrogateKeepFraction <= 1.0:
+            raise ValueError(
+                f"keepFraction must be in (0, 1], got {self._surrogateKeepFraction}"
+            )
+
+        lower = []
+        upper = []
+        for param in self._bestSolution.get_parameters():
+            if param.is_numeric():
+                lower.append(float(param.min_value))
+                upper.append(float(param.max_value))
+            else:
+                lower.append(0.0)
+                upper.append(1.0)
+        self._surrogate = RandomFeaturesRidge(
+            lower,
+            upper,
+            n_features=config.getint("Surrogate", "features", fallback=256),
+            length_scale=config.getfloat("Surrogate", "lengthScale", fallback=0.2),
+            alpha=config.getfloat("Surrogate", "regularization", fallback=1e-3),
+        )
+
+        # Results from previous executions are used as initial training set
+        for sol_tuple in self._finishedSolutions.get_all_solutions():
+            value = float(sol_tuple[1])
+            if self.is_valid_value(value):
+                params = [float(p.split(":")[1]) for p in sol_tuple[0].split(",")]
+                self._surrogate.update(params, value)
+        self._runtime.logger.info(
+            f"SolverDAB. Surrogate initialized with {self._surrogate.n_samples} samples"
+        )
+
+    def screen_candidates(self, batch):
+        if (
+            self._surrogate is None
+            or self._surrogate.n_samples < self._surrogateMinSamples
+            or len(batch) < 2
+        ):
+            return batch
+
+        values = np.array(
+            [
+                np.asarray(entry[0].get_parameters_values(), dtype=np.float64)
+                for entry in batch
+            ]
+        )
+        predicted = self._surrogate.predict(values)
+        if self._runtime.objective == ObjectiveType.MAXIMIZE:
+            predicted = -predicted
+        order = np.argsort(predicted, kind="stable")
+        n_keep = max(1, math.ceil(self._surrogateKeepFraction * len(batch)))
+
+        selected = []
+        for rank, idx in enumerate(order):
+            beeIdx = batch[idx][1]
+            if rank < n_keep or random.random() < self._surrogateExploration:
+                selected.append(batch[idx])
+                continue
+            self._screenedOut += 1
+            if 0 <= beeIdx < self._nEmployed:
+                self._bees[beeIdx].increase_iterations()
+        return selected
+
+    """
+    Multi-objective runs. Workers report the objective vector of every
+    evaluation along with its value; the non-dominated ones are kept in a
+    Pareto archive, from which onlookers choose their sources by crowding
+    distance. The scalar value still drives the employed bees and the best
+    solution. With the evaluation cache, the vector is stored with the value
+    so repeated configurations reach the archive too.
+    """
+
+    def open_pareto(self, config: configparser.ConfigParser) -> None:
+        if self._runtime.comm_model != CommModelType.DRIVERWORKER:
+            self._runtime.logger.warning(
+                "SolverDAB. The Pareto archive needs the DRIVERWORKER model"
+            )
+            return
+        self._paretoFile = config.get("Pareto", "file", fallback=self._paretoFile)
+        self._pareto = ParetoArchive(
+            self._problem.objective_names,
+            self._problem.objective_maximize,
+            max_size=config.getint("Pareto", "archiveSize", fallback=100),
+            seed=config.getint("Pareto", "seed", fallback=None),
+        )
+
+    """
+    Pops the next candidate for worker destination from the pending queue
+    and converts it to the buffers sent to the workers, returned with the
+    operator that created it. Candidates already in the evaluation cache are
+    answered immediately and never reach a worker.
+    Returns None if the worker has to wait (affinity scheduling).
+    """
+
+    def next_candidate(self, destination: int = -1):
+        while True:
+            if self._pendingSolutions.queue_size == 0:
+                self.checkPendingSolutionsQueue()
+            if self._pendingSolutions.queue_size == 0:
+                self._pendingSolutions.put_solution(
+                    self.create_scout_candidate(), -1.0, -1, operator="scout"
+                )
+            position = 0
+            if self._affinity and destination >= 0:
+                position = self._pendingSolutions.position_for(
+                    destination, self._affinityWait
+                )
+                if position < 0:
+                    return None
+                if self._pendingSolutions.count_preferring(destination) > 0:
+                    self._affinityMatches += 1
+            if self.is_stale(position):
+                if self._staleCandidates == "drop":
+                    self._staleDropped += 1
+                    self._pendingSolutions.get_solution_list(position=position)
+                else:
+                    self._staleDeferred += 1
+                    self._pendingSolutions.defer(position)
+                continue
+            operator = self._pendingSolutions.operator_at(position)
+            with span("queue.pending.get"):
+                solTuple = self._pendingSolutions.get_solution_list(position=position)
+
+            beeIdx = array("i", [solTuple[1]])
+            buff = array("f", solTuple[2])
+            if self._runtime.logger.isEnabledFor(logging.DEBUG):
+                self._runtime.logger.debug(
+                    "SolverDAB. Candidate of bee %d: %s", beeIdx[0], list(buff)
+                )
+
+            _, entry = self.cache_lookup(buff)
+            if entry is None:
+                return beeIdx, buff, operator
+
+            self._sampledLog.info(
+                "cache.hit",
+                "SolverDAB. Cache hit (value %s, status %s)",
+                entry.value,
+                entry.status,
+            )
+            self._events.emit(
+                "cache_hit", bee=beeIdx[0], value=entry.value, status=entry.status
+            )
+            artifacts = [(path, Path(path).name) for path in entry.artifacts]
+            self.processSolution(
+                buff,
+                entry.value,
+                beeIdx[0],
+                artifacts,
+                objectives=self.cached_objectives(entry),
+                operator=operator,
+            )
+
+    """
+    Stale-candidate invalidation. A candidate derived from the food source
+    of an employed bee is stale once the bee has replaced that source
+    (improved or abandoned it) before the candidate is dispatched. Stale
+    candidates are dropped or deferred behind the fresh ones, depending on
+    staleCandidates; with keep they are dispatched as usual.
+    """
+
+    def is_stale(self, position: int) -> bool:
+        if self._staleCandidates == "keep":
+            return False
+        beeIdx, generation = self._pendingSolutions.parent_at(position)
+        return (
+            generation >= 0
+            and 0 <= beeIdx < self._nEmployed
+            and generation != self._bees[beeIdx].generation
+        )
+
+    """
+    Affinity scheduling. Each bee remembers the worker that evaluated its
+    current food source; candidates created from that source are queued
+    with that worker as their preferred destination, since it keeps the
+    output to warm-start from. Returns the worker, or -1 for no preference.
+    """
+
+    def preferred_worker(self, beeIdx: int) -> int:
+        if not self._affinity:
+            return -1
+        return self._beeWorker.get(beeIdx, -1)
+
+    """
+    This function checks if there are workers waiting for solutions to be
+    evaluated. Their requests are recorded and served by dispatch_candidates.
+    """
+
+    def checkWaitingForSolutions(self):
+        self.collect_idle_workers()
+        self.dispatch_candidates()
+
+    """
+    Sends a pending candidate to every idle worker. A worker is sent the
+    oldest candidate that prefers it; otherwise, candidates reserved for a
+    busy worker are held for at most affinityWait seconds before any idle
+    worker can take them, and the worker stays idle until then.
+    """
+
+    def dispatch_candidates(self):
+        if self._draining:
+            self.terminate_idle_workers()
+            return
+        for destination in list(self._idleWorkers):
+            # A fast worker can ask for more work before the driver has
+            # received its previous result; re-posting its receive request
+            # now would lose that result
+            if self._requestSolution[destination] != MPI.REQUEST_NULL:
+                continue
+            try:
+                candidate = self.next_candidate(destination)
+            except Exception:
+                self._runtime.logger.exception(
+                    f"SolverDAB exception preparing solution to send to worker {destination}"
+                )
+                continue
+            if candidate is None:
+                continue
+            self._idleWorkers.remove(destination)
+            beeIdx, buff, operator = candidate
+            try:
+                self.send_job(destination, buff, beeIdx)
+                self._inFlight[destination] = (time.time(), beeIdx, buff, operator)
+                self._runtime.logger.debug(
+                    "SolverDAB. Driver. Solution sent to worker %d", destination
+                )
+                self._events.emit("dispatch", worker=destination, bee=beeIdx[0])
+            except Exception:
+                self._runtime.logger.exception(
+                    f"SolverDAB exception exchanging solution with worker {destination}"
+                )
+
+    """
+    Signals also trigger an immediate checkpoint before the drain (see
+    DriverSolverBase).
+    """
+
+    def handle_signal(self, signum, frame):
+        super().handle_signal(signum, frame)
+        self._checkpointRequested = True
+
+    def update_drain(self) -> None:
+        if self._checkpointRequested:
+            self._checkpointRequested = False
+            self._runtime.logger.warning(
+                "SolverDAB. Signal received, writing a checkpoint and draining"
+            )
+            self.checkpoint_now()
+        super().update_drain()
+
+    def checkpoint_now(self) -> None:
+        try:
+            if self._checkpointWriter is not None:
+                self._checkpointWriter.submit(self.get_state())
+            else:
+                write_checkpoint(self._checkpointFile, self.get_state())
+        except Exception:
+            self._runtime.logger.exception("SolverDAB. Error writing checkpoint")
+
+    """
+    Run status, with the pending queue, the candidates dropped before
+    dispatch, the Pareto front and the operators added to the common fields.
+    """
+
+    def get_status(self, finished: bool = False) -> dict:
+        status = super().get_status(finished)
+        status["queues"]["pending"] = self._pendingSolutions.queue_size
+        status["failures"].update(
+            {
+                "screened-out": self._screenedOut,
+                "stale-dropped": self._staleDropped,
+                "stale-deferred": self._staleDeferred,
+            }
+        )
+        status["pareto_front"] = len(self._pareto) if self._pareto is not None else None
+        status["operators"] = self.operator_status()
+        return status
+
+    def operator_status(self) -> dict | None:
+        if self._bandit is None:
+            return None
+        shares = self._bandit.probabilities()
+        return {
+            "improvement_rates": dict(self._bandit.rates),
+            "results": dict(self._bandit.results),
+            "improvements": dict(self._bandit.improvements),
+            "shares": shares,
+            "prob_employed_change": self._probEmployedChange,
+            "prob_onlooker_change": self._probOnlookerChange,
+            "onlooker_mod_factor": self._onlookerModFactor,
+        }
+
+    """
+    A lost worker's candidate is queued again for the remaining workers.
+    """
+
+    def reissue(self, job) -> None:
+        _, beeIdx, buff, operator = job
+        solution = self._new_solution()
+        solution.set_parameters_values(buff)
+        self._pendingSolutions.put_solution(
+            solution, -1.0, beeIdx[0], operator=operator
+        )
 
     """
     This function checks if there are workers waiting to send solutions to the driver
@@ -995,7 +1656,12 @@ class SolverDAB(SolverBase):
 
     def receiveSolutions(self):
         status = MPI.Status()
-        sourceIdx, flag = MPI.Request.Testany(self._requestSolution, status)
+        try:
+            with span("mpi.test.solution"):
+                sourceIdx, flag = MPI.Request.Testany(self._requestSolution, status)
+        except MPI.Exception:
+            self.release_failed_workers(self._requestSolution)
+            return
         origin = -1
 
         while flag and sourceIdx >= 0:
@@ -1005,222 +1671,376 @@ class SolverDAB(SolverBase):
                 raise ValueError(f"Invalid source index: {source}")
             self._requestSolution[source] = MPI.REQUEST_NULL
             self._runtime.logger.debug(
-                f"SolverDAB. Receiving solution (worker {source})"
+                "SolverDAB. Receiving solution (worker %d, buffer size %d)",
+                source,
+                self._numParams,
             )
-            isNewBest = False
             try:
-                self._runtime.logger.debug(f"SolverDAB. Buffer size: {self._numParams}")
                 buff = array("f", [0]) * self._numParams
                 solVal = array("f", [0]) * 1
                 beeIdx = array("i", [0]) * 1
                 origin = status.source
-                self._comms.comm.Recv(buff, origin, Tags.COMMSOLUTION)
-                self._comms.comm.Recv(solVal, origin, Tags.COMMSOLUTION)
-                self._comms.comm.Recv(beeIdx, origin, Tags.COMMSOLUTION)
+                objectives = None
+                with span("mpi.recv.solution"):
+                    self._comms.comm.Recv(buff, origin, Tags.COMMSOLUTION)
+                    self._comms.comm.Recv(solVal, origin, Tags.COMMSOLUTION)
+                    self._comms.comm.Recv(beeIdx, origin, Tags.COMMSOLUTION)
+                    if self._problem.objective_names:
+                        objectives = array("d", [0]) * len(
+                            self._problem.objective_names
+                        )
+                        self._comms.comm.Recv(objectives, origin, Tags.COMMSOLUTION)
             except Exception:
                 self._runtime.logger.exception(
                     f"SolverDAB. Exception receiving solution from worker {origin}"
                 )
                 raise
-            try:
-                self._runtime.logger.debug(
-                    f"SolverDAB. Received solution with value {solVal[0]} from bee {beeIdx[0]}"
-                )
-                if (
-                    not math.isfinite(float(solVal[0]))
-                    or float(solVal[0]) <= 0.0
-                    or float(solVal[0])
-                    >= self._runtime.max_valid_solution_value / 100.0
-                ):
-                    continue
-                # Add the solution to the list of best solutions (the method will implement the
-                # priority list)
-                solutionTemp = None
-                try:
-                    if self._runtime.problem_type in PROBLEM_TYPE_REGISTRY:
-                        _, solution_cls = PROBLEM_TYPE_REGISTRY[
-                            self._runtime.problem_type
-                        ]
-                        template = solution_cls.get_template_data(
-                            self._runtime, self._comms
-                        )
-                        solutionTemp = solution_cls(
-                            self._runtime, self._comms, deepcopy(template)
-                        )
-                    else:
-                        raise ValueError(
-                            f"Unknown problem type: {self._runtime.problem_type}"
-                        )
 
-                    if solutionTemp is None:
-                        raise RuntimeError(
-                            f"Failed to create solution for type "
-                            f"{self._runtime.problem_type}"
-                        )
+            if self.discard_result(origin):
+                sourceIdx, flag = MPI.Request.Testany(self._requestSolution, status)
+                continue
+
+            dispatched = self._inFlight.pop(origin, None)
+            seconds = None
+            operator = ""
+            if dispatched is not None:
+                operator = dispatched[3]
+                seconds = time.time() - dispatched[0]
+                self.record_duration(seconds)
+                self._busyTime += seconds
+            self._evaluated += 1
+            self._events.emit(
+                "result",
+                worker=origin,
+                bee=int(beeIdx[0]),
+                value=float(solVal[0]),
+                seconds=seconds,
+            )
+            get_instrumentation().count("evaluations.received")
+            artifacts = self.store_in_cache(buff, float(solVal[0]), origin, objectives)
+            self.processSolution(
+                buff,
+                float(solVal[0]),
+                int(beeIdx[0]),
+                artifacts,
+                origin,
+                objectives,
+                operator,
+            )
 
-                    solutionTemp.set_parameters_values(buff)
-                    if self._useMatrix:
-                        for i in range(self._probMatrix.get_num_rows()):
-                            for j in range(self._probMatrix.get_num_cols()):
-                                val = self._probMatrix.getitem(i, j)
-                                newVal = max(1.0, val - 0.01)
-                                self._probMatrix.setitem(i, j, newVal)
-
-                        parameters = solutionTemp.get_parameters()
-                        for i in range(len(parameters)):
-                            idx = round(
-                                (parameters[i].value - parameters[i].min_value)
-                                / parameters[i].gap
-                            )
-                            val = self._probMatrix.getitem(i, idx)
-                            self._probMatrix.setitem(i, idx, val + 0.5)
-                except Exception:
-                    self._runtime.logger.exception(
-                        "SolverDAB exception creating solution"
-                    )
+            self._runtime.logger.debug(
+                "SolverDAB. Received solution (worker %d)", source
+            )
+            sourceIdx, flag = MPI.Request.Testany(self._requestSolution, status)
+
+    """
+    Updates the solver state with an evaluated solution: elite and finished
+    queues, probability matrix, best solution and the bee that created it.
+    artifacts maps output names (wout, threed1, ...) to the files produced
+    by the evaluation and origin is the worker that produced them (-1 if the
+    value comes from the cache). objectives is the objective vector of
+    multi-objective runs and operator the one that created the candidate.
+    """
+
+    def processSolution(
+        self,
+        buff,
+        value: float,
+        bee_idx: int,
+        artifacts,
+        origin: int = -1,
+        objectives=None,
+        operator: str = "",
+    ):
+        self._runtime.logger.debug(
+            "SolverDAB. Received solution with value %s from bee %d", value, bee_idx
+        )
+        if self._steadyState:
+            self._readyBees.append(bee_idx)
+        if not self.is_valid_value(value):
+            self._failedEvaluations += 1
+            self.reward_operator(operator, False)
+            return
+
+        if self._surrogate is not None:
+            self._surrogate.update(buff, value)
+        if self._pareto is not None and objectives is not None:
+            self._pareto.insert(buff, objectives, bee_idx)
+
+        isNewBest = False
+        try:
+            # Add the solution to the list of best solutions (the method will implement the
+            # priority list)
+            solutionTemp = None
+            try:
+                solutionTemp = self._new_solution()
+                solutionTemp.set_parameters_values(buff)
+                if self._useMatrix:
+                    self.reinforce_matrix(solutionTemp, 0.01, 0.5)
+            except Exception:
+                self._runtime.logger.exception("SolverDAB exception creating solution")
+            with span("queue.top.put"):
                 self._topSolutions.put_solution(
-                    solutionTemp, solVal[0], beeIdx[0], self._nEmployed
+                    solutionTemp, value, bee_idx, self._nEmployed
                 )
-                self._totalSumGoodSolutions = (
-                    self._topSolutions.get_total_solutions_values()
+            self._totalSumGoodSolutions = (
+                self._topSolutions.get_total_solutions_values()
+            )
+
+            if (
+                self._runtime.objective == ObjectiveType.MAXIMIZE
+                and value > float(self._bestSolution.value)
+            ) or (
+                self._runtime.objective == ObjectiveType.MINIMIZE
+                and value < float(self._bestSolution.value)
+            ):
+                isNewBest = True
+                self._runtime.logger.best(
+                    "New best solution found by bee %d with value %s", bee_idx, value
+                )
+                self._events.emit("best", bee=bee_idx, value=value, worker=origin)
+                self._bestSolution.value = value
+                self._bestHistory.append(
+                    (round(time.time() - self._runtime.start_time, 1), value)
                 )
 
-                if (
-                    self._runtime.objective == ObjectiveType.MAXIMIZE
-                    and float(solVal[0]) > float(self._bestSolution.value)
-                ) or (
-                    self._runtime.objective == ObjectiveType.MINIMIZE
-                    and float(solVal[0]) < float(self._bestSolution.value)
-                ):
-                    isNewBest = True
-                    self._runtime.logger.best(
-                        f"New best solution found by bee {beeIdx[0]} with value {solVal[0]}"
-                    )
-                    self._bestSolution.value = solVal[0]
+                self._bestSolution.set_parameters_values(buff)
+                self.save_best_outputs(artifacts)
+        except Exception:
+            self._runtime.logger.exception(
+                "SolverDAB exception while processing received solution"
+            )
+            raise
+        try:
+            solutionTemp = self._new_solution()
+            solutionTemp.set_parameters_values(buff)
 
-                    self._bestSolution.set_parameters_values(buff)
-                    # TODO: this logic needs to be moved to VMECProcess or similar, to avoid having solver-specific code in the solver
-                    if not self._runtime.mock:
-                        if self._runtime.solution_type == SolutionType.FUSION:
-                            filenametime = datetime.now().strftime(
-                                "%Y-%m-%d-%H:%M:%S:%f"
-                            )[:-3]
-                            self._bestSolution.prepare("input.best." + filenametime)
-                            shutil.copyfile(
-                                str(origin) + "/threed1.tj" + str(origin),
-                                "threed1.best." + filenametime,
-                            )
-                            shutil.copyfile(
-                                str(origin) + "/wout_tj" + str(origin) + ".txt",
-                                "wout.best." + filenametime,
+            with span("queue.finished.put"):
+                self._finishedSolutions.put_solution(solutionTemp, value, bee_idx)
+            self._runtime.logger.debug(
+                "SolverDAB. Solution (value %s) added to the list of finished solutions",
+                value,
+            )
+            if value >= 0.0 and value < (math.inf / 100.0):
+                if isNewBest:
+                    if self._useMatrix:
+                        try:
+                            self.reinforce_matrix(solutionTemp, 0.5, 5.0)
+                        except Exception:
+                            self._runtime.logger.exception(
+                                "SolverDAB. Exception updating probability matrix for new best solution"
                             )
-                            try:
-                                shutil.copyfile(
-                                    str(origin) + "/OUTPUT/results.av",
-                                    "results.best." + filenametime,
-                                )
-                            except Exception:
-                                self._runtime.logger.exception(
-                                    "SolverDAB. Exception copying results for best solution"
-                                )
-            except Exception:
-                self._runtime.logger.exception(
-                    "SolverDAB exception while processing received solution"
-                )
-                raise
-            try:
-                solutionTemp = None
-                if self._runtime.problem_type in PROBLEM_TYPE_REGISTRY:
-                    _, solution_cls = PROBLEM_TYPE_REGISTRY[self._runtime.problem_type]
-                    template = solution_cls.get_template_data(
-                        self._runtime, self._comms
+                # Update the best local solution in the bees
+                if bee_idx >= len(self._bees):
+                    raise IndexError(
+                        f"Invalid bee index {bee_idx}. Number of bees: {len(self._bees)}"
                     )
 
-                    solutionTemp = solution_cls(
-                        self._runtime, self._comms, deepcopy(template)
-                    )
-                else:
-                    raise ValueError(
-                        f"Unknown problem type: {self._runtime.problem_type}"
+                bee = self._bees[bee_idx] if bee_idx >= 0 else self._scout
+                reset = False
+                if value >= 0.0:
+                    best_local = float(bee.getBestLocalValue())
+                    if self._runtime.objective == ObjectiveType.MAXIMIZE:
+                        improved = value > best_local
+                    else:
+                        improved = value < best_local
+                    if improved:
+                        self._runtime.logger.debug(
+                            "Bee %d. Resetting counter, best local %s new best %s",
+                            bee_idx,
+                            best_local,
+                            value,
+                        )
+                        bee.reset_iterations()
+                        solutionTemp.value = value
+                        bee.setSolution(solutionTemp)
+                        reset = True
+                        if bee_idx >= 0 and origin > 0:
+                            self._beeWorker[bee_idx] = origin
+
+                if not reset:
+                    bee.increase_iterations()
+                    self._runtime.logger.debug(
+                        "Bee %d. Current iterations %d",
+                        bee_idx,
+                        bee.iterations_since_update,
                     )
+                self.reward_operator(operator, reset)
+        except Exception:
+            self._runtime.logger.exception(
+                "SolverDAB. Exception while processing received solution"
+            )
+            raise
 
-                if solutionTemp is None:
-                    self._runtime.logger.exception(
-                        f"SolverDAB. Solution is None after creation (type {self._runtime.problem_type})"
-                    )
-                    raise
+    """
+    Probability matrix update: every cell decays by decay (never below 1.0)
+    and the cells holding the bins of solution are increased by reward.
+    Parameters without a gap have no bins and are left out.
+    """
 
-                solutionTemp.set_parameters_values(buff)
+    def reinforce_matrix(self, solution, decay: float, reward: float) -> None:
+        with span("matrix.update"):
+            weights = self._probMatrix.array
+            np.maximum(weights - decay, 1.0, out=weights)
 
-                self._finishedSolutions.put_solution(solutionTemp, solVal[0], beeIdx[0])
-                self._runtime.logger.debug(
-                    f"SolverDAB. Solution (value {solVal[0]}) added to the list of finished solutions"
-                )
-                if float(solVal[0]) >= 0.0 and float(solVal[0]) < (math.inf / 100.0):
-                    if isNewBest:
-                        parameters = solutionTemp.get_parameters()
-                        if self._useMatrix:
-                            try:
-                                for i in range(self._probMatrix.get_num_rows()):
-                                    for j in range(self._probMatrix.get_num_cols()):
-                                        val = self._probMatrix.getitem(i, j)
-                                        newVal = max(1.0, val - 0.5)
-                                        self._probMatrix.setitem(i, j, newVal)
-                                for i in range(len(parameters)):
-                                    idx = parameters[i].value - parameters[i].min_value
-                                    idx = round(idx / parameters[i].gap)
-                                    val = self._probMatrix.getitem(i, idx)
-                                    self._probMatrix.setitem(i, idx, val + 5.0)
-                            except Exception:
-                                self._runtime.logger.exception(
-                                    "SolverDAB. Exception updating probability matrix for new best solution"
-                                )
-                    # Update the best local solution in the bees
-                    bee_idx = int(beeIdx[0])
-                    sol_val = float(solVal[0])
+            rows = np.flatnonzero(self._lattice.discrete)
+            codes = self._lattice.encode(solution.get_parameters_values())
+            weights[rows, codes[rows]] += reward
 
-                    if bee_idx >= len(self._bees):
-                        raise IndexError(
-                            f"Invalid bee index {bee_idx}. Number of bees: {len(self._bees)}"
-                        )
+    """
+    Evaluation cache helpers. Keys are computed from the single precision
+    buffers exchanged with the workers, so lookups and stores agree.
+    """
 
-                    bee = self._bees[bee_idx] if bee_idx >= 0 else self._scout
-                    reset = False
-                    if sol_val >= 0.0:
-                        best_local = float(bee.getBestLocalValue())
-                        if self._runtime.objective == ObjectiveType.MAXIMIZE:
-                            improved = sol_val > best_local
-                        else:
-                            improved = sol_val < best_local
-                        if improved:
-                            self._runtime.logger.debug(
-                                f"Bee {bee_idx}. Resetting counter"
-                            )
-                            bee.reset_iterations()
-                            solutionTemp.value = sol_val
-                            self._runtime.logger.debug(
-                                f"Bee {bee_idx}. Best local {best_local} "
-                                f"new best {sol_val}"
-                            )
-                            bee.setSolution(solutionTemp)
-                            reset = True
+    def cache_lookup(self, buff):
+        if self._cache is None:
+            return None, None
+        key = self._cache.key(self._lattice.key(buff))
+        return key, self._cache.get(key)
 
-                    if not reset:
-                        bee.increase_iterations()
-                        self._runtime.logger.debug(
-                            f"Bee {bee_idx}. Current iterations "
-                            f"{bee.iterations_since_update}"
-                        )
-            except Exception:
-                self._runtime.logger.exception(
-                    "SolverDAB. Exception while processing received solution"
+    def store_in_cache(self, buff, value: float, origin: int, objectives=None):
+        artifacts = self.evaluation_outputs(origin)
+        if self._cache is None:
+            return artifacts
+        try:
+            key = self._cache.key(self._lattice.key(buff))
+            status = STATUS_OK if self.is_valid_value(value) else STATUS_FAILED
+            named = None
+            if objectives is not None:
+                named = dict(zip(self._problem.objective_names, map(float, objectives)))
+            self._cache.put(key, value, status, artifacts, named)
+        except Exception:
+            self._runtime.logger.exception(
+                "SolverDAB. Exception storing evaluation in cache"
+            )
+        return artifacts
+
+    """
+    Objective vector of a cache entry, in the order of the objectives of
+    this run, or None if the entry was stored without some of them.
+    """
+
+    def cached_objectives(self, entry):
+        if self._pareto is None or entry.objectives is None:
+            return None
+        try:
+            return [entry.objectives[name] for name in self._problem.objective_names]
+        except KeyError:
+            return None
+
+    """
+    Checkpoints. get_state returns a snapshot of everything needed to
+    continue the search (bee food sources and counters, probability matrix,
+    pending and elite queues, best solutions, surrogate and RNG state) made
+    of plain copies, so it can be pickled by the writer thread while the
+    solver keeps running. Finished solutions are not included: they are
+    appended to finished.queue as they arrive and reloaded from there.
+    """
+
+    def get_state(self) -> dict:
+        return {
+            "problem_type": type_key(self._runtime.problem_type),
+            "num_params": self._numParams,
+            "bees": [
+                (
+                    list(bee.getBestLocalSolution().get_parameters_values()),
+                    float(bee.getBestLocalValue()),
+                    bee.iterations_since_update,
                 )
-                raise
+                for bee in self._bees
+            ],
+            "matrix": self._probMatrix.array.copy(),
+            "pending": self._pendingSolutions.get_state(),
+            "top": self._topSolutions.get_state(),
+            "best": (
+                list(self._bestSolution.get_parameters_values()),
+                float(self._bestSolution.value),
+            ),
+            "bee_worker": dict(self._beeWorker),
+            "screened_out": self._screenedOut,
+            "rejected": dict(self._rejectedCandidates),
+            "surrogate": deepcopy(self._surrogate),
+            "pareto": self._pareto.get_state() if self._pareto is not None else None,
+            "adaptive": (
+                deepcopy(self._bandit),
+                self._probEmployedChange,
+                self._probOnlookerChange,
+                self._onlookerModFactor,
+            ),
+            "random": random.getstate(),
+        }
+
+    def set_state(self, state: dict) -> None:
+        if state["problem_type"] != type_key(self._runtime.problem_type) or (
+            state["num_params"] != self._numParams
+        ):
+            raise ValueError("Checkpoint does not match the current problem")
+        if len(state["bees"]) != len(self._bees):
+            raise ValueError(
+                f"Checkpoint has {len(state['bees'])} bees, "
+                f"configuration has {len(self._bees)}"
+            )
 
-            self._runtime.logger.debug(
-                f"SolverDAB. Received solution (worker {source})"
+        for bee, (values, value, iterations) in zip(
+            self._bees, state["bees"], strict=True
+        ):
+            solution = self._new_solution()
+            solution.set_parameters_values(values)
+            solution.value = value
+            bee.setSolution(solution)
+            bee.iterations_since_update = iterations
+
+        if state["matrix"].shape == self._probMatrix.shape:
+            # The bees share this matrix, so it is updated in place
+            np.copyto(self._probMatrix.array, state["matrix"])
+
+        self._pendingSolutions.set_state(state["pending"])
+        self._topSolutions.set_state(state["top"])
+        self._totalSumGoodSolutions = self._topSolutions.get_total_solutions_values()
+
+        values, value = state["best"]
+        self._bestSolution.set_parameters_values(values)
+        self._bestSolution.value = value
+
+        self._beeWorker = dict(state["bee_worker"])
+        self._screenedOut = state["screened_out"]
+        self._rejectedCandidates = Counter(state["rejected"])
+        if state["surrogate"] is not None and self._surrogate is not None:
+            self._surrogate = state["surrogate"]
+        if state.get("pareto") is not None and self._pareto is not None:
+            self._pareto.set_state(state["pareto"])
+        if "adaptive" in state and self._bandit is not None:
+            (
+                bandit,
+                self._probEmployedChange,
+                self._probOnlookerChange,
+                self._onlookerModFactor,
+            ) = state["adaptive"]
+            self._bandit = bandit or self._bandit
+            self.apply_mutation_rates()
+        random.setstate(state["random"])
+
+    def resume(self) -> None:
+        if not Path(self._checkpointFile).is_file():
+            self._runtime.logger.warning(
+                f"SolverDAB. No checkpoint {self._checkpointFile}, starting a new search"
             )
-            sourceIdx, flag = MPI.Request.Testany(self._requestSolution, status)
+            return
+        self.set_state(read_checkpoint(self._checkpointFile))
+        self._runtime.logger.info(
+            f"SolverDAB. Resumed from {self._checkpointFile} "
+            f"(best value {self._bestSolution.value}, "
+            f"{self._pendingSolutions.queue_size} pending candidates)"
+        )
+
+    def maybe_checkpoint(self) -> None:
+        if self._checkpointWriter is None:
+            return
+        now = time.time()
+        if now - self._lastCheckpoint < self._checkpointInterval:
+            return
+        self._lastCheckpoint = now
+        self._checkpointWriter.submit(self.get_state())
 
     """
     Main method. Implements the algorithm
@@ -1232,12 +2052,17 @@ class SolverDAB(SolverBase):
         if self._runtime.comm_model == CommModelType.DRIVERWORKER:
             while not self.check_finish():
                 try:
+                    self.update_drain()
                     # check if it has to create solutions
-                    self.checkPendingSolutionsQueue()
+                    if not self._draining:
+                        self.checkPendingSolutionsQueue()
                     # check if there are worker processes waiting for input
                     self.checkWaitingForSolutions()
                     # check if it has to receive solutions
                     self.receiveSolutions()
+                    self.check_workers()
+                    self.maybe_checkpoint()
+                    self.maybe_write_status()
 
                     elapsedTime = time.time() - self._runtime.start_time
                     self._runtime.logger.debug(
@@ -1263,6 +2088,7 @@ class SolverDAB(SolverBase):
         solValue = array("f", [0]) * 1
 
         while not self.check_finish():
+            batch = []
             for bee in range(len(self._bees)):
                 self._runtime.logger.debug(
                     f"Bee {bee} putting solution on pending queue"
@@ -1277,14 +2103,19 @@ class SolverDAB(SolverBase):
                 if bee < self._nEmployed:
                     beeIdx = bee
                 if newSolution is None:
-                    newSolution = self._scout.createNewCandidate(
-                        self._pendingSolutions,
-                        self._finishedSolutions,
-                        self._probMatrix,
-                        self._topSolutions,
-                        self._totalSumGoodSolutions,
-                    )[0]
-                self._problem.solve(newSolution)
+                    newSolution = self.create_scout_candidate()
+                elif not self.is_feasible(newSolution, beeIdx):
+                    continue
+                batch.append((newSolution, beeIdx))
+
+            # The candidates of all the bees are evaluated together, in one
+            # vectorized call for analytic problems. A batch cannot be
+            # interrupted, so the drain estimate uses its duration
+            started = time.time()
+            self._problem.solve_many([solution for solution, _ in batch])
+            self.record_duration(time.time() - started)
+
+            for newSolution, beeIdx in batch:
                 solutionValue = float(newSolution.value)
 
                 if (
@@ -1342,20 +2173,16 @@ class SolverDAB(SolverBase):
 
             # Check if there are abandoned solutions
             for bee in range(self._nEmployed):
-                if self._bees[bee].getIter() > self._iterAbandoned:
+                if self._bees[bee].iterations_since_update > self._iterAbandoned:
                     self._runtime.logger.debug(
                         "Bee " + str(bee) + ". Abandoning food source"
                     )
-                    newSolution = self._scout.createNewCandidate(
-                        self._pendingSolutions,
-                        self._finishedSolutions,
-                        self._probMatrix,
-                        self._topSolutions,
-                        self._totalSumGoodSolutions,
-                    )[0]
+                    newSolution = self.create_scout_candidate()
                     self._bees[bee].reset_iterations()
                     self._bees[bee].setSolution(newSolution)
+                    started = time.time()
                     self._problem.solve(newSolution)
+                    self.record_duration(time.time() - started)
                     solutionValue = float(newSolution.value)
 
                     if (
@@ -1421,31 +2248,43 @@ class SolverDAB(SolverBase):
                     )
         return
 
-    def check_finish(self):
-        try:
-            # first check if it's too early to finish
-            elapsedTime = time.time() - self._runtime.start_time
-            if elapsedTime + 300 < self._runtime.max_execution_time:
-                return False
-            all_null = all(request == MPI.REQUEST_NULL for request in self._requestsEnd)
-            if all_null:
-                self._runtime.logger.debug(
-                    "SolverDAB [Driver]. All workers have finished"
-                )
-                return True
-            status = MPI.Status()
-            idx, flag = MPI.Request.Testany(self._requestsEnd, status)
-            if flag and idx >= 0:
-                source = status.source
-                self._requestsEnd[source] = MPI.REQUEST_NULL
-                self._runtime.logger.info(
-                    f"SolverDAB [Driver]. Received a termination request from worker {source}"
-                )
-            return False
-        except Exception:
-            self._runtime.logger.exception("SolverDAB exception in finish check")
-            return True
-
     def finish(self):
+        self.close_driver()
+        if self._checkpointWriter is not None:
+            self._checkpointWriter.submit(self.get_state())
+            self._checkpointWriter.close()
+            self._runtime.logger.info(
+                f"SolverDAB. Checkpoints written: {self._checkpointWriter.written}"
+            )
         self._pendingSolutions.write_all_solutions()
+        if self._pareto is not None:
+            self._pareto.write(self._paretoFile)
+            self._runtime.logger.info(
+                f"SolverDAB. Pareto front of {len(self._pareto)} solutions "
+                f"written to {self._paretoFile}"
+            )
+        if self._bandit is not None:
+            self._runtime.logger.info(f"SolverDAB. Operators: {self.operator_status()}")
+        if self._affinity:
+            self._runtime.logger.info(
+                f"SolverDAB. Candidates sent to their parent's worker: "
+                f"{self._affinityMatches}"
+            )
+        if self._checkFeasibility:
+            self._runtime.logger.info(
+                f"SolverDAB. Feasibility pre-filter rejected "
+                f"{sum(self._rejectedCandidates.values())} candidates "
+                f"{dict(self._rejectedCandidates)}"
+            )
+        if self._surrogate is not None:
+            self._runtime.logger.info(
+                f"SolverDAB. Surrogate screened out {self._screenedOut} candidates "
+                f"(trained on {self._surrogate.n_samples} samples)"
+            )
+        if self._cache is not None:
+            self._runtime.logger.info(
+                f"SolverDAB. Evaluation cache: {self._cache.hits} hits, "
+                f"{self._cache.misses} misses, {len(self._cache)} entries"
+            )
+            self._cache.close()
         self._runtime.logger.info("SolverDAB [Driver] finished")
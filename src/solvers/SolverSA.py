@@ -1,31 +1,701 @@
 #!/usr/bin/env python
 
 """
-Class that implements the DAB solver. It has to:
-  - Create the different bees.
-  - Solve is the main method that actually implements the algorithm
-  - Once the algorithm has finish, we have to call the finish method if
-  there is something else to be done.
+Class that implements the simulated annealing (SA) solver. It runs parallel
+tempering:
+  - A ladder of chains (replicas), each at its own temperature, performs a
+  Metropolis random walk. Hot chains explore, cold chains refine.
+  - Periodically, chains at adjacent temperatures swap their temperatures
+  with the replica exchange acceptance probability, so good states found by
+  hot chains move down the ladder.
+  - The whole ladder is cooled over the run by a configurable schedule.
+
+With the DRIVERWORKER model the driver owns every chain and keeps the
+workers busy with proposals, one per chain at a time, using the same
+protocol as SolverDAB. With ALL2ALL every rank runs its own chains,
+evaluates them together (solve_batch when the problem has one) and the
+ranks exchange temperatures collectively.
 """
 
+from __future__ import annotations
+
 import configparser
+import math
 import random
-import sys
+import time
+from array import array
+from collections import deque
+from copy import deepcopy
+
+from mpi4py import MPI
 
 from core.comms import GlobalComms
+from core.enums import CommModelType, ObjectiveType, Tags
+from core.instrumentation import get_instrumentation, span
+from core.lattice import bin_count, bin_index, bin_value, is_discrete
+from core.registry import PROBLEM_TYPE_REGISTRY
 from core.runtime import GlobalRuntime
-from solvers.SolverBase import SolverBase
+from data.Parameter import ParamType
+from problems.ProblemBase import ProblemBase
+from solution.SolutionBase import SolutionBase
+from solvers.DriverSolverBase import DriverSolverBase
 
+COOLING_SCHEDULES = ("constant", "linear", "geometric")
+STARTS = ("input", "random")
 
-class SolverSA(SolverBase):
-    def readConfigFile(self, runtime):
-        config = configparser.ConfigParser()
-        config.read(runtime.config_file)
-        if not config.has_section("SA"):
-            runtime.logger.critical("SA section not specified in the ini file")
-            sys.exit(-1)
+
+def temperature_ladder(n: int, t_min: float, t_max: float) -> list[float]:
+    """Return n temperatures spaced geometrically from t_min (level 0) to t_max."""
+    if n <= 1:
+        return [t_min]
+    ratio = (t_max / t_min) ** (1.0 / (n - 1))
+    return [t_min * ratio**level for level in range(n)]
+
+
+def cooling_factor(schedule: str, progress: float, final: float) -> float:
+    """
+    Return the factor applied to the ladder at progress (0 at the start of
+    the run, 1 at the end); it goes from 1 to final.
+    """
+    progress = min(max(progress, 0.0), 1.0)
+    if schedule == "linear":
+        return 1.0 - (1.0 - final) * progress
+    if schedule == "geometric":
+        return final**progress
+    return 1.0
+
+
+def metropolis_accepts(delta: float, temperature: float, rng: random.Random) -> bool:
+    """Metropolis criterion for a move that changes the energy by delta."""
+    if delta <= 0.0:
+        return True
+    if temperature <= 0.0:
+        return False
+    return rng.random() < math.exp(-delta / temperature)
+
+
+def exchange_accepts(
+    energy_cold: float,
+    energy_hot: float,
+    t_cold: float,
+    t_hot: float,
+    rng: random.Random,
+) -> bool:
+    """Replica exchange criterion for swapping two temperatures."""
+    exponent = (1.0 / t_cold - 1.0 / t_hot) * (energy_cold - energy_hot)
+    return exponent >= 0.0 or rng.random() < math.exp(exponent)
+
+
+def exchange_levels(
+    replicas: list[tuple[int, int, float]],
+    temperatures: list[float],
+    start: int,
+    rng: random.Random,
+) -> tuple[dict[int, int], int, int]:
+    """
+    Attempt temperature swaps between chains at adjacent levels.
+
+    Args:
+        replicas: (chain, level, energy) of every chain.
+        temperatures: Temperature of each level.
+        start: 0 tries the pairs of levels (0, 1), (2, 3)...; 1 tries
+            (1, 2), (3, 4)... Alternating it lets states travel the ladder.
+        rng: Random generator; ranks that share its seed take the same
+            decisions.
+
+    Returns:
+        The new level of every chain, the swaps attempted and accepted.
+    """
+    by_level = sorted(replicas, key=lambda replica: replica[1])
+    levels = {chain: level for chain, level, _ in replicas}
+    attempted = accepted = 0
+    for i in range(start, len(by_level) - 1, 2):
+        cold, hot = by_level[i], by_level[i + 1]
+        if not (math.isfinite(cold[2]) and math.isfinite(hot[2])):
+            continue
+        attempted += 1
+        if exchange_accepts(
+            cold[2], hot[2], temperatures[cold[1]], temperatures[hot[1]], rng
+        ):
+            levels[cold[0]], levels[hot[0]] = hot[1], cold[1]
+            accepted += 1
+    return levels, attempted, accepted
+
+
+def _snap(param, value: float, low: float, high: float) -> float:
+    if is_discrete(param):
+        return bin_value(param, bin_index(param, value))
+    # Half-bounded parameters with a gap are snapped to the grid starting at
+    # their finite bound, unbounded ones to multiples of the gap
+    gap = abs(param.gap or 0.0)
+    if gap > 0.0:
+        origin = low if math.isfinite(low) else 0.0
+        value = origin + round((value - origin) / gap) * gap
+    return min(max(value, low), high)
+
+
+def perturb(
+    parameters, step: float, change_probability: float, rng: random.Random
+) -> int:
+    """
+    Move parameters to a random neighbour, in place.
+
+    Each numeric parameter changes with probability change_probability (at
+    least one always does) by a Gaussian step whose standard deviation is
+    step times its range, and never less than its gap; the result is
+    rounded to the gap and clipped to the bounds. Booleans flip and strings
+    never change.
+
+    Returns:
+        The number of parameters whose value changed.
+    """
+    movable = [p for p in parameters if p.is_numeric() or p.type is ParamType.BOOL]
+    if not movable:
+        return 0
+    chosen = [p for p in movable if rng.random() < change_probability]
+    if not chosen:
+        chosen = [rng.choice(movable)]
+
+    changed = 0
+    for param in chosen:
+        old = param.value
+        if param.type is ParamType.BOOL:
+            param.value = not old
+        else:
+            low, high = sorted((float(param.min_value), float(param.max_value)))
+            gap = abs(param.gap or 0.0)
+            if param.type is ParamType.INT:
+                gap = max(gap, 1.0)
+            width = high - low if math.isfinite(high - low) else 0.0
+            sigma = max(step * width, gap) or step * max(abs(old), 1.0)
+            param.value = _snap(param, old + rng.gauss(0.0, sigma), low, high)
+        changed += param.value != old
+    return changed
+
+
+def randomize(parameters, rng: random.Random) -> None:
+    """Draw every bounded parameter uniformly within its bounds, in place."""
+    for param in parameters:
+        if param.type is ParamType.BOOL:
+            param.value = rng.random() < 0.5
+        elif is_discrete(param):
+            param.value = bin_value(param, rng.randrange(bin_count(param)))
+        elif param.is_numeric():
+            low, high = sorted((float(param.min_value), float(param.max_value)))
+            if math.isfinite(high - low):
+                param.value = _snap(param, rng.uniform(low, high), low, high)
+
+
+class Replica:
+    """One chain of the tempering ladder."""
+
+    def __init__(self, index: int, level: int, solution: SolutionBase):
+        self.index = index
+        self.level = level
+        self.solution = solution
+        # Energy of the current state (the objective, negated when
+        # maximizing); inf until the chain has a valid state
+        self.energy = math.inf
+        # The first proposal evaluates the starting state itself
+        self.evaluate_start = False
+        self.in_flight = False
+
+
+"""
+Solver SA main class
+"""
+
+
+class SolverSA(DriverSolverBase):
+    _problem: ProblemBase
 
     def __init__(self, runtime: GlobalRuntime, comms: GlobalComms):
-        runtime.logger.info("SolverSA init")
-        self.readConfigFile(runtime)
-        random.seed()
+        super().__init__(runtime, comms)
+        # default values
+        self._nChains = 0
+        self._tMin = 0.001
+        self._tMax = 0.5
+        self._energyScale = 0.0
+        self._cooling = "geometric"
+        self._finalFactor = 0.01
+        self._exchangeInterval = 5
+        self._stepSize = 0.1
+        self._changeProbability = 0.2
+        self._start = "input"
+        self._checkFeasibility = False
+        self._checkPressure = False
+        self._feasibilityAttempts = 20
+
+        self._replicas: list[Replica] = []
+        self._ladder: list[float] = []
+        self._levelProposed: list[int] = []
+        self._levelAccepted: list[int] = []
+        self._exchangeRound = 0
+        self._exchangesAttempted = 0
+        self._exchangesAccepted = 0
+        self._nextExchange = 0
+        self._bestEnergy = math.inf
+
+        # Scheduling state of the DRIVERWORKER model: chains waiting for a
+        # worker, and in-flight jobs (dispatch time, chain and proposal)
+        self._ready: deque[Replica] = deque()
+        self._inFlight: dict[int, tuple[float, Replica, SolutionBase]] = {}
+
+        try:
+            if self._runtime.problem_type not in PROBLEM_TYPE_REGISTRY:
+                raise ValueError(f"Unknown problem type: {self._runtime.problem_type}")
+            problem_cls, _ = PROBLEM_TYPE_REGISTRY[self._runtime.problem_type]
+            self._problem = problem_cls(self._runtime, self._comms)
+            self._bestSolution = self._new_solution()
+
+            seed = self.read_configuration()
+            self._random = random.Random(None if seed is None else seed + comms.rank)
+            if self._runtime.comm_model == CommModelType.DRIVERWORKER:
+                self._exchangeRandom = self._random
+                nLocal = self._nChains or max(1, self._comms.size - 1)
+                nTotal = nLocal
+            else:
+                # Every rank takes the same exchange decisions
+                if seed is None:
+                    seed = self._comms.comm.bcast(random.randrange(2**31), root=0)
+                self._exchangeRandom = random.Random(seed)
+                nLocal = self._nChains or 1
+                nTotal = nLocal * self._comms.size
+
+            self._ladder = temperature_ladder(nTotal, self._tMin, self._tMax)
+            self._levelProposed = [0] * nTotal
+            self._levelAccepted = [0] * nTotal
+            for local in range(nLocal):
+                # Chains of a rank are spread over the ladder
+                if self._runtime.comm_model == CommModelType.DRIVERWORKER:
+                    index = level = local
+                else:
+                    index = self._comms.rank * nLocal + local
+                    level = local * self._comms.size + self._comms.rank
+                replica = Replica(index, level, self._new_solution())
+                if self._start == "random":
+                    randomize(replica.solution.get_parameters(), self._random)
+                replica.evaluate_start = self._start == "random" or index == 0
+                self._replicas.append(replica)
+            self._ready.extend(self._replicas)
+            self._nextExchange = self._exchangeInterval * nTotal
+            self.print_configuration()
+        except Exception:
+            self._runtime.logger.exception("SolverSA exception during initialization")
+            raise
+
+    def _new_solution(self) -> SolutionBase:
+        _, solution_cls = PROBLEM_TYPE_REGISTRY[self._runtime.problem_type]
+        template = solution_cls.get_template_data(self._runtime, self._comms)
+        return solution_cls(self._runtime, self._comms, deepcopy(template))
+
+    """
+    Reads the [SA] section, and the [Algorithm] and [Status] options shared
+    with SolverDAB. Returns the random seed, None when not configured.
+    """
+
+    def read_configuration(self) -> int | None:
+        config = configparser.ConfigParser()
+        config.read(self._runtime.config_file)
+        section = "SA"
+        self._nChains = config.getint(section, "chains", fallback=self._nChains)
+        self._tMin = config.getfloat(section, "tMin", fallback=self._tMin)
+        self._tMax = config.getfloat(section, "tMax", fallback=self._tMax)
+        self._energyScale = config.getfloat(
+            section, "energyScale", fallback=self._energyScale
+        )
+        self._cooling = config.get(section, "cooling", fallback=self._cooling).lower()
+        self._finalFactor = config.getfloat(
+            section, "finalFactor", fallback=self._finalFactor
+        )
+        self._exchangeInterval = max(
+            1,
+            config.getint(section, "exchangeInterval", fallback=self._exchangeInterval),
+        )
+        self._stepSize = config.getfloat(section, "stepSize", fallback=self._stepSize)
+        self._changeProbability = config.getfloat(
+            section, "changeProbability", fallback=self._changeProbability
+        )
+        self._start = config.get(section, "start", fallback=self._start).lower()
+        seed = config.getint(section, "seed", fallback=None)
+
+        if self._cooling not in COOLING_SCHEDULES:
+            raise ValueError(f"Unknown SA cooling schedule: {self._cooling}")
+        if self._start not in STARTS:
+            raise ValueError(f"Unknown SA start: {self._start}")
+        if not 0.0 < self._tMin <= self._tMax:
+            raise ValueError("SA temperatures must satisfy 0 < tMin <= tMax")
+        if not 0.0 < self._finalFactor <= 1.0:
+            raise ValueError("SA finalFactor must be in (0, 1]")
+
+        algorithm = "Algorithm"
+        self._checkFeasibility = config.getboolean(
+            algorithm, "feasibilityCheck", fallback=self._checkFeasibility
+        )
+        self._checkPressure = config.getboolean(
+            algorithm, "pressureCheck", fallback=self._checkPressure
+        )
+        self._feasibilityAttempts = max(
+            1,
+            config.getint(
+                algorithm, "feasibilityAttempts", fallback=self._feasibilityAttempts
+            ),
+        )
+        self.read_driver_configuration(config)
+        return seed
+
+    def print_configuration(self):
+        self._runtime.logger.info("SolverSA configuration:")
+        self._runtime.logger.info(f"   Number of chains: {len(self._ladder)}")
+        self._runtime.logger.info(
+            f"   Temperatures: {self._tMin} to {self._tMax} "
+            f"(energy scale {self._energyScale or 'first valid value'})"
+        )
+        self._runtime.logger.info(
+            f"   Cooling schedule: {self._cooling} (final factor {self._finalFactor})"
+        )
+        self._runtime.logger.info(
+            f"   Replica exchange every {self._exchangeInterval} evaluations per chain"
+        )
+        self._runtime.logger.info(
+            f"   Step size: {self._stepSize}, "
+            f"change probability: {self._changeProbability}"
+        )
+        self._runtime.logger.info(f"   Start: {self._start}")
+        self._runtime.logger.info(
+            f"   Feasibility pre-filter: {self._checkFeasibility} "
+            f"(pressure checks: {self._checkPressure})"
+        )
+        self._runtime.logger.info(f"   Evaluation timeout: {self._evaluationTimeout} s")
+
+    """
+    Temperatures. The ladder is expressed in units of the energy scale (the
+    first valid objective value unless energyScale is set), so the same
+    tMin and tMax suit objectives of any magnitude, and it is multiplied by
+    the cooling factor of the elapsed fraction of the run.
+    """
+
+    def progress(self) -> float:
+        if self._runtime.max_execution_time <= 0:
+            return 0.0
+        elapsed = time.time() - self._runtime.start_time
+        return elapsed / self._runtime.max_execution_time
+
+    def temperature(self, level: int, progress: float | None = None) -> float:
+        if progress is None:
+            progress = self.progress()
+        factor = cooling_factor(self._cooling, progress, self._finalFactor)
+        return self._ladder[level] * factor * (self._energyScale or 1.0)
+
+    def energy(self, value: float) -> float:
+        return -value if self._runtime.objective == ObjectiveType.MAXIMIZE else value
+
+    """
+    Proposals. A chain first evaluates its starting state, then neighbours
+    of its current state; hotter chains take larger steps. Proposals that
+    fail the feasibility pre-filter are redrawn, and after
+    feasibilityAttempts the last one is evaluated anyway.
+    """
+
+    def propose(self, replica: Replica) -> SolutionBase:
+        if replica.evaluate_start:
+            replica.evaluate_start = False
+            return deepcopy(replica.solution)
+        step = self._stepSize * math.sqrt(self._ladder[replica.level] / self._tMax)
+        solution = replica.solution
+        for _ in range(self._feasibilityAttempts):
+            solution = deepcopy(replica.solution)
+            parameters = solution.get_parameters()
+            perturb(parameters, step, self._changeProbability, self._random)
+            solution.set_parameters(parameters)
+            if not self._checkFeasibility:
+                return solution
+            reason = solution.check_feasibility(self._checkPressure)
+            if reason is None:
+                return solution
+            self._rejectedCandidates[reason] += 1
+        return solution
+
+    """
+    Metropolis step of a chain with an evaluated proposal. Every valid
+    result also goes to the finished and top solutions queues.
+    """
+
+    def process_result(
+        self, replica: Replica, solution: SolutionBase, value: float, origin: int = -1
+    ) -> None:
+        self._evaluated += 1
+        level = replica.level
+        self._levelProposed[level] += 1
+        if not self.is_valid_value(value):
+            self._failedEvaluations += 1
+            return
+        solution.value = value
+        with span("queue.finished.put"):
+            self._finishedSolutions.put_solution(solution, value, replica.index)
+        with span("queue.top.put"):
+            self._topSolutions.put_solution(solution, value, replica.index)
+
+        energy = self.energy(value)
+        if self._energyScale <= 0.0:
+            self._energyScale = abs(value)
+        if metropolis_accepts(
+            energy - replica.energy, self.temperature(level), self._random
+        ):
+            replica.solution = solution
+            replica.energy = energy
+            self._levelAccepted[level] += 1
+
+        if energy < self._bestEnergy:
+            self._bestEnergy = energy
+            self._bestSolution = deepcopy(solution)
+            self._bestHistory.append(
+                (round(time.time() - self._runtime.start_time, 1), value)
+            )
+            self._runtime.logger.best(
+                "New best solution found by chain %d with value %s",
+                replica.index,
+                value,
+            )
+            self._events.emit("best", chain=replica.index, value=value, worker=origin)
+            self.save_best_outputs(self.evaluation_outputs(origin))
+
+    def exchange(
+        self, replicas: list[tuple[int, int, float]], progress: float | None = None
+    ) -> dict[int, int]:
+        if progress is None:
+            progress = self.progress()
+        temperatures = [
+            self.temperature(level, progress) for level in range(len(self._ladder))
+        ]
+        levels, attempted, accepted = exchange_levels(
+            replicas, temperatures, self._exchangeRound % 2, self._exchangeRandom
+        )
+        self._exchangeRound += 1
+        self._exchangesAttempted += attempted
+        self._exchangesAccepted += accepted
+        return levels
+
+    """
+    Initializer method
+    """
+
+    def initialize(self):
+        self._runtime.logger.debug("SolverSA. Initializing solver")
+        if self._runtime.comm_model != CommModelType.DRIVERWORKER:
+            return
+        self.open_driver()
+        self._runtime.logger.info(f"SolverSA. Initialized {len(self._replicas)} chains")
+
+    """
+    Main method. Implements the algorithm
+    """
+
+    def solve(self):
+        self._runtime.logger.info("SolverSA. Solver started")
+        try:
+            if self._runtime.comm_model == CommModelType.DRIVERWORKER:
+                while not self.check_finish():
+                    self.update_drain()
+                    self.checkWaitingForSolutions()
+                    self.receiveSolutions()
+                    self.check_workers()
+                    self.maybe_write_status()
+            else:
+                self.runDistributed()
+        except Exception:
+            self._runtime.logger.exception("SolverSA exception in main loop")
+            raise
+
+    """
+    DRIVERWORKER model. Each chain has at most one proposal in flight, and
+    chains are served in the order their previous result arrived. Swaps are
+    attempted every exchangeInterval evaluations per chain; they exchange
+    temperatures, not states, so proposals in flight stay with their chain.
+    """
+
+    def checkWaitingForSolutions(self):
+        self.collect_idle_workers()
+        if self._draining:
+            self.terminate_idle_workers()
+            return
+        for destination in list(self._idleWorkers):
+            # Its previous result has not been received yet
+            if self._requestSolution[destination] != MPI.REQUEST_NULL:
+                continue
+            if not self._ready:
+                break
+            replica = self._ready.popleft()
+            solution = self.propose(replica)
+            buff = array("f", solution.get_parameters_values())
+            chain = array("i", [replica.index])
+            self._idleWorkers.remove(destination)
+            try:
+                self.send_job(destination, buff, chain)
+            except MPI.Exception as err:
+                self._ready.appendleft(replica)
+                self.release_worker(destination, f"communication error ({err})")
+                continue
+            replica.in_flight = True
+            self._inFlight[destination] = (time.time(), replica, solution)
+            self._events.emit("dispatch", worker=destination, chain=replica.index)
+
+    def receiveSolutions(self):
+        status = MPI.Status()
+        try:
+            idx, flag = MPI.Request.Testany(self._requestSolution, status)
+        except MPI.Exception:
+            self.release_failed_workers(self._requestSolution)
+            return
+        while flag and idx >= 0:
+            origin = status.source
+            self._requestSolution[origin] = MPI.REQUEST_NULL
+            buff = array("f", [0]) * self._bestSolution.get_number_of_params()
+            solVal = array("f", [0]) * 1
+            chain = array("i", [0]) * 1
+            with span("mpi.recv.solution"):
+                self._comms.comm.Recv(buff, origin, Tags.COMMSOLUTION)
+                self._comms.comm.Recv(solVal, origin, Tags.COMMSOLUTION)
+                self._comms.comm.Recv(chain, origin, Tags.COMMSOLUTION)
+                if self._problem.objective_names:
+                    # SA optimizes the scalar value, the vector is discarded
+                    objectives = array("d", [0]) * len(self._problem.objective_names)
+                    self._comms.comm.Recv(objectives, origin, Tags.COMMSOLUTION)
+
+            if self.discard_result(origin):
+                dispatched = None
+            else:
+                dispatched = self._inFlight.pop(origin, None)
+            if dispatched is not None:
+                sent, replica, solution = dispatched
+                seconds = time.time() - sent
+                self.record_duration(seconds)
+                self._busyTime += seconds
+                value = float(solVal[0])
+                self._events.emit(
+                    "result",
+                    worker=origin,
+                    chain=replica.index,
+                    value=value,
+                    seconds=seconds,
+                )
+                get_instrumentation().count("evaluations.received")
+                self._sampledLog.debug(
+                    "sa.result",
+                    "SolverSA. Chain %d received value %s from worker %d",
+                    replica.index,
+                    value,
+                    origin,
+                )
+                self.process_result(replica, solution, value, origin)
+                replica.in_flight = False
+                self._ready.append(replica)
+                if self._evaluated >= self._nextExchange:
+                    self._nextExchange += self._exchangeInterval * len(self._replicas)
+                    levels = self.exchange(
+                        [(r.index, r.level, r.energy) for r in self._replicas]
+                    )
+                    for r in self._replicas:
+                        r.level = levels[r.index]
+            idx, flag = MPI.Request.Testany(self._requestSolution, status)
+
+    """
+    A lost worker's chain becomes ready again and its proposal is drawn
+    anew.
+    """
+
+    def reissue(self, job) -> None:
+        _, replica, _ = job
+        replica.in_flight = False
+        self._ready.appendleft(replica)
+
+    """
+    ALL2ALL model. Every rank advances its chains in sweeps, one proposal per
+    chain evaluated together. After exchangeInterval sweeps the ranks gather
+    the level and energy of every chain, take the same swap decisions and
+    agree on whether to stop; the drain prediction uses the duration of those
+    sweeps. The progress and energy scale of the lowest rank are used
+    everywhere, so the decisions match.
+    """
+
+    def runDistributed(self):
+        while True:
+            started = time.time()
+            for _ in range(self._exchangeInterval):
+                proposals = [self.propose(replica) for replica in self._replicas]
+                with span("sa.sweep"):
+                    self._problem.solve_many(proposals)
+                for replica, solution in zip(self._replicas, proposals, strict=True):
+                    self.process_result(replica, solution, float(solution.value))
+            self.record_duration(time.time() - started)
+
+            gathered = self._comms.comm.allgather(
+                (
+                    self.should_drain(),
+                    self.progress(),
+                    self._energyScale,
+                    [(r.index, r.level, r.energy) for r in self._replicas],
+                )
+            )
+            if any(stop for stop, _, _, _ in gathered):
+                break
+            scales = [scale for _, _, scale, _ in gathered if scale > 0.0]
+            if scales:
+                self._energyScale = scales[0]
+            levels = self.exchange(
+                [replica for _, _, _, replicas in gathered for replica in replicas],
+                gathered[0][1],
+            )
+            for replica in self._replicas:
+                replica.level = levels[replica.index]
+
+    """
+    Run status, with the acceptance rates of the chains added to the common
+    fields.
+    """
+
+    def get_status(self, finished: bool = False) -> dict:
+        status = super().get_status(finished)
+        status["chains"] = self.acceptance_rates()
+        status["exchange_acceptance"] = (
+            self._exchangesAccepted / self._exchangesAttempted
+            if self._exchangesAttempted
+            else 0.0
+        )
+        return status
+
+    def acceptance_rates(self) -> dict[str, float]:
+        return {
+            f"level{level}": (
+                self._levelAccepted[level] / self._levelProposed[level]
+                if self._levelProposed[level]
+                else 0.0
+            )
+            for level in range(len(self._ladder))
+        }
+
+    def finish(self):
+        self.close_driver()
+        self._runtime.logger.info(
+            f"SolverSA. Evaluations: {self._evaluated} "
+            f"({self._failedEvaluations} invalid), acceptance per level "
+            f"{self.acceptance_rates()}, exchanges accepted "
+            f"{self._exchangesAccepted}/{self._exchangesAttempted}"
+        )
+        if self._checkFeasibility:
+            self._runtime.logger.info(
+                f"SolverSA. Feasibility pre-filter rejected "
+                f"{sum(self._rejectedCandidates.values())} proposals "
+                f"{dict(self._rejectedCandidates)}"
+            )
+        if self._runtime.comm_model != CommModelType.DRIVERWORKER:
+            bests = self._comms.comm.gather(
+                (self._bestEnergy, self._comms.rank), root=0
+            )
+            if self._comms.rank == 0:
+                energy, rank = min(bests)
+                if math.isfinite(energy):
+                    self._runtime.logger.info(
+                        f"SolverSA. Best value {self.energy(energy)} found by rank {rank}"
+                    )
+        self._runtime.logger.info("SolverSA finished")
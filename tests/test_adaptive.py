@@ -0,0 +1,42 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from core.adaptive import OperatorBandit, adapt_rate
+
+
+def test_one_fifth_rule():
+    assert adapt_rate(0.5, 0.5, 0.01, 1.0) == pytest.approx(0.6)
+    assert adapt_rate(0.5, 0.1, 0.01, 1.0) == pytest.approx(0.5 / 1.2)
+    assert adapt_rate(0.9, 1.0, 0.01, 1.0) == 1.0
+    assert adapt_rate(0.01, 0.0, 0.01, 1.0) == 0.01
+
+
+def test_bandit_matches_probabilities_to_improvement_rates():
+    bandit = OperatorBandit(["employed", "onlooker"], p_min=0.1, seed=1)
+    assert bandit.probabilities() == {"employed": 0.5, "onlooker": 0.5}
+
+    for _ in range(20):
+        bandit.update("employed", False)
+        bandit.update("onlooker", True)
+    # Scout results are tracked but scouts are not allocated candidates
+    bandit.update("scout", True)
+    probabilities = bandit.probabilities()
+    assert probabilities["employed"] == pytest.approx(0.1)
+    assert probabilities["onlooker"] == pytest.approx(0.9)
+    assert bandit.results == {"employed": 20, "onlooker": 20, "scout": 1}
+
+    draws = [bandit.choose() for _ in range(1000)]
+    assert 0.85 < draws.count("onlooker") / len(draws) < 0.95
+
+
+def test_bandit_rejects_invalid_parameters():
+    with pytest.raises(ValueError):
+        OperatorBandit([])
+    with pytest.raises(ValueError):
+        OperatorBandit(["employed", "onlooker"], p_min=0.6)
+    with pytest.raises(ValueError):
+        OperatorBandit(["employed"], decay=0.0)
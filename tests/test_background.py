@@ -0,0 +1,57 @@
+import sys
+import threading
+from pathlib import Path
+
+# Add src directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from core.background import LatestOnlyWriter
+
+
+class RecordingLogger:
+    def __init__(self):
+        self.messages = []
+
+    def exception(self, message):
+        self.messages.append(message)
+
+
+def test_pending_snapshot_is_replaced_while_writing():
+    started = threading.Event()
+    release = threading.Event()
+    written = []
+
+    def write(snapshot):
+        started.set()
+        release.wait()
+        written.append(snapshot)
+
+    writer = LatestOnlyWriter(write)
+    writer.submit(0)
+    started.wait()
+    for i in range(1, 5):
+        writer.submit(i)
+    release.set()
+    writer.close()
+
+    assert written == [0, 4]
+    assert writer.written == 2
+
+
+def test_write_errors_are_logged_and_the_thread_survives():
+    logger = RecordingLogger()
+    written = []
+
+    def write(snapshot):
+        if snapshot == "bad":
+            raise OSError("disk full")
+        written.append(snapshot)
+
+    writer = LatestOnlyWriter(write, logger=logger, error_message="Test. Error")
+    writer.submit("bad")
+    writer.close()
+    writer = LatestOnlyWriter(write, logger=logger)
+    writer.submit("good")
+    writer.close()
+
+    assert logger.messages == ["Test. Error"]
+    assert written == ["good"]
@@ -0,0 +1,119 @@
+import argparse
+import configparser
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from core.runtime import GlobalRuntime
+from dabmpi.bench import (
+    int_list,
+    objective_throughput,
+    solver_list,
+    summarize,
+    write_config,
+    write_nonseparable_input,
+)
+from data.NonSeparableData import NonSeparableData
+
+DATA_DIR = Path(__file__).parent.parent / "data"
+
+
+def test_console_script_is_declared():
+    tomllib = pytest.importorskip("tomllib")
+    with (Path(__file__).parent.parent / "pyproject.toml").open("rb") as file:
+        pyproject = tomllib.load(file)
+
+    assert pyproject["project"]["scripts"]["dabmpi-bench"] == "dabmpi.bench:main"
+
+
+def test_int_list():
+    assert int_list("2,4,8") == [2, 4, 8]
+    with pytest.raises(argparse.ArgumentTypeError):
+        int_list("2,0")
+
+
+def test_solver_list():
+    assert solver_list("dab,SA") == ["DAB", "SA"]
+    with pytest.raises(argparse.ArgumentTypeError):
+        solver_list("DAB,GA")
+
+
+def test_generated_input_is_readable(tmp_path):
+    path = tmp_path / "params.yaml"
+    write_nonseparable_input(path, 7)
+
+    data = NonSeparableData(GlobalRuntime())
+    data.initialize(str(path))
+
+    assert data.num_params == 7
+    assert data.max_range == 201
+
+
+def test_objective_throughput(tmp_path):
+    path = tmp_path / "params.yaml"
+    write_nonseparable_input(path, 5)
+
+    result = objective_throughput(path, batch_size=64, repeats=1)
+
+    assert result["batch_size"] == 64
+    assert result["solve_per_second"] > 0
+    assert result["solve_batch_per_second"] > 0
+
+
+def test_yaml_and_xml_inputs_match():
+    runtime = GlobalRuntime()
+    from_yaml = NonSeparableData(runtime)
+    from_yaml.initialize(str(DATA_DIR / "param_non_separable.yaml"))
+    from_xml = NonSeparableData(runtime)
+    from_xml.initialize(str(DATA_DIR / "param_non_separable.xml"))
+
+    assert from_yaml.num_params == from_xml.num_params
+    assert list(from_yaml.get_params_values()) == list(from_xml.get_params_values())
+
+
+def test_config_enables_reports(tmp_path):
+    path = tmp_path / "config.ini"
+    write_config(path, employed=8, onlookers=2, pending_size=16, duration=30)
+
+    config = configparser.ConfigParser()
+    config.read(path)
+
+    assert config.getint("Bees", "nemployed") == 8
+    assert config.getint("Algorithm", "pendingSize") == 16
+    assert config.getboolean("Instrumentation", "enabled")
+    assert config.getboolean("Status", "enabled")
+
+
+def test_summarize():
+    status = {
+        "elapsed_seconds": 10.0,
+        "evaluations_total": 100,
+        "evaluations_per_second": 10.0,
+        "worker_utilization": 0.5,
+        "best_value": 1.5,
+    }
+    span = {"count": 1, "total": 0.002, "min": 0.002, "max": 0.002, "mean": 0.002}
+    report = {
+        "ranks": {
+            "0": {
+                "spans": {"mpi.send.candidate": span},
+                "resources": {
+                    "cpu_seconds": 5.0,
+                    "max_rss_kb": 2048,
+                    "wall_seconds": 10.0,
+                },
+            },
+            "1": {"spans": {"mpi.wait.candidate": span}},
+        }
+    }
+
+    result = summarize(status, report)
+
+    assert result["driver_cpu_utilization"] == 0.5
+    assert result["driver_memory_mb"] == 2.0
+    assert result["latency"]["candidate_wait"] == 0.002
+    assert result["latency"]["solution_receive"] is None
+    assert result["driver_spans"] == {"mpi.send.candidate": 0.002}
@@ -0,0 +1,65 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Add src directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from core.checkpoint import (
+    CHECKPOINT_MAGIC,
+    CheckpointWriter,
+    read_checkpoint,
+    write_checkpoint,
+)
+
+
+def test_roundtrip(tmp_path):
+    path = tmp_path / "dab.checkpoint"
+    state = {"bees": [([1.0, 2.0], 0.5, 3)], "matrix": np.eye(2)}
+
+    write_checkpoint(str(path), state)
+    loaded = read_checkpoint(str(path))
+
+    assert loaded["bees"] == state["bees"]
+    assert np.array_equal(loaded["matrix"], state["matrix"])
+    assert not list(tmp_path.glob(".*.tmp"))
+
+
+def test_rejects_other_files(tmp_path):
+    path = tmp_path / "dab.checkpoint"
+    path.write_bytes(b"not a checkpoint at all")
+
+    with pytest.raises(ValueError):
+        read_checkpoint(str(path))
+
+
+def test_rejects_other_versions(tmp_path):
+    path = tmp_path / "dab.checkpoint"
+    write_checkpoint(str(path), {})
+    data = bytearray(path.read_bytes())
+    data[len(CHECKPOINT_MAGIC)] += 1
+    path.write_bytes(bytes(data))
+
+    with pytest.raises(ValueError, match="version"):
+        read_checkpoint(str(path))
+
+
+def test_writer_keeps_latest_state(tmp_path):
+    path = tmp_path / "dab.checkpoint"
+    writer = CheckpointWriter(str(path))
+
+    for i in range(10):
+        writer.submit({"iteration": i})
+    writer.close()
+
+    assert read_checkpoint(str(path)) == {"iteration": 9}
+    assert 1 <= writer.written <= 10
+
+
+def test_writer_without_submissions_writes_nothing(tmp_path):
+    path = tmp_path / "dab.checkpoint"
+    writer = CheckpointWriter(str(path))
+    writer.close()
+
+    assert not path.exists()
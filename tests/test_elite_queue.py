@@ -0,0 +1,93 @@
+import random
+import sys
+from copy import deepcopy
+from pathlib import Path
+
+import pytest
+
+# Add src directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from core.comms import GlobalComms
+from core.enums import ProblemType, SolutionType
+from core.runtime import GlobalRuntime
+from dabmpi.bench import write_nonseparable_input
+from solution.EliteSolutionsQueue import EliteSolutionsQueue
+from solution.SolutionNonSeparable import SolutionNonSeparable
+
+
+@pytest.fixture
+def queue(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(SolutionNonSeparable, "_template_data", None)
+    write_nonseparable_input(tmp_path / "params.yaml", 2)
+    runtime = GlobalRuntime(
+        input_file="params.yaml",
+        problem_type=ProblemType.NONSEPARABLE,
+        solution_type=SolutionType.NONSEPARABLE,
+    )
+    return EliteSolutionsQueue(
+        runtime, GlobalComms(rank=0, size=1), "elite.queue", writeToFile=False
+    )
+
+
+def make_solution(queue, values):
+    solution = SolutionNonSeparable(
+        queue._runtime,
+        queue._comms,
+        deepcopy(SolutionNonSeparable.get_template_data(queue._runtime, queue._comms)),
+    )
+    solution.set_parameters_values(values)
+    return solution
+
+
+def queued_values(queue):
+    return [float(entry[1]) for entry in queue.get_all_solutions()]
+
+
+def test_niche_keeps_its_best_solutions(queue):
+    queue.set_niches(0.1, 2)
+    for value in (5.0, 3.0, 4.0, 1.0):
+        queue.put_solution(make_solution(queue, [0.0, 0.0]), value, 0)
+    queue.put_solution(make_solution(queue, [1.0, 1.0]), 9.0, 1)
+
+    # Only the two best solutions of the crowded niche remain, in order
+    assert queued_values(queue) == [1.0, 3.0, 9.0]
+    _, value, origin = queue.get_solution_tuple()
+    assert (value, origin) == (1.0, 0)
+    queue.put_solution(make_solution(queue, [0.0, 0.0]), 2.0, 0)
+    assert queued_values(queue) == [2.0, 3.0, 9.0]
+
+
+def test_full_queue_drops_its_worst_solution(queue):
+    queue.set_niches(0.1, 1)
+    queue.max_size = 3
+    rng = random.Random(1)
+    for value in rng.sample(range(1, 50), 20):
+        point = [rng.uniform(-1.5, 1.5), rng.uniform(-1.5, 1.5)]
+        queue.put_solution(make_solution(queue, point), float(value), 0)
+
+    values = queued_values(queue)
+    assert len(values) == 3
+    assert values == sorted(values)
+    cells = {
+        queue.niche(queue._values(entry[0])) for entry in queue.get_all_solutions()
+    }
+    assert len(cells) == 3
+
+
+def test_enabling_niches_filters_the_queue(queue):
+    state = [
+        ("0:0.5,1:0.5", 2.0, 0),
+        ("0:0.5,1:0.52", 1.0, 1),
+        ("0:-1.0,1:1.0", 4.0, 0),
+        ("0:0.51,1:0.5", 3.0, 2),
+    ]
+    queue.set_state(state)
+    assert queue.queue_size == 4
+
+    queue.set_niches(0.1)
+    assert queued_values(queue) == [1.0, 4.0]
+
+    # Restored entries are filtered too
+    queue.set_state(state)
+    assert queued_values(queue) == [1.0, 4.0]
@@ -45,6 +45,7 @@ def test_tags_values():
     assert Tags.REQSENDINPUT == 4
     assert Tags.REQINPUT == 5
     assert Tags.ENDSIM == 6
+    assert Tags.TERMINATE == 7
 
 
 def test_objective_type_values():
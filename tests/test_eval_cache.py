@@ -0,0 +1,115 @@
+import math
+import sqlite3
+import sys
+from pathlib import Path
+
+# Add src directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from core.eval_cache import (
+    STATUS_FAILED,
+    STATUS_OK,
+    EvaluationCache,
+    build_context,
+)
+
+
+def test_build_context_depends_on_input_and_flags(tmp_path):
+    input_file = tmp_path / "input.yaml"
+    input_file.write_text("a: 1\n")
+    config_file = tmp_path / "config.ini"
+    config_file.write_text("[Fusion]\nmercier: True\n[Bees]\nnemployed: 4\n")
+
+    base = build_context(str(input_file), str(config_file))
+
+    config_file.write_text("[Fusion]\nmercier: True\n[Bees]\nnemployed: 8\n")
+    assert build_context(str(input_file), str(config_file)) == base
+
+    config_file.write_text("[Fusion]\nmercier: False\n[Bees]\nnemployed: 8\n")
+    assert build_context(str(input_file), str(config_file)) != base
+
+    assert build_context(str(input_file), str(config_file), extra=["mock"]) != (
+        build_context(str(input_file), str(config_file))
+    )
+
+
+def test_cache_roundtrip_survives_reopen(tmp_path):
+    path = tmp_path / "cache.sqlite"
+    cache = EvaluationCache(str(path), "ctx")
+    key = cache.key((1, 2, 3))
+
+    assert cache.get(key) is None
+
+    cache.put(key, 0.25, STATUS_OK)
+    cache.close()
+
+    reopened = EvaluationCache(str(path), "ctx")
+    entry = reopened.get(key)
+
+    assert entry is not None
+    assert entry.value == 0.25
+    assert entry.is_valid
+    assert len(reopened) == 1
+    assert reopened.hits == 1
+
+
+def test_cache_keys_depend_on_context(tmp_path):
+    first = EvaluationCache(str(tmp_path / "a.sqlite"), "ctx-a")
+    second = EvaluationCache(str(tmp_path / "b.sqlite"), "ctx-b")
+
+    assert first.key((1, 2)) != second.key((1, 2))
+    assert first.key((1, 2)) != first.key((2, 1))
+
+
+def test_cache_stores_failures_as_nan(tmp_path):
+    cache = EvaluationCache(str(tmp_path / "cache.sqlite"), "ctx")
+    key = cache.key((0,))
+
+    cache.put(key, math.inf, STATUS_FAILED)
+    entry = cache.get(key)
+
+    assert entry is not None
+    assert not entry.is_valid
+    assert math.isnan(entry.value)
+
+
+def test_cache_copies_artifacts(tmp_path):
+    wout = tmp_path / "wout_tj1.txt"
+    wout.write_text("wout data")
+    cache = EvaluationCache(
+        str(tmp_path / "cache.sqlite"), "ctx", str(tmp_path / "artifacts")
+    )
+    key = cache.key((7,))
+
+    cache.put(
+        key,
+        1.5,
+        STATUS_OK,
+        [(str(wout), "wout"), (str(tmp_path / "missing"), "threed1")],
+    )
+    entry = cache.get(key)
+
+    assert entry is not None
+    assert len(entry.artifacts) == 1
+    assert Path(entry.artifacts[0]).name == "wout"
+    assert Path(entry.artifacts[0]).read_text() == "wout data"
+
+
+def test_cache_stores_objective_vectors(tmp_path):
+    path = tmp_path / "cache.sqlite"
+    # A version 1 cache, without the objectives column
+    conn = sqlite3.connect(str(path))
+    conn.execute(
+        "CREATE TABLE evaluations (key TEXT PRIMARY KEY, value REAL, "
+        "status TEXT NOT NULL, artifacts TEXT NOT NULL DEFAULT '[]', "
+        "created REAL NOT NULL)"
+    )
+    conn.execute("INSERT INTO evaluations VALUES ('old', 1.0, 'ok', '[]', 0.0)")
+    conn.commit()
+    conn.close()
+
+    cache = EvaluationCache(str(path), "ctx")
+    key = cache.key((1,))
+    cache.put(key, 2.0, STATUS_OK, objectives={"beta": 0.02, "bgradb": 3.5})
+
+    assert cache.get("old").objectives is None
+    assert cache.get(key).objectives == {"beta": 0.02, "bgradb": 3.5}
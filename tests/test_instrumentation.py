@@ -0,0 +1,63 @@
+import json
+import sys
+from pathlib import Path
+
+# Add src directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from core.instrumentation import Instrumentation, merge_summaries, write_report
+
+
+def test_disabled_records_nothing():
+    instrumentation = Instrumentation()
+
+    with instrumentation.span("queue.pending.put"):
+        pass
+    instrumentation.count("evaluations.completed")
+
+    assert instrumentation.summary() == {"spans": {}, "counters": {}}
+
+
+def test_span_statistics():
+    instrumentation = Instrumentation(enabled=True)
+
+    for seconds in (0.001, 0.003):
+        instrumentation.record("vmec.run", seconds)
+    with instrumentation.span("vmec.input"):
+        pass
+
+    spans = instrumentation.summary()["spans"]
+    assert spans["vmec.run"]["count"] == 2
+    assert spans["vmec.run"]["min"] == 0.001
+    assert spans["vmec.run"]["max"] == 0.003
+    assert spans["vmec.run"]["mean"] == 0.002
+    assert sum(spans["vmec.run"]["histogram"].values()) == 2
+    assert spans["vmec.input"]["count"] == 1
+
+
+def test_merge_combines_ranks():
+    first = Instrumentation(enabled=True)
+    second = Instrumentation(enabled=True)
+    first.record("worker.solve", 1.0)
+    second.record("worker.solve", 3.0)
+    first.count("evaluations.completed", 2)
+    second.count("evaluations.completed")
+
+    merged = merge_summaries([first.summary(), second.summary()])
+
+    assert merged["counters"] == {"evaluations.completed": 3}
+    assert merged["spans"]["worker.solve"]["count"] == 2
+    assert merged["spans"]["worker.solve"]["min"] == 1.0
+    assert merged["spans"]["worker.solve"]["max"] == 3.0
+    assert merged["spans"]["worker.solve"]["mean"] == 2.0
+
+
+def test_report_lists_every_rank(tmp_path):
+    driver = Instrumentation(enabled=True)
+    driver.record("matrix.update", 0.5)
+    path = tmp_path / "performance.json"
+
+    write_report(str(path), [driver.summary(), Instrumentation().summary()])
+
+    report = json.loads(path.read_text())
+    assert set(report["ranks"]) == {"0", "1"}
+    assert report["total"]["spans"]["matrix.update"]["count"] == 1
@@ -0,0 +1,90 @@
+import random
+import sys
+from array import array
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Add src directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from core.lattice import (
+    Lattice,
+    bin_count,
+    bin_index,
+    bin_value,
+    is_discrete,
+    neighbour_value,
+    random_bin_value,
+)
+from data.Parameter import Parameter, ParamType
+
+
+def param(ptype=ParamType.FLOAT, gap=0.1, low=0.0, high=1.0, value=0.0):
+    return Parameter("p", 0, ptype, value, gap, low, high)
+
+
+def test_only_bounded_parameters_with_a_gap_are_discrete():
+    assert is_discrete(param())
+    assert is_discrete(param(ParamType.INT, gap=2, low=0, high=10))
+    assert not is_discrete(param(gap=0.0))
+    assert not is_discrete(param(gap=None))
+    assert not is_discrete(param(low=None))
+    assert not is_discrete(param(ParamType.BOOL, value=True))
+
+
+def test_bins_round_trip_exactly():
+    p = param(gap=0.1, low=-1.0, high=1.0)
+
+    assert bin_count(p) == 21
+    assert bin_index(p, 0.30000000000000004) == 13
+    assert bin_index(p, 5.0) == 20
+    assert bin_value(p, bin_index(p, 0.3)) == bin_value(p, bin_index(p, 0.3 + 1e-7))
+    assert bin_value(param(ParamType.INT, gap=2, low=0, high=10), 3) == 6
+
+
+def test_lattice_moves_stay_on_bins():
+    p = param(gap=0.25, low=0.0, high=2.0)
+    rng = random.Random(3)
+    values = {bin_value(p, k) for k in range(bin_count(p))}
+
+    for _ in range(200):
+        assert random_bin_value(p, 0.3, 1.4, rng) in {0.5, 0.75, 1.0, 1.25}
+        moved = neighbour_value(p, 1.0, 2, rng, move=True)
+        assert moved in values and moved != 1.0
+        assert abs(moved - 1.0) <= 0.5
+    assert neighbour_value(p, 2.0, 1, rng, move=True) == 1.75
+
+
+def test_lattice_encodes_vectors_compactly():
+    parameters = [
+        param(gap=0.5, low=0.0, high=10.0),
+        param(gap=None),
+        param(ParamType.INT, gap=1, low=0, high=100000),
+    ]
+    lattice = Lattice(parameters)
+
+    assert lattice.dtype == np.int32
+    assert Lattice(parameters[:2]).dtype == np.int16
+    assert lattice.max_bins == 100001
+
+    codes = lattice.encode([1.0, 0.123, 42.0])
+    assert codes.tolist() == [2, 0, 42]
+    with pytest.raises(ValueError):
+        lattice.encode([1.0])
+
+
+def test_keys_match_single_precision_buffers():
+    parameters = [
+        param(gap=0.5, low=0.0, high=10.0),
+        param(gap=2.0, low=-10.0, high=10.0),
+        param(gap=0.0),
+        param(gap=None),
+    ]
+    lattice = Lattice(parameters)
+    values = [1.0, -4.0, 0.1234567891, 3.14159265358]
+
+    assert lattice.key(values) == (2, 3, "0.1234568", "3.141593")
+    assert lattice.key(values) == lattice.key(array("f", values))
+    with pytest.raises(ValueError):
+        lattice.key([1.0, 2.0])
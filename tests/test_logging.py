@@ -0,0 +1,112 @@
+import atexit
+import json
+import logging
+import sys
+from logging.handlers import QueueHandler
+from pathlib import Path
+
+# Add src directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from core.logging import (
+    EventLog,
+    LoggerConfig,
+    RateLimitedLogger,
+    rank_log_path,
+    stop_listener,
+)
+
+
+class ListHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+
+def make_logger(name, level=logging.DEBUG):
+    logger = logging.getLogger(name)
+    logger.handlers = []
+    logger.propagate = False
+    logger.setLevel(level)
+    handler = ListHandler()
+    logger.addHandler(handler)
+    return logger, handler
+
+
+def test_rate_limited_logger_reports_suppressed_messages():
+    now = [0.0]
+    logger, handler = make_logger("test.sampled")
+    sampled = RateLimitedLogger(logger, interval=1.0, clock=lambda: now[0])
+
+    for i in range(5):
+        sampled.debug("received", "Received %d", i)
+    now[0] = 1.5
+    sampled.debug("received", "Received %d", 5)
+    sampled.debug("other", "Other")
+
+    assert handler.messages == [
+        "Received 0",
+        "Received 5 (4 similar messages suppressed)",
+        "Other",
+    ]
+
+
+def test_rate_limited_logger_skips_disabled_levels():
+    class Unformattable:
+        def __str__(self):
+            raise AssertionError("formatted a disabled message")
+
+    logger, handler = make_logger("test.disabled", logging.INFO)
+    sampled = RateLimitedLogger(logger, interval=0.0)
+
+    sampled.debug("key", "Value %s", Unformattable())
+    sampled.info("key", "Value %s", 1)
+
+    assert handler.messages == ["Value 1"]
+
+
+def test_event_log_writes_json_lines(tmp_path):
+    path = tmp_path / "events.jsonl"
+    events = EventLog("test.events")
+    events.emit("ignored", value=0.0)
+
+    events.start(str(path), rank=0)
+    assert events.enabled
+    events.emit("result", worker=1, value=1.5)
+    events.emit("best", value=1.5)
+    events.close()
+
+    lines = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [line["event"] for line in lines] == ["result", "best"]
+    assert lines[0]["worker"] == 1
+    assert lines[0]["rank"] == 0
+    assert not events.enabled
+
+
+def test_rank_log_path():
+    assert rank_log_path(Path("logs/disop.log"), 0) == Path("logs/disop.log")
+    assert rank_log_path(Path("logs/disop.log"), 12) == Path("logs/disop.12.log")
+
+
+def test_per_rank_logger_writes_its_own_file(tmp_path):
+    log_file = tmp_path / "disop.log"
+    logger = LoggerConfig.create_logger(
+        name="test.rank3",
+        log_file=str(log_file),
+        console_level=logging.CRITICAL,
+        rank=3,
+        per_rank=True,
+    )
+
+    logger.info("from rank %d", 3)
+    (queue_handler,) = [h for h in logger.handlers if isinstance(h, QueueHandler)]
+    # Stop the listener now instead of at exit
+    atexit.unregister(stop_listener)
+    stop_listener(queue_handler.listener)
+
+    assert not log_file.exists()
+    text = (tmp_path / "disop.3.log").read_text()
+    assert "rank=3" in text
+    assert "from rank 3" in text
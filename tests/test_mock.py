@@ -0,0 +1,116 @@
+import math
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from core.mock import MockCostModel, rastrigin, rosenbrock, sphere
+from data.Parameter import Parameter, ParamType
+
+
+class FakeSolution:
+    def __init__(self, values, lower=-10.0, upper=10.0):
+        self._parameters = [
+            Parameter(f"x{i}", i, ParamType.FLOAT, value, 0.1, lower, upper)
+            for i, value in enumerate(values)
+        ]
+
+    def get_parameters(self):
+        return self._parameters
+
+
+def test_objectives_at_their_optimum():
+    assert sphere([0.0, 0.0]) == 0.0
+    assert rosenbrock([1.0, 1.0, 1.0]) == 0.0
+    assert rastrigin([0.0, 0.0]) == 0.0
+
+
+def test_objective_is_deterministic_and_valid():
+    model = MockCostModel(objective="rastrigin", seed=1)
+    solution = FakeSolution([0.0, 2.5, -7.0])
+
+    first = model.evaluate(solution)
+
+    assert first == model.evaluate(solution)
+    assert first > 0.0
+
+
+def test_optimum_maps_to_the_center_of_the_range():
+    model = MockCostModel(objective="sphere")
+
+    assert model.evaluate(FakeSolution([0.0, 0.0])) == 1.0
+    assert model.evaluate(FakeSolution([5.0, 0.0])) > 1.0
+
+
+def test_maximize_inverts_the_objective():
+    model = MockCostModel(objective="sphere", maximize=True)
+
+    assert model.evaluate(FakeSolution([0.0, 0.0])) == 1.0
+    assert model.evaluate(FakeSolution([5.0, 0.0])) < 1.0
+
+
+def test_objective_vector_has_conflicting_optima():
+    model = MockCostModel(objective="sphere")
+    left = FakeSolution([-10.0 / 3.0] * 2).get_parameters()
+    right = FakeSolution([10.0 / 3.0] * 2).get_parameters()
+
+    # Optima one and two thirds of the way along every axis
+    assert model.objective_vector(left, (False, True))[0] == pytest.approx(1.0)
+    assert model.objective_vector(right, (False, True))[1] == pytest.approx(1.0)
+    assert model.objective_vector(left, (False, True))[1] < 1.0
+
+
+def test_durations_follow_the_distribution():
+    sleeps = []
+    model = MockCostModel(
+        distribution="exponential", duration=2.0, seed=3, sleep=sleeps.append
+    )
+
+    for _ in range(2000):
+        model.evaluate(FakeSolution([0.0]))
+
+    assert len(sleeps) == 2000
+    assert sum(sleeps) / len(sleeps) == pytest.approx(2.0, rel=0.1)
+
+
+def test_failures_and_timeouts():
+    sleeps = []
+    model = MockCostModel(
+        objective="sphere",
+        duration=1.0,
+        failure_probability=0.2,
+        timeout_probability=0.1,
+        timeout=600.0,
+        seed=5,
+        sleep=sleeps.append,
+    )
+
+    values = [model.evaluate(FakeSolution([0.0])) for _ in range(2000)]
+
+    failed = sum(1 for value in values if math.isinf(value))
+    assert failed / len(values) == pytest.approx(0.3, abs=0.05)
+    assert sleeps.count(600.0) / len(sleeps) == pytest.approx(0.1, abs=0.03)
+
+
+def test_from_config(tmp_path):
+    path = tmp_path / "config.ini"
+    path.write_text(
+        "[Mock]\nobjective = Rosenbrock\ndistribution = lognormal\n"
+        "duration = 30\nfailureProbability = 0.05\nseed = 7\n"
+    )
+
+    model = MockCostModel.from_config(str(path), rank=2)
+
+    assert model.objective == "rosenbrock"
+    assert model.distribution == "lognormal"
+    assert model.duration == 30.0
+    assert model.failure_probability == 0.05
+
+
+def test_rejects_unknown_settings():
+    with pytest.raises(ValueError):
+        MockCostModel(objective="himmelblau")
+    with pytest.raises(ValueError):
+        MockCostModel(failure_probability=0.8, timeout_probability=0.5)
@@ -0,0 +1,71 @@
+import math
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Add src directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from core.pareto import ParetoArchive, crowding_distances, dominates
+
+
+def front(archive):
+    return sorted(tuple(e["objectives"].values()) for e in archive.entries())
+
+
+def test_dominance():
+    assert dominates([1.0, 2.0], [1.0, 3.0])
+    assert not dominates([1.0, 2.0], [1.0, 2.0])
+    assert not dominates([1.0, 3.0], [2.0, 2.0])
+
+
+def test_crowding_distances():
+    points = np.array([[0.0, 4.0], [1.0, 3.0], [3.0, 1.0], [4.0, 0.0]])
+
+    distances = crowding_distances(points)
+
+    assert math.isinf(distances[0]) and math.isinf(distances[3])
+    assert distances[1] == pytest.approx(1.5)
+    assert distances[2] == pytest.approx(1.5)
+
+
+def test_insert_keeps_the_non_dominated_solutions():
+    # beta is maximized, bgradb minimized
+    archive = ParetoArchive(["beta", "bgradb"], [True, False])
+
+    assert archive.insert([0.1], [0.02, 5.0], origin=1)
+    assert archive.insert([0.2], [0.04, 8.0], origin=2)
+    assert not archive.insert([0.3], [0.01, 6.0])
+    assert not archive.insert([0.4], [0.04, 8.0])
+    assert not archive.insert([0.5], [math.nan, 1.0])
+    # Dominates both members
+    assert archive.insert([0.6], [0.05, 4.0], origin=3)
+
+    assert front(archive) == [(0.05, 4.0)]
+    parameters, objectives, origin = archive.select()
+    assert (parameters, objectives, origin) == ([0.6], [0.05, 4.0], 3)
+
+
+def test_full_archive_drops_the_most_crowded_member():
+    archive = ParetoArchive(["f1", "f2"], [False, False], max_size=4)
+    for x in (0.0, 1.0, 1.1, 3.0, 4.0):
+        archive.insert([x], [x, 4.0 - x])
+
+    assert len(archive) == 4
+    assert [e["parameters"] for e in archive.entries()] == [[0.0], [1.1], [3.0], [4.0]]
+
+
+def test_state_roundtrip(tmp_path):
+    archive = ParetoArchive(["f1", "f2"], [False, False], seed=1)
+    archive.insert([1.0, 2.0], [1.0, 2.0], origin=0)
+    archive.insert([2.0, 1.0], [2.0, 1.0], origin=1)
+
+    restored = ParetoArchive(["f1", "f2"], [False, False])
+    restored.set_state(archive.get_state())
+    assert front(restored) == front(archive)
+
+    archive.write(str(tmp_path / "pareto.json"))
+    assert "front" in (tmp_path / "pareto.json").read_text()
+    with pytest.raises(ValueError):
+        ParetoArchive(["f1", "f3"], [False, False]).set_state(archive.get_state())
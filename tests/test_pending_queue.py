@@ -0,0 +1,100 @@
+import sys
+from copy import deepcopy
+from pathlib import Path
+
+import pytest
+
+# Add src directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from core.comms import GlobalComms
+from core.runtime import GlobalRuntime
+from solution.PendingSolutionsQueue import PendingSolutionsQueue
+from solution.SolutionFusion import SolutionFusion
+
+INPUT_FILE = Path(__file__).parent.parent / "data" / "param_config.yaml"
+
+
+@pytest.fixture
+def queue(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    runtime = GlobalRuntime(input_file=str(INPUT_FILE))
+    return PendingSolutionsQueue(
+        runtime, GlobalComms(rank=0, size=1), "pending.queue", writeToFile=False
+    )
+
+
+def make_solution(queue, offset):
+    solution = SolutionFusion(
+        queue._runtime,
+        queue._comms,
+        deepcopy(SolutionFusion.get_template_data(queue._runtime, queue._comms)),
+    )
+    values = list(solution.get_parameters_values())
+    values[0] += offset
+    solution.set_parameters_values(values)
+    return solution
+
+
+def test_worker_gets_its_preferred_candidate(queue):
+    queue.put_solution(make_solution(queue, 0), -1.0, 0, preferred=2)
+    queue.put_solution(make_solution(queue, 1), -1.0, 1, preferred=3)
+
+    assert queue.count_preferring(3) == 1
+    position = queue.position_for(3, max_wait=60.0)
+    assert position == 1
+
+    _, agent_idx, _ = queue.get_solution_list(position=position)
+    assert agent_idx == 1
+    assert queue.count_preferring(3) == 0
+    assert queue.queue_size == 1
+
+
+def test_reserved_candidates_wait_for_their_worker(queue):
+    queue.put_solution(make_solution(queue, 0), -1.0, 0, preferred=2)
+
+    assert queue.position_for(5, max_wait=60.0) == -1
+    assert queue.position_for(5, max_wait=0.0) == 0
+
+
+def test_unreserved_candidates_go_to_any_worker(queue):
+    queue.put_solution(make_solution(queue, 0), -1.0, 0, preferred=2)
+    queue.put_solution(make_solution(queue, 1), -1.0, -1)
+
+    assert queue.position_for(5, max_wait=60.0) == 1
+
+
+def test_metadata_follows_front_removal(queue):
+    queue.put_solution(make_solution(queue, 0), -1.0, 0, preferred=2)
+    queue.put_solution(make_solution(queue, 1), -1.0, 1)
+
+    queue.get_solution_tuple()
+
+    assert queue.count_preferring(2) == 0
+    assert queue.position_for(2, max_wait=60.0) == 0
+
+
+def test_state_roundtrip_keeps_preferences(queue):
+    queue.put_solution(make_solution(queue, 0), -1.0, 0, preferred=2)
+    queue.put_solution(make_solution(queue, 1), -1.0, 1)
+    state = queue.get_state()
+
+    while queue.queue_size:
+        queue.get_solution_list()
+    queue.set_state(state)
+
+    assert queue.queue_size == 2
+    assert queue.count_preferring(2) == 1
+    assert queue.position_for(2, max_wait=60.0) == 0
+
+
+def test_deferred_candidate_moves_to_the_back(queue):
+    queue.put_solution(make_solution(queue, 0), -1.0, 0, preferred=2, generation=3)
+    queue.put_solution(make_solution(queue, 1), -1.0, 1, generation=1)
+
+    assert queue.parent_at(0) == (0, 3)
+    queue.defer(0)
+
+    assert queue.parent_at(0) == (1, 1)
+    assert queue.parent_at(1) == (0, -1)
+    assert queue.count_preferring(2) == 1
+    assert queue.position_for(2, max_wait=60.0) == 1
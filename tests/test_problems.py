@@ -0,0 +1,99 @@
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+# Add src directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from core.runtime import GlobalRuntime
+from data.NonSeparableData import NonSeparableData
+from problems.ProblemCristina import ProblemCristina
+from problems.ProblemNonSeparable import ProblemNonSeparable
+from solution.SolutionNonSeparable import SolutionNonSeparable
+
+INPUT = Path(__file__).parent.parent / "data" / "param_non_separable.yaml"
+
+
+def make_solutions(runtime, values):
+    solutions = []
+    for row in values:
+        data = NonSeparableData(runtime)
+        data.initialize(str(INPUT))
+        solution = SolutionNonSeparable(runtime, None, data)
+        solution.set_parameters_values(row)
+        solutions.append(solution)
+    return solutions
+
+
+def test_solve_batch_matches_solve():
+    runtime = GlobalRuntime()
+    problem = ProblemNonSeparable(runtime, None)
+    data = NonSeparableData(runtime)
+    data.initialize(str(INPUT))
+    values = np.random.default_rng(1).uniform(-2.0, 2.0, size=(16, data.num_params))
+    solutions = make_solutions(runtime, values)
+
+    for solution in solutions:
+        problem.solve(solution)
+
+    expected = [solution.value for solution in solutions]
+    # The solutions hold float32 values, like the buffers sent over MPI
+    stored = np.array([s.get_parameters_values() for s in solutions])
+    assert np.allclose(problem.solve_batch(stored), expected, rtol=1e-12)
+    assert problem.solve_batch(np.zeros((0, 3))).shape == (0,)
+    with pytest.raises(ValueError):
+        problem.solve_batch(np.zeros(3))
+
+
+def test_solve_many_uses_the_batch_when_available():
+    runtime = GlobalRuntime()
+    problem = ProblemNonSeparable(runtime, None)
+    data = NonSeparableData(runtime)
+    data.initialize(str(INPUT))
+    solutions = make_solutions(runtime, np.ones((3, data.num_params)))
+
+    assert problem.batch_capable
+    problem.solve_many(solutions)
+
+    assert [s.value for s in solutions] == [4.0 * (data.num_params - 1)] * 3
+
+
+def test_mock_and_external_problems_solve_one_at_a_time(tmp_path):
+    config = tmp_path / "config.ini"
+    config.write_text("[Mock]\nobjective = sphere\nseed = 3\n")
+    runtime = GlobalRuntime(config_file=str(config), mock=True)
+    comms = SimpleNamespace(rank=0)
+
+    assert not ProblemNonSeparable(runtime, comms).batch_capable
+    assert not ProblemCristina(runtime, comms).batch_capable
+
+    problem = ProblemNonSeparable(runtime, comms)
+    solutions = make_solutions(GlobalRuntime(), np.zeros((2, 4)))
+    problem.solve_many(solutions)
+    assert [s.value for s in solutions] == [1.0, 1.0]
+
+
+def test_mock_mode_without_a_mock_section_keeps_the_problem_defaults(tmp_path):
+    config = tmp_path / "config.ini"
+    config.write_text("[Bees]\nnEmployed = 2\n")
+    runtime = GlobalRuntime(config_file=str(config), mock=True)
+    comms = SimpleNamespace(rank=0)
+
+    # NONSEPARABLE still computes Rosenbrock's function
+    problem = ProblemNonSeparable(runtime, comms)
+    assert problem.batch_capable
+    solutions = make_solutions(GlobalRuntime(), np.ones((1, 4)))
+    problem.solve(solutions[0])
+    values = np.array([solutions[0].get_parameters_values()])
+    assert solutions[0].value == problem.solve_batch(values)[0]
+
+    # CRISTINA draws random values in [0, 1e6]
+    problem = ProblemCristina(runtime, comms)
+    values = []
+    for solution in make_solutions(GlobalRuntime(), np.zeros((50, 4))):
+        problem.solve(solution)
+        values.append(solution.value)
+    assert all(0.0 <= value <= 1e6 for value in values)
+    assert max(values) > 1.0
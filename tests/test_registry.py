@@ -0,0 +1,146 @@
+import importlib.util
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+import core.registry as registry_module
+from core.enums import ProblemType, SolutionType, SolverType
+from core.registry import (
+    PROBLEM_TYPE_REGISTRY,
+    SCHEMA_READER_REGISTRY,
+    SOLUTION_TYPE_REGISTRY,
+    SOLVER_REGISTRY,
+    LazyRegistry,
+    load_plugins,
+    resolve,
+    type_key,
+    type_name,
+)
+
+SRC = Path(__file__).parent.parent / "src"
+
+# Modules a run only imports when its solver or problem needs them
+LAZY_MODULES = (
+    "numpy",
+    "yaml",
+    "xml.etree.ElementTree",
+    "importlib.metadata",
+    "solvers.SolverDAB",
+    "solvers.SolverSA",
+    "runtime.EvaluationWorker",
+    "data.VMECData",
+    "data.VMECProcess",
+)
+
+
+def test_resolve_dotted_attribute():
+    assert resolve("os.path:join") is os.path.join
+    assert resolve("core.registry:LazyRegistry.reference") is LazyRegistry.reference
+
+
+def test_entries_are_imported_on_lookup():
+    registry = LazyRegistry({"join": "os.path:join", "pair": ("os:sep", "os:getcwd")})
+
+    assert "join" in registry
+    assert "missing" not in registry
+    assert registry.reference("join") == "os.path:join"
+    assert registry["join"] is os.path.join
+    assert registry["pair"] == (os.sep, os.getcwd)
+    assert registry.get("missing") is None
+
+
+def test_registries_cover_every_type():
+    assert set(SOLVER_REGISTRY) == set(SolverType) - {SolverType.NONE}
+    assert set(PROBLEM_TYPE_REGISTRY) == set(ProblemType) - {ProblemType.NONE}
+    assert set(SOLUTION_TYPE_REGISTRY) == set(SolutionType)
+    for problem_type in PROBLEM_TYPE_REGISTRY:
+        _, solution_cls = PROBLEM_TYPE_REGISTRY[problem_type]
+        assert hasattr(solution_cls, "get_template_data")
+    for reader in SCHEMA_READER_REGISTRY.values():
+        assert callable(reader)
+
+
+def test_register_rejects_conflicts():
+    registry = LazyRegistry({"join": "os.path:join"})
+
+    registry.register("join", "os.path:join")
+    registry.register("split", "os.path:split")
+    with pytest.raises(ValueError):
+        registry.register("join", "os.path:split")
+    assert registry["split"] is os.path.split
+
+
+def write_plugin(directory: Path, entry_points: str) -> None:
+    dist_info = directory / "fast_objectives-0.1.dist-info"
+    dist_info.mkdir()
+    (dist_info / "METADATA").write_text(
+        "Metadata-Version: 2.1\nName: fast-objectives\nVersion: 0.1\n"
+    )
+    (dist_info / "entry_points.txt").write_text(entry_points)
+
+
+def test_plugins_are_discovered_through_entry_points(tmp_path, monkeypatch):
+    write_plugin(
+        tmp_path,
+        "[dabmpi.problems]\n"
+        "SPHERE = problems.ProblemNonSeparable:ProblemNonSeparable\n"
+        "NOSOLUTION = problems.ProblemNonSeparable:ProblemNonSeparable\n"
+        "FUSION = problems.ProblemNonSeparable:ProblemNonSeparable\n"
+        "[dabmpi.solutions]\n"
+        "SPHERE = solution.SolutionNonSeparable:SolutionNonSeparable\n"
+        "FUSION = solution.SolutionNonSeparable:SolutionNonSeparable\n"
+        "[dabmpi.readers]\n"
+        "SPHERE = data.NonSeparableData:NonSeparableData.read_entries\n",
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    for name in ("PROBLEM_TYPE_REGISTRY", "SOLUTION_TYPE_REGISTRY"):
+        monkeypatch.setattr(
+            registry_module, name, getattr(registry_module, name).copy()
+        )
+    monkeypatch.setattr(
+        registry_module, "SCHEMA_READER_REGISTRY", SCHEMA_READER_REGISTRY.copy()
+    )
+
+    assert load_plugins() == ["SPHERE"]
+    assert load_plugins() == ["SPHERE"]
+
+    problem_cls, solution_cls = registry_module.PROBLEM_TYPE_REGISTRY["SPHERE"]
+    assert problem_cls.__name__ == "ProblemNonSeparable"
+    assert registry_module.SOLUTION_TYPE_REGISTRY["SPHERE"] is solution_cls
+    assert "SPHERE" in registry_module.SCHEMA_READER_REGISTRY
+    assert registry_module.PROBLEM_TYPE_REGISTRY.reference(ProblemType.FUSION)[0] == (
+        "problems.ProblemFusion:ProblemFusion"
+    )
+    assert "SPHERE" not in PROBLEM_TYPE_REGISTRY
+
+
+def test_type_names_and_keys():
+    assert type_name(ProblemType.FUSION) == "FUSION"
+    assert type_name("SPHERE") == "SPHERE"
+    assert type_key(ProblemType.NONSEPARABLE) == 2
+    assert type_key("SPHERE") == "SPHERE"
+
+
+@pytest.mark.skipif(
+    importlib.util.find_spec("mpi4py") is None, reason="mpi4py is not installed"
+)
+def test_cold_start_imports():
+    code = (
+        "import sys, disop\n"
+        f"loaded = [m for m in {LAZY_MODULES!r} if m in sys.modules]\n"
+        "assert not loaded, loaded\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=SRC,
+        env={**os.environ, "PYTHONPATH": str(SRC)},
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    assert result.returncode == 0, result.stderr
@@ -0,0 +1,116 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from core.runtime import GlobalRuntime
+from core.schema import broadcast_schema, clear_schemas, load_schema
+from data.VMECData import VMECData
+
+
+class CountingReader:
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, path):
+        self.calls += 1
+        return Path(path).read_text().split()
+
+
+class FakeComm:
+    """Single-process stand-in for an MPI communicator."""
+
+    def __init__(self, rank, root_payload=None):
+        self.rank = rank
+        self.root_payload = root_payload
+        self.sent = None
+
+    def Get_rank(self):
+        return self.rank
+
+    def bcast(self, payload, root=0):
+        if self.rank == root:
+            self.sent = payload
+            return payload
+        return self.root_payload
+
+
+@pytest.fixture(autouse=True)
+def fresh_registry():
+    clear_schemas()
+    yield
+    clear_schemas()
+
+
+def test_file_is_parsed_once_per_process(tmp_path):
+    path = tmp_path / "input.txt"
+    path.write_text("a b c")
+    reader = CountingReader()
+
+    first = load_schema(str(path), reader)
+    second = load_schema(str(path), reader)
+
+    assert first == ["a", "b", "c"]
+    assert second is first
+    assert reader.calls == 1
+
+
+def test_disk_cache_is_keyed_by_contents(tmp_path):
+    path = tmp_path / "input.txt"
+    cache = tmp_path / "cache"
+    path.write_text("a b")
+    reader = CountingReader()
+
+    load_schema(str(path), reader, str(cache))
+    clear_schemas()
+    assert load_schema(str(path), reader, str(cache)) == ["a", "b"]
+    assert reader.calls == 1
+
+    path.write_text("a b c")
+    clear_schemas()
+    assert load_schema(str(path), reader, str(cache)) == ["a", "b", "c"]
+    assert reader.calls == 2
+
+
+def test_broadcast_from_rank_zero(tmp_path):
+    path = tmp_path / "input.txt"
+    path.write_text("x y")
+    root = FakeComm(0)
+
+    assert broadcast_schema(root, str(path), CountingReader()) == ["x", "y"]
+
+    # Other ranks never read the file
+    clear_schemas()
+    path.unlink()
+    reader = CountingReader()
+    worker = FakeComm(1, root_payload=root.sent)
+    broadcast_schema(worker, str(path), reader)
+
+    assert load_schema(str(path), reader) == ["x", "y"]
+    assert reader.calls == 0
+
+
+def test_broadcast_raises_the_error_of_rank_zero(tmp_path):
+    missing = str(tmp_path / "missing.txt")
+    root = FakeComm(0)
+
+    with pytest.raises(RuntimeError, match="FileNotFoundError") as error:
+        broadcast_schema(root, missing, CountingReader())
+    assert isinstance(error.value.__cause__, FileNotFoundError)
+    with pytest.raises(RuntimeError, match="FileNotFoundError"):
+        broadcast_schema(FakeComm(1, root.sent), missing, CountingReader())
+
+
+def test_vmec_data_uses_the_parsed_input():
+    path = str(Path(__file__).parent.parent / "data" / "param_config.yaml")
+    runtime = GlobalRuntime()
+
+    first = VMECData(runtime, None)
+    first.initialize(path)
+    second = VMECData(runtime, None)
+    second.initialize(path)
+
+    assert first.num_parameters == second.num_parameters > 0
+    assert list(first.get_parameters_values()) == list(second.get_parameters_values())
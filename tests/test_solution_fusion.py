@@ -0,0 +1,63 @@
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add src directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from data.Parameter import Parameter, ParamType
+from solution.SolutionFusion import SolutionFusion
+
+
+def make_solution(am, params=()):
+    data = SimpleNamespace(
+        am=[SimpleNamespace(value=v, display=True) for v in am],
+        ai=[],
+        ac=[],
+        get_parameters=lambda: list(params),
+    )
+    solution = SolutionFusion.__new__(SolutionFusion)
+    solution._data = data
+    return solution
+
+
+def test_decreasing_pressure_is_feasible():
+    solution = make_solution([2100.0, -2100.0, 0.0])
+
+    assert solution.check_pressure_derivative()
+    assert solution.check_profiles()
+    assert solution.check_feasibility(physics=True) is None
+
+
+def test_increasing_pressure_is_rejected():
+    solution = make_solution([1.0, 0.5, -0.2])
+
+    assert not solution.check_pressure_derivative()
+    assert solution.check_feasibility(physics=True) == "pressure-derivative"
+    assert solution.check_feasibility(physics=False) is None
+
+
+def test_negative_pressure_is_rejected():
+    solution = make_solution([0.5, -1.0])
+
+    assert solution.check_pressure_derivative()
+    assert solution.check_feasibility(physics=True) == "profile"
+
+
+def test_hidden_coefficients_are_ignored():
+    solution = make_solution([1.0, -1.0])
+    solution._data.am.append(SimpleNamespace(value=100.0, display=False))
+
+    assert solution.check_pressure_derivative()
+
+
+def test_out_of_bounds_parameter_is_rejected():
+    param = Parameter("x", 0, ParamType.FLOAT, 0.5, 0.1, 0.0, 1.0)
+    solution = make_solution([1.0, -1.0], [param])
+
+    assert solution.check_feasibility() is None
+
+    param.value = 1.5
+    assert solution.check_feasibility() == "bounds"
+
+    param.value = float("nan")
+    assert solution.check_feasibility() == "non-finite"
@@ -0,0 +1,282 @@
+import sys
+import time
+from array import array
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+pytest.importorskip("mpi4py")
+from mpi4py import MPI
+
+# Add src directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from core.comms import GlobalComms
+from core.enums import CommModelType, ProblemType, SolutionType, Tags
+from core.matrix import Matrix
+from core.pareto import ParetoArchive
+from core.runtime import GlobalRuntime
+from dabmpi.bench import write_nonseparable_input
+from solution.SolutionNonSeparable import SolutionNonSeparable
+from solvers.SolverDAB import SolverDAB
+
+
+def make_solver(tmp_path, monkeypatch, algorithm="scheduling = steadyState\n"):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(SolutionNonSeparable, "_template_data", None)
+    write_nonseparable_input(tmp_path / "params.yaml", 4)
+    (tmp_path / "config.ini").write_text(
+        "[Bees]\nnEmployed = 3\nnOnlooker = 0\n[Algorithm]\n" + algorithm
+    )
+    runtime = GlobalRuntime(
+        config_file="config.ini",
+        input_file="params.yaml",
+        problem_type=ProblemType.NONSEPARABLE,
+        solution_type=SolutionType.NONSEPARABLE,
+        comm_model=CommModelType.DRIVERWORKER,
+        max_execution_time=1.0,
+        start_time=time.time(),
+    )
+    # Driver of two workers; initialize (MPI requests) is not needed here
+    return SolverDAB(runtime, GlobalComms(0, 3, None))
+
+
+def pending_bees(solver):
+    bees = []
+    while solver._pendingSolutions.queue_size > 0:
+        bees.append(solver._pendingSolutions.get_solution_list()[1])
+    return bees
+
+
+def test_each_result_earns_its_bee_one_candidate(tmp_path, monkeypatch):
+    solver = make_solver(tmp_path, monkeypatch)
+    buff = array("f", [0.5] * solver._numParams)
+
+    solver.processSolution(buff, 2.0, 2, [])
+    solver.processSolution(buff, 3.0, 0, [])
+    solver._idleWorkers = [1, 2]
+    solver.checkPendingSolutionsQueue()
+
+    assert pending_bees(solver) == [2, 0]
+    assert not solver._readyBees
+
+    # Results of scouts give the turn to the employed bees in round robin
+    solver.processSolution(buff, 4.0, -1, [])
+    solver._idleWorkers = [1]
+    solver.checkPendingSolutionsQueue()
+    assert pending_bees(solver) == [0]
+
+
+def test_exhausted_source_is_abandoned(tmp_path, monkeypatch):
+    solver = make_solver(tmp_path, monkeypatch)
+    bee = solver._bees[1]
+    for _ in range(solver._iterAbandoned + 1):
+        bee.increase_iterations()
+
+    solver._readyBees.append(1)
+    solver.checkPendingSolutionsQueue()
+
+    assert pending_bees(solver) == [1]
+    assert bee.iterations_since_update == 0
+
+
+def test_unknown_scheduling_is_rejected(tmp_path, monkeypatch):
+    with pytest.raises(ValueError):
+        make_solver(tmp_path, monkeypatch, "scheduling = eager\n")
+
+
+@pytest.mark.parametrize("mode", ["drop", "defer"])
+def test_candidates_of_replaced_sources_are_stale(tmp_path, monkeypatch, mode):
+    solver = make_solver(tmp_path, monkeypatch, f"staleCandidates = {mode}\n")
+    solver._pendingSize = 3
+    # One candidate per employed bee, from their initial food sources
+    solver.checkPendingSolutionsQueue()
+    # Bee 1 moves to a better food source
+    buff = array("f", [0.5] * solver._numParams)
+    solver.processSolution(buff, 2.0, 1, [])
+
+    beeIdx, _, _ = solver.next_candidate()
+    assert beeIdx[0] == 0
+    beeIdx, _, _ = solver.next_candidate()
+    assert beeIdx[0] == 2
+    failures = solver.get_status()["failures"]
+    if mode == "drop":
+        assert failures["stale-dropped"] == 1
+        assert pending_bees(solver) == []
+    else:
+        assert failures["stale-deferred"] == 1
+        assert pending_bees(solver) == [1]
+
+
+def test_adaptive_control_follows_operator_success(tmp_path, monkeypatch):
+    solver = make_solver(
+        tmp_path, monkeypatch, "[Adaptive]\nenabled = True\nwindow = 2\n"
+    )
+    assert solver._bandit.selectable == ["employed"]
+    assert solver.pass_producers() == [0, 1, 2]
+    change = solver._probEmployedChange
+
+    # A window of improvements widens the steps, one of failures narrows them
+    solver.reward_operator("employed", True)
+    solver.reward_operator("employed", True)
+    assert solver._probEmployedChange < change
+    assert all(
+        bee._probEmployedChange == solver._probEmployedChange for bee in solver._bees
+    )
+    solver.reward_operator("employed", False)
+    solver.reward_operator("employed", False)
+    assert solver._probEmployedChange == pytest.approx(change)
+
+    # Candidates carry their operator through the pending queue
+    solver._pendingSize = 3
+    solver.checkPendingSolutionsQueue()
+    _, _, operator = solver.next_candidate()
+    assert operator == "employed"
+    assert solver.get_status()["operators"]["results"]["employed"] == 4
+
+
+def test_adaptive_mutation_strength_recovers_from_its_bound(tmp_path, monkeypatch):
+    solver = make_solver(
+        tmp_path, monkeypatch, "[Adaptive]\nenabled = True\nwindow = 1\n"
+    )
+
+    # Every parameter changes once the change probability reaches 1
+    for _ in range(20):
+        solver.reward_operator("employed", True)
+    assert solver._probEmployedChange == 0.0
+
+    # Failing windows narrow the steps again, one window at a time
+    previous = solver._probEmployedChange
+    for _ in range(8):
+        solver.reward_operator("employed", False)
+        assert solver._probEmployedChange > previous
+        previous = solver._probEmployedChange
+    assert int(solver._bees[0]._probEmployedChange) >= 2
+
+
+def test_matrix_reinforces_the_bins_of_a_solution(tmp_path, monkeypatch):
+    solver = make_solver(tmp_path, monkeypatch)
+    solver._probMatrix = Matrix(solver._lattice.max_bins, solver._lattice.size, 1.0)
+    solution = solver._new_solution()
+    # Bounds are [-1, 1] with a gap of 0.01: 0.5 is bin 150
+    solution.set_parameters_values(array("f", [0.5] * solver._numParams))
+
+    solver.reinforce_matrix(solution, 0.5, 5.0)
+    solver.reinforce_matrix(solution, 0.5, 5.0)
+
+    weights = solver._probMatrix.array
+    assert weights.shape == (solver._numParams, 201)
+    assert np.all(weights[:, 150] == 10.5)
+    assert weights.sum() == weights.size + solver._numParams * 9.5
+
+
+def test_cache_hits_reach_the_pareto_archive(tmp_path, monkeypatch):
+    solver = make_solver(tmp_path, monkeypatch, "[Cache]\nenabled = True\n")
+    solver._problem = SimpleNamespace(objective_names=("beta", "bgradb"))
+    solver._pareto = ParetoArchive(["beta", "bgradb"], [True, False])
+    buff = array("f", [0.5] * solver._numParams)
+
+    solver.store_in_cache(buff, 2.0, -1, array("d", [0.02, 3.5]))
+    _, entry = solver.cache_lookup(buff)
+
+    assert solver.cached_objectives(entry) == [0.02, 3.5]
+    solver._problem.objective_names = ("beta", "bootstrap")
+    assert solver.cached_objectives(entry) is None
+
+
+class FakeRequest:
+    def __init__(self):
+        self.cancelled = False
+
+    def Cancel(self):
+        self.cancelled = True
+
+
+class FakeComm:
+    """Records the nonblocking sends of the driver."""
+
+    def __init__(self):
+        self.sent = []
+
+    def Isend(self, buff, dest, tag):
+        self.sent.append((dest, tag))
+        return FakeRequest()
+
+    def Irecv(self, buff, source, tag):
+        return FakeRequest()
+
+
+def test_lost_worker_candidate_is_reissued(tmp_path, monkeypatch):
+    solver = make_solver(tmp_path, monkeypatch)
+    buff = array("f", [0.5] * solver._numParams)
+    solver._inFlight[1] = (time.time(), array("i", [2]), buff, "employed")
+
+    solver.release_worker(1, "communication error")
+
+    assert solver.lost_workers == {1}
+    assert solver._pendingSolutions.get_solution_list()[1] == 2
+    status = solver.get_status()
+    assert (status["workers"]["busy"], status["workers"]["lost"]) == (0, 1)
+    assert status["failures"]["reissued"] == 1
+
+
+def test_early_work_request_keeps_the_result_request(tmp_path, monkeypatch):
+    solver = make_solver(tmp_path, monkeypatch)
+    comm = FakeComm()
+    solver._comms = GlobalComms(0, 3, comm)
+    solver._readyBees.append(1)
+    solver.checkPendingSolutionsQueue()
+    # Worker 1 asked for work before the driver received its result
+    pending = FakeRequest()
+    solver._requestSolution[1] = pending
+    solver._idleWorkers = [1, 2]
+
+    solver.dispatch_candidates()
+
+    assert solver._requestSolution[1] is pending
+    assert solver._idleWorkers == [1]
+    assert list(solver._inFlight) == [2]
+    assert {dest for dest, _ in comm.sent} == {2}
+
+
+def test_slow_worker_is_reissued_but_not_lost(tmp_path, monkeypatch):
+    solver = make_solver(tmp_path, monkeypatch, "evaluationTimeout = 10\n")
+    buff = array("f", [0.5] * solver._numParams)
+    solver._inFlight[1] = (time.time() - 20.0, array("i", [0]), buff, "employed")
+    solver._inFlight[2] = (time.time(), array("i", [1]), buff, "employed")
+
+    solver.check_workers()
+
+    assert solver.lost_workers == set()
+    assert set(solver._inFlight) == {2}
+    assert pending_bees(solver) == [0]
+    # Its late result is received and discarded, then it gets work again
+    assert solver.discard_result(1)
+    assert not solver.discard_result(1)
+    assert solver.get_status()["failures"]["late-result"] == 1
+
+
+def test_busy_workers_are_terminated_at_the_deadline(tmp_path, monkeypatch):
+    solver = make_solver(tmp_path, monkeypatch, "deadlineGrace = 5\n")
+    comm = FakeComm()
+    solver._comms = GlobalComms(0, 3, comm)
+    requests = [MPI.REQUEST_NULL, FakeRequest(), FakeRequest()]
+    solver._requestsEnd = list(requests)
+    # Worker 2 is idle and already terminated, worker 1 is still evaluating
+    solver._terminated.add(2)
+    buff = array("f", [0.5] * solver._numParams)
+    solver._inFlight[1] = (time.time(), array("i", [0]), buff, "employed")
+    deadline = solver._runtime.max_execution_time
+
+    solver.stop_at_deadline(deadline)
+    assert comm.sent == [(1, Tags.TERMINATE)]
+    assert solver.discard_result(1)
+
+    solver.stop_at_deadline(deadline + 4.0)
+    assert solver.unfinished_workers == set()
+    solver.stop_at_deadline(deadline + 5.0)
+    assert solver.unfinished_workers == {1, 2}
+    assert solver.lost_workers == set()
+    assert requests[1].cancelled and requests[2].cancelled
+    assert all(request == MPI.REQUEST_NULL for request in solver._requestsEnd)
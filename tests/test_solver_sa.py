@@ -0,0 +1,158 @@
+import random
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("mpi4py")
+
+# Add src directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from core.comms import GlobalComms
+from core.enums import CommModelType, ProblemType, SolutionType
+from core.runtime import GlobalRuntime
+from dabmpi.bench import write_nonseparable_input
+from data.Parameter import Parameter, ParamType
+from solution.SolutionNonSeparable import SolutionNonSeparable
+from solvers.SolverSA import (
+    SolverSA,
+    cooling_factor,
+    exchange_levels,
+    perturb,
+    temperature_ladder,
+)
+
+
+class FakeComm:
+    """Single-rank stand-in for the collectives used by ALL2ALL runs."""
+
+    def Get_rank(self):
+        return 0
+
+    def bcast(self, payload, root=0):
+        return payload
+
+    def allgather(self, payload):
+        return [payload]
+
+    def gather(self, payload, root=0):
+        return [payload]
+
+
+def test_temperature_ladder_is_geometric():
+    ladder = temperature_ladder(4, 0.01, 10.0)
+
+    assert ladder[0] == pytest.approx(0.01)
+    assert ladder[-1] == pytest.approx(10.0)
+    assert ladder[2] / ladder[1] == pytest.approx(ladder[1] / ladder[0])
+    assert temperature_ladder(1, 0.01, 10.0) == [0.01]
+
+
+def test_cooling_schedules():
+    assert cooling_factor("constant", 0.7, 0.1) == 1.0
+    assert cooling_factor("linear", 0.5, 0.1) == pytest.approx(0.55)
+    assert cooling_factor("geometric", 1.0, 0.1) == pytest.approx(0.1)
+    assert cooling_factor("geometric", 2.0, 0.1) == pytest.approx(0.1)
+
+
+def test_better_states_move_to_colder_levels():
+    rng = random.Random(0)
+    # Chain 1, at the hot level 1, found a lower energy than chain 0
+    replicas = [(0, 0, 5.0), (1, 1, 1.0), (2, 2, 3.0), (3, 3, float("inf"))]
+
+    levels, attempted, accepted = exchange_levels(
+        replicas, [1.0, 2.0, 4.0, 8.0], 0, rng
+    )
+    assert levels == {0: 1, 1: 0, 2: 2, 3: 3}
+    assert (attempted, accepted) == (1, 1)
+
+    # Odd pairs: (1, 2) is tried, (3, 4) does not exist
+    levels, attempted, _ = exchange_levels(replicas, [1.0, 2.0, 4.0, 8.0], 1, rng)
+    assert attempted == 1
+    assert levels[0] == 0 and levels[3] == 3
+
+
+def test_perturb_respects_bounds_and_gaps():
+    rng = random.Random(3)
+    params = [
+        Parameter("x", 0, ParamType.FLOAT, 0.5, 0.25, 0.0, 1.0),
+        Parameter("n", 1, ParamType.INT, 3, 1, 0, 5),
+        Parameter("flag", 2, ParamType.BOOL, True, None, False, True),
+        Parameter("name", 3, ParamType.STRING, "a", None, "a", "a"),
+    ]
+    for _ in range(200):
+        assert perturb(params, 0.5, 0.5, rng) >= 0
+        assert 0.0 <= params[0].value <= 1.0
+        assert params[0].value / 0.25 == round(params[0].value / 0.25)
+        assert 0 <= params[1].value <= 5
+        assert params[3].value == "a"
+
+
+def test_perturb_snaps_half_bounded_values_to_their_grid():
+    rng = random.Random(5)
+    param = Parameter("y", 0, ParamType.FLOAT, 0.3, 0.5, 0.3, float("inf"))
+    for _ in range(100):
+        perturb([param], 0.5, 0.5, rng)
+        assert param.value >= 0.3
+        assert (param.value - 0.3) / 0.5 == pytest.approx(
+            round((param.value - 0.3) / 0.5)
+        )
+
+
+def test_lost_worker_chain_is_ready_again(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(SolutionNonSeparable, "_template_data", None)
+    write_nonseparable_input(tmp_path / "params.yaml", 4)
+    (tmp_path / "config.ini").write_text("[SA]\nseed = 7\n")
+    runtime = GlobalRuntime(
+        config_file="config.ini",
+        input_file="params.yaml",
+        problem_type=ProblemType.NONSEPARABLE,
+        solution_type=SolutionType.NONSEPARABLE,
+        comm_model=CommModelType.DRIVERWORKER,
+        max_execution_time=1.0,
+        start_time=time.time(),
+    )
+    # Driver of two workers, one chain each
+    solver = SolverSA(runtime, GlobalComms(0, 3, None))
+    replica = solver._ready.popleft()
+    replica.in_flight = True
+    solver._inFlight[2] = (time.time(), replica, solver.propose(replica))
+
+    solver.release_worker(2, "communication error")
+
+    assert solver.lost_workers == {2}
+    assert solver._ready[0] is replica and not replica.in_flight
+    assert solver.get_status()["failures"]["reissued"] == 1
+
+
+def test_all2all_run_improves_the_start(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(SolutionNonSeparable, "_template_data", None)
+    write_nonseparable_input(tmp_path / "params.yaml", 4)
+    (tmp_path / "config.ini").write_text(
+        "[SA]\nchains = 4\nseed = 7\nexchangeInterval = 2\n"
+        "[Algorithm]\ndrainMargin = 0\n"
+    )
+    runtime = GlobalRuntime(
+        config_file="config.ini",
+        input_file="params.yaml",
+        problem_type=ProblemType.NONSEPARABLE,
+        solution_type=SolutionType.NONSEPARABLE,
+        comm_model=CommModelType.ALL2ALL,
+        max_execution_time=1.0,
+        start_time=time.time(),
+    )
+
+    solver = SolverSA(runtime, GlobalComms(0, 1, FakeComm()))
+    solver.initialize()
+    solver.solve()
+    solver.finish()
+
+    status = solver.get_status(finished=True)
+    assert status["evaluations_total"] > 100
+    # The input file starts at the origin, where Rosenbrock is 3 for 4 parameters
+    assert 0.0 < status["best_value"] < 3.0
+    assert set(status["chains"]) == {"level0", "level1", "level2", "level3"}
+    assert (tmp_path / "finished.queue").exists()
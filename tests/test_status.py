@@ -0,0 +1,53 @@
+import json
+import sys
+from pathlib import Path
+
+# Add src directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from core.status import StatusWriter, format_prometheus, write_atomic
+
+STATUS = {
+    "finished": False,
+    "evaluations_total": 12,
+    "worker_utilization": 0.75,
+    "best_value": None,
+    "best_trajectory": [(1.0, 0.5)],
+    "queues": {"pending": 3},
+    "failures": {"rejected-bounds": 2},
+}
+
+
+def test_prometheus_format():
+    text = format_prometheus(STATUS)
+
+    assert "dabmpi_finished 0\n" in text
+    assert "dabmpi_evaluations_total 12.0\n" in text
+    assert "dabmpi_worker_utilization 0.75\n" in text
+    assert 'dabmpi_queues{queue="pending"} 3.0\n' in text
+    assert 'dabmpi_failures{reason="rejected-bounds"} 2.0\n' in text
+    assert "best_value" not in text
+    assert "best_trajectory" not in text
+
+
+def test_write_atomic_replaces_file(tmp_path):
+    path = tmp_path / "status" / "status.json"
+
+    write_atomic(str(path), "first")
+    write_atomic(str(path), "second")
+
+    assert path.read_text() == "second"
+    assert [p.name for p in path.parent.iterdir()] == ["status.json"]
+
+
+def test_writer_writes_latest_snapshot(tmp_path):
+    path = tmp_path / "status.json"
+    prometheus = tmp_path / "dabmpi.prom"
+    writer = StatusWriter(str(path), str(prometheus))
+
+    for i in range(10):
+        writer.submit({**STATUS, "evaluations_total": i})
+    writer.close()
+
+    assert json.loads(path.read_text())["evaluations_total"] == 9
+    assert "dabmpi_evaluations_total 9.0" in prometheus.read_text()
+    assert 1 <= writer.written <= 10
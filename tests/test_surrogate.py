@@ -0,0 +1,66 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Add src directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from core.surrogate import RandomFeaturesRidge
+
+
+def sphere(x):
+    return np.sum((np.atleast_2d(x) - 2.0) ** 2, axis=1)
+
+
+def test_predict_shape_single_and_batch():
+    model = RandomFeaturesRidge([0.0, 0.0], [1.0, 1.0], n_features=16, seed=1)
+
+    assert model.predict([0.5, 0.5]).shape == (1,)
+    assert model.predict(np.zeros((5, 2))).shape == (5,)
+
+
+def test_update_counts_samples():
+    model = RandomFeaturesRidge([0.0], [1.0], n_features=8, seed=1)
+
+    model.update([0.2], 1.0)
+    model.update(np.array([[0.3], [0.4]]), [2.0, 3.0])
+
+    assert model.n_samples == 3
+
+
+def test_learns_ranking_of_smooth_function():
+    rng = np.random.default_rng(0)
+    lower = [-5.0, -5.0, -5.0]
+    upper = [5.0, 5.0, 5.0]
+    model = RandomFeaturesRidge(lower, upper, n_features=300, seed=3)
+
+    train = rng.uniform(-5.0, 5.0, size=(400, 3))
+    for row in train:
+        model.update(row, sphere(row)[0])
+
+    good = np.array([[2.0, 2.0, 2.0], [1.5, 2.5, 2.0]])
+    bad = np.array([[-4.5, -4.5, -4.5], [-4.0, 4.5, -4.0]])
+
+    assert model.predict(good).max() < model.predict(bad).min()
+
+
+def test_unbounded_inputs_are_accepted():
+    model = RandomFeaturesRidge([-np.inf], [np.inf], n_features=8, seed=1)
+    model.update([1.0], 1.0)
+
+    assert np.isfinite(model.predict([1.0])[0])
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{"n_features": 0}, {"length_scale": 0.0}],
+)
+def test_invalid_arguments(kwargs):
+    with pytest.raises(ValueError):
+        RandomFeaturesRidge([0.0], [1.0], **kwargs)
+
+
+def test_mismatched_bounds():
+    with pytest.raises(ValueError):
+        RandomFeaturesRidge([0.0, 0.0], [1.0])
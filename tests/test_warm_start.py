@@ -0,0 +1,75 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from core.warm_start import WarmStartArchive
+
+
+def make_wout(tmp_path, text):
+    path = tmp_path / "wout_tj1.txt"
+    path.write_text(text)
+    return str(path)
+
+
+def test_empty_archive_returns_none(tmp_path):
+    archive = WarmStartArchive(str(tmp_path / "ws"), [0.0], [1.0])
+
+    assert archive.nearest([0.5]) is None
+    assert archive.misses == 1
+
+
+def test_nearest_uses_normalized_distance(tmp_path):
+    archive = WarmStartArchive(str(tmp_path / "ws"), [0.0, 0.0], [1.0, 1000.0])
+
+    archive.add([0.0, 500.0], make_wout(tmp_path, "a"))
+    archive.add([0.5, 0.0], make_wout(tmp_path, "b"))
+
+    # 100 units on the wide parameter are closer than 0.4 on the narrow one
+    assert Path(archive.nearest([0.1, 400.0])).read_text() == "a"
+    assert Path(archive.nearest([0.45, 50.0])).read_text() == "b"
+
+
+def test_least_recently_used_entry_is_evicted(tmp_path):
+    archive = WarmStartArchive(str(tmp_path / "ws"), [0.0], [10.0], capacity=2)
+
+    archive.add([1.0], make_wout(tmp_path, "one"))
+    archive.add([5.0], make_wout(tmp_path, "five"))
+    archive.nearest([1.0])
+    archive.add([9.0], make_wout(tmp_path, "nine"))
+
+    assert len(archive) == 2
+    assert Path(archive.nearest([5.0])).read_text() == "one"
+    assert len(list((tmp_path / "ws").iterdir())) == 2
+
+
+def test_same_configuration_replaces_entry(tmp_path):
+    archive = WarmStartArchive(str(tmp_path / "ws"), [0.0], [1.0])
+
+    archive.add([0.5], make_wout(tmp_path, "old"))
+    archive.add([0.5], make_wout(tmp_path, "new"))
+
+    assert len(archive) == 1
+    assert Path(archive.nearest([0.5])).read_text() == "new"
+
+
+def test_max_distance_forces_cold_start(tmp_path):
+    archive = WarmStartArchive(str(tmp_path / "ws"), [0.0], [1.0], max_distance=0.1)
+    archive.add([0.0], make_wout(tmp_path, "a"))
+
+    assert archive.nearest([0.05]) is not None
+    assert archive.nearest([0.5]) is None
+
+
+def test_missing_source_is_ignored(tmp_path):
+    archive = WarmStartArchive(str(tmp_path / "ws"), [0.0], [1.0])
+    archive.add([0.5], str(tmp_path / "missing"))
+
+    assert len(archive) == 0
+
+
+def test_invalid_capacity(tmp_path):
+    with pytest.raises(ValueError):
+        WarmStartArchive(str(tmp_path / "ws"), [0.0], [1.0], capacity=0)